@@ -4,15 +4,94 @@ Handles application settings, paths, and configuration management
 """
 
 import os
-import json
+import sys
+import copy
+import hashlib
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+try:
+    from PyQt6.QtCore import QSize
+except ImportError:  # Config is also used by non-UI scripts
+    QSize = None
+
+
+# Sentinel for missing keys so lookups need a single dict probe
+_MISSING = object()
+
+# Values compared against the stored one to skip no-op writes; containers are always
+# written, since a list or dict from get() may have been modified in place
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+# Cached derived values and the config key paths they are built from
+_CACHED_VALUE_SOURCES = {
+    "icon_size": ("ui.icon_size",),
+    "window_size": ("ui.window_width", "ui.window_height"),
+    "resize_dimensions": ("image_processing.resize_width", "image_processing.resize_height"),
+    "supported_formats": ("image_processing.supported_formats",),
+    "export_formats": ("analytics.export_formats",),
+}
+
+
+def _intern_strings(obj: Any) -> Any:
+    """Intern string keys and leaves in place so repeated comparisons hit the identity fast path"""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        items = [(sys.intern(k) if isinstance(k, str) else k, _intern_strings(v)) for k, v in obj.items()]
+        obj.clear()
+        obj.update(items)
+    elif isinstance(obj, list):
+        obj[:] = [_intern_strings(v) for v in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot notation key path once and reuse the resulting tuple"""
+    return tuple(key_path.split('.'))
 
 
 class AppConfig:
     """Application configuration manager"""
     
+    # Parsed config files keyed by path, with the (mtime, size) they were read at
+    _config_cache: ClassVar[Dict[Path, Tuple[float, int, Dict[str, Any]]]] = {}
+    
+    # Directories already known to exist in this process
+    _dirs_ready: ClassVar[Set[Path]] = set()
+    
+    # Shared process-wide instance
+    _instance: ClassVar[Optional["AppConfig"]] = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+        
     def __init__(self):
+        # AppConfig() returns the shared instance; only the first call loads it
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        
         self.app_name = "AI Breast Cancer Detection"
         self.version = "1.0.0"
         
@@ -30,13 +109,21 @@ class AppConfig:
         # Configuration file path
         self.config_file = self.data_dir / "config.json"
         
+        # Digest of the last content written, to skip identical rewrites
+        self._saved_digest = None
+        
         # Default configuration
         self.default_config = {
             "model": {
                 "path": str(self.models_dir / "yolov5_model.pt"),
                 "confidence_threshold": 0.5,
                 "iou_threshold": 0.45,
-                "device": "cpu"
+                "max_detections": 300,
+                "device": "auto",
+                "export_optimized": False,  # exporting needs tensorrt/openvino/onnxruntime installed
+                "cpu_backend": "openvino",
+                "warmup": True,
+                "torch_compile": False
             },
             "database": {
                 "path": str(self.database_dir / "patients.db"),
@@ -65,8 +152,23 @@ class AppConfig:
             }
         }
         
+        _intern_strings(self.default_config)
+        
         # Load or create configuration
-        self.config = self._load_config()
+        self.config = _intern_strings(self._load_config())
+        self._bind_sections()
+        
+    def _bind_sections(self):
+        """Bind top-level config sections so hot accessors skip the dot-path walk"""
+        def section(name: str) -> Dict[str, Any]:
+            value = self.config.get(name)
+            return value if isinstance(value, dict) else {}
+            
+        self._model_cfg = section("model")
+        self._database_cfg = section("database")
+        self._ui_cfg = section("ui")
+        self._image_cfg = section("image_processing")
+        self._analytics_cfg = section("analytics")
         
     def _create_directories(self):
         """Create necessary application directories"""
@@ -79,58 +181,123 @@ class AppConfig:
         ]
         
         for directory in directories:
-            directory.mkdir(exist_ok=True)
+            if directory in AppConfig._dirs_ready:
+                continue
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            AppConfig._dirs_ready.add(directory)
             
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                config = self._read_config_file()
                 # Merge with defaults to ensure all keys exist
                 return self._merge_config(self.default_config, config)
             except Exception as e:
                 print(f"Error loading config: {e}")
-                return self.default_config
+                return copy.deepcopy(self.default_config)
         else:
-            # Create default config file
-            self._save_config(self.default_config)
-            return self.default_config
+            # Defaults are written later by the caller (see save()) so startup isn't blocked on disk I/O
+            return copy.deepcopy(self.default_config)
+            
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Parse the config file, reusing the cached parse if it is unchanged on disk"""
+        st = self.config_file.stat()
+        cached = AppConfig._config_cache.get(self.config_file)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            return copy.deepcopy(cached[2])
             
+        with open(self.config_file, 'rb') as f:
+            config = _json_loads(f.read())
+        self._cache_config_file(config)
+        return config
+        
+    def _cache_config_file(self, config: Dict[str, Any]):
+        """Remember the parsed contents of the config file at its current mtime/size"""
+        st = self.config_file.stat()
+        AppConfig._config_cache[self.config_file] = (st.st_mtime, st.st_size, copy.deepcopy(config))
+        
     def _save_config(self, config: Dict[str, Any]):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            data = _json_dumps(config)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._saved_digest and self.config_file.exists():
+                return
+                
+            # Write to a temporary file and swap it in so a crash never leaves a truncated config
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_digest = digest
+            self._cache_config_file(config)
         except Exception as e:
             print(f"Error saving config: {e}")
             
     def _merge_config(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge user config with defaults"""
-        result = default.copy()
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        """Merge user config with defaults"""
+        result = copy.deepcopy(default)
+        self._overlay(result, user)
         return result
         
+    @staticmethod
+    def _overlay(target: Dict[str, Any], user: Dict[str, Any]):
+        """Write user leaves into target in place, descending only where both sides are dicts"""
+        pending = [(target, user)]
+        while pending:
+            dst, src = pending.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    pending.append((current, value))
+                else:
+                    dst[key] = value
+        
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot notation path"""
-        keys = key_path.split('.')
         value = self.config
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
+        for key in _split_path(key_path):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key, _MISSING)
+            if value is _MISSING:
                 return default
                 
         return value
         
-    def set(self, key_path: str, value: Any):
-        """Set configuration value by dot notation path"""
-        keys = key_path.split('.')
+    def set(self, key_path: str, value: Any, flush: bool = True):
+        """
+        Set configuration value by dot notation path
+        
+        Args:
+            key_path: Dot notation path of the value to set
+            value: New value
+            flush: Write the config file now; pass False to batch writes and call save() later
+        """
+        if self._assign(key_path, value) and flush:
+            self.save()
+            
+    def set_many(self, items: Dict[str, Any]):
+        """Set several configuration values by dot notation path with a single file write"""
+        changed = False
+        for key_path, value in items.items():
+            changed = self._assign(key_path, value) or changed
+            
+        if changed:
+            self.save()
+        
+    def save(self):
+        """Write the current configuration to file"""
+        self._save_config(self.config)
+        
+    def _assign(self, key_path: str, value: Any) -> bool:
+        """Set configuration value in memory without writing the file, returning whether it changed"""
+        keys = _split_path(key_path)
         config = self.config
         
         for key in keys[:-1]:
@@ -138,79 +305,141 @@ class AppConfig:
                 config[key] = {}
             config = config[key]
             
+        current = config.get(keys[-1], _MISSING)
+        if type(current) is type(value) and isinstance(value, _SCALAR_TYPES) and current == value:
+            return False
+            
         config[keys[-1]] = value
-        self._save_config(self.config)
+        
+        # A write may have created or replaced a whole section dict
+        self._bind_sections()
+        self._invalidate_cached_values(key_path)
+        return True
+        
+    def _invalidate_cached_values(self, key_path: str):
+        """Drop cached derived values that depend on the written key path"""
+        for name, sources in _CACHED_VALUE_SOURCES.items():
+            for source in sources:
+                if source == key_path or source.startswith(key_path + '.'):
+                    self.__dict__.pop(name, None)
+                    break
         
     def get_model_path(self) -> str:
         """Get the path to the YOLOv5 model"""
-        return self.get("model.path", str(self.models_dir / "yolov5_model.pt"))
+        return self._model_cfg.get("path", str(self.models_dir / "yolov5_model.pt"))
         
     def get_confidence_threshold(self) -> float:
         """Get the confidence threshold for detection"""
-        return self.get("model.confidence_threshold", 0.5)
+        return self._model_cfg.get("confidence_threshold", 0.5)
         
     def get_database_path(self) -> str:
         """Get the path to the database file"""
-        return self.get("database.path", str(self.database_dir / "patients.db"))
+        return self._database_cfg.get("path", str(self.database_dir / "patients.db"))
+        
+    @functools.cached_property
+    def icon_size(self):
+        """Icon size for UI elements, built once per configuration value"""
+        if QSize is None:
+            raise ImportError("PyQt6 is required to build UI icon sizes")
+        size = self._ui_cfg.get("icon_size", 24)
+        return QSize(size, size)
         
     def get_icon_size(self):
         """Get the icon size for UI elements"""
-        from PyQt6.QtCore import QSize
-        size = self.get("ui.icon_size", 24)
-        return QSize(size, size)
+        return self.icon_size
+        
+    @functools.cached_property
+    def supported_formats(self) -> list:
+        """Supported image formats"""
+        return self._image_cfg.get("supported_formats", [".png", ".jpg", ".jpeg"])
         
     def get_supported_formats(self) -> list:
         """Get list of supported image formats"""
-        return self.get("image_processing.supported_formats", [".png", ".jpg", ".jpeg"])
+        return self.supported_formats
         
     def get_max_image_size(self) -> int:
         """Get maximum allowed image size in MB"""
-        return self.get("image_processing.max_image_size_mb", 50)
+        return self._image_cfg.get("max_image_size_mb", 50)
+        
+    @functools.cached_property
+    def resize_dimensions(self) -> tuple:
+        """Image resize dimensions"""
+        width = self._image_cfg.get("resize_width", 1024)
+        height = self._image_cfg.get("resize_height", 1024)
+        return (width, height)
         
     def get_resize_dimensions(self) -> tuple:
         """Get image resize dimensions"""
-        width = self.get("image_processing.resize_width", 1024)
-        height = self.get("image_processing.resize_height", 1024)
-        return (width, height)
+        return self.resize_dimensions
         
     def is_quality_enhancement_enabled(self) -> bool:
         """Check if image quality enhancement is enabled"""
-        return self.get("image_processing.quality_enhancement", True)
+        return self._image_cfg.get("quality_enhancement", True)
+        
+    @functools.cached_property
+    def export_formats(self) -> list:
+        """Supported export formats"""
+        return self._analytics_cfg.get("export_formats", ["pdf", "excel", "csv"])
         
     def get_export_formats(self) -> list:
         """Get list of supported export formats"""
-        return self.get("analytics.export_formats", ["pdf", "excel", "csv"])
+        return self.export_formats
         
     def get_history_retention_days(self) -> int:
         """Get history retention period in days"""
-        return self.get("analytics.history_retention_days", 365)
+        return self._analytics_cfg.get("history_retention_days", 365)
         
     def get_chart_theme(self) -> str:
         """Get the chart theme for analytics"""
-        return self.get("analytics.chart_theme", "medical")
+        return self._analytics_cfg.get("chart_theme", "medical")
+        
+    @functools.cached_property
+    def window_size(self) -> tuple:
+        """Default window size"""
+        width = self._ui_cfg.get("window_width", 1400)
+        height = self._ui_cfg.get("window_height", 900)
+        return (width, height)
         
     def get_window_size(self) -> tuple:
         """Get default window size"""
-        width = self.get("ui.window_width", 1400)
-        height = self.get("ui.window_height", 900)
-        return (width, height)
+        return self.window_size
         
     def get_device(self) -> str:
-        """Get the device for model inference"""
-        return self.get("model.device", "cpu")
+        """Get the device for model inference ("auto" picks CUDA when available)"""
+        return self._model_cfg.get("device", "auto")
         
     def get_iou_threshold(self) -> float:
         """Get the IoU threshold for non-maximum suppression"""
-        return self.get("model.iou_threshold", 0.45)
+        return self._model_cfg.get("iou_threshold", 0.45)
+        
+    def get_max_detections(self) -> int:
+        """Get the maximum number of detections kept per image"""
+        return self._model_cfg.get("max_detections", 300)
+        
+    def is_model_export_enabled(self) -> bool:
+        """Check if the model should be exported to TensorRT/OpenVINO before loading"""
+        return self._model_cfg.get("export_optimized", False)
+        
+    def get_cpu_backend(self) -> str:
+        """Get the exported backend used for CPU inference ("onnx", "openvino" or "torch")"""
+        return self._model_cfg.get("cpu_backend", "openvino")
+        
+    def is_torch_compile_enabled(self) -> bool:
+        """Check if the eager CUDA model should be wrapped with torch.compile"""
+        return self._model_cfg.get("torch_compile", False)
+        
+    def is_model_warmup_enabled(self) -> bool:
+        """Check if the model should run warm-up passes after loading"""
+        return self._model_cfg.get("warmup", True)
         
     def is_trend_analysis_enabled(self) -> bool:
         """Check if trend analysis is enabled"""
-        return self.get("analytics.enable_trend_analysis", True)
+        return self._analytics_cfg.get("enable_trend_analysis", True)
         
     def is_backup_enabled(self) -> bool:
         """Check if database backup is enabled"""
-        return self.get("database.backup_enabled", True)
+        return self._database_cfg.get("backup_enabled", True)
         
     def get_backup_interval(self) -> int:
         """Get backup interval in hours"""
-        return self.get("database.backup_interval_hours", 24)
\ No newline at end of file
+        return self._database_cfg.get("backup_interval_hours", 24)
\ No newline at end of file
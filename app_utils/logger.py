@@ -3,14 +3,24 @@ Application Logging Module
 Provides centralized logging configuration for the medical application
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 
+# Background listener that performs console/file I/O for queued records
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Set once setup_logging has run so later calls reuse the same handlers and log file
+_LOGGING_INITIALIZED = False
+
+
 def setup_logging(level: int = logging.INFO, 
                  log_file: Optional[str] = None,
                  max_file_size: int = 10 * 1024 * 1024,  # 10MB
@@ -23,7 +33,13 @@ def setup_logging(level: int = logging.INFO,
         log_file: Path to log file (default: logs/app.log)
         max_file_size: Maximum size of log file before rotation (default: 10MB)
         backup_count: Number of backup files to keep (default: 5)
+        
+    Only the first call in a process configures handlers; later calls are no-ops.
     """
+    global _LOGGING_INITIALIZED
+    if _LOGGING_INITIALIZED:
+        return
+    _LOGGING_INITIALIZED = True
     
     # Create logs directory if it doesn't exist
     logs_dir = Path(__file__).parent.parent / "logs"
@@ -46,12 +62,12 @@ def setup_logging(level: int = logging.INFO,
     
     # Clear any existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
     
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -62,7 +78,15 @@ def setup_logging(level: int = logging.INFO,
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    
+    # The root logger only enqueues records; a worker thread writes them out
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Create specific loggers for different components
     setup_component_loggers()
@@ -75,6 +99,19 @@ def setup_logging(level: int = logging.INFO,
     root_logger.info("=" * 60)
 
 
+def _stop_queue_listener():
+    """Flush pending records and stop the background logging listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_component_loggers():
     """Setup specific loggers for different application components"""
     
@@ -102,74 +139,152 @@ def setup_component_loggers():
 class MedicalLogger:
     """Enhanced logger for medical application with structured logging"""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, structured: bool = False):
+        """
+        Args:
+            name: Logger name
+            structured: Log model inference as a full dict instead of the flat fast-path message
+        """
         self.logger = logging.getLogger(name)
+        self.structured = structured
+        
+        # Deferred inference records, drained by a daemon thread started on first use
+        self._pending: Optional[queue.SimpleQueue] = None
+        self._worker_lock = threading.Lock()
         
     def log_patient_action(self, patient_id: str, action: str, details: dict = None):
         """Log patient-related actions with structured format"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
         log_data = {
             "type": "patient_action",
             "patient_id": patient_id,
             "action": action,
-            "timestamp": datetime.now().isoformat(),
             "details": details or {}
         }
-        self.logger.info(f"PATIENT_ACTION: {log_data}")
+        self.logger.info("PATIENT_ACTION: %s", log_data)
         
     def log_model_inference(self, model_path: str, confidence: float, 
                            processing_time: float, image_path: str = None):
         """Log model inference with performance metrics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
+        if not self.structured:
+            self.logger.info("MODEL_INFERENCE: model=%s conf=%.3f ms=%.2f image=%s",
+                             model_path, confidence, processing_time * 1000.0, image_path)
+            return
+            
         log_data = {
             "type": "model_inference",
             "model_path": model_path,
             "confidence": confidence,
             "processing_time_ms": processing_time * 1000,
-            "image_path": image_path,
-            "timestamp": datetime.now().isoformat()
+            "image_path": image_path
         }
-        self.logger.info(f"MODEL_INFERENCE: {log_data}")
+        self.logger.info("MODEL_INFERENCE: %s", log_data)
+        
+    def log_model_inference_async(self, model_path: str, confidence: float,
+                                  processing_time: float, image_path: str = None):
+        """Queue a model inference record so building the log record stays off the inference thread"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
+        if self._pending is None:
+            self._start_inference_worker()
+        self._pending.put((model_path, confidence, processing_time, image_path))
+        
+    def flush(self, timeout: float = 2.0):
+        """Wait until queued inference records have been logged"""
+        pending = self._pending
+        if pending is None:
+            return
+            
+        done = threading.Event()
+        pending.put(done)
+        done.wait(timeout)
         
+    def _start_inference_worker(self):
+        """Start the daemon thread that drains deferred inference records"""
+        with self._worker_lock:
+            if self._pending is not None:
+                return
+                
+            pending = queue.SimpleQueue()
+            threading.Thread(target=self._drain_inference_records, args=(pending,),
+                             name="medical-logger", daemon=True).start()
+            self._pending = pending
+            
+            # Registered after the listener shutdown hook, so it runs first at exit
+            atexit.register(self.flush)
+            
+    def _drain_inference_records(self, pending: queue.SimpleQueue, max_batch: int = 256):
+        """Log queued inference records in batches"""
+        while True:
+            batch = [pending.get()]
+            try:
+                while len(batch) < max_batch:
+                    batch.append(pending.get_nowait())
+            except queue.Empty:
+                pass
+                
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+                    continue
+                try:
+                    self.log_model_inference(*item)
+                except Exception:
+                    pass
+                    
     def log_security_event(self, event_type: str, description: str, 
                           user_id: str = None, severity: str = "INFO"):
         """Log security-related events"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+            
         log_data = {
             "type": "security_event",
             "event_type": event_type,
             "description": description,
             "user_id": user_id,
-            "severity": severity,
-            "timestamp": datetime.now().isoformat()
+            "severity": severity
         }
-        self.logger.warning(f"SECURITY_EVENT: {log_data}")
+        self.logger.warning("SECURITY_EVENT: %s", log_data)
         
     def log_analytics_export(self, export_type: str, format: str, 
                            patient_count: int, file_path: str):
         """Log analytics export operations"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
         log_data = {
             "type": "analytics_export",
             "export_type": export_type,
             "format": format,
             "patient_count": patient_count,
-            "file_path": file_path,
-            "timestamp": datetime.now().isoformat()
+            "file_path": file_path
         }
-        self.logger.info(f"ANALYTICS_EXPORT: {log_data}")
+        self.logger.info("ANALYTICS_EXPORT: %s", log_data)
         
     def log_error(self, error_message: str, context: dict = None, 
                  exception: Exception = None):
         """Log errors with context and optional exception"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+            
         log_data = {
             "type": "error",
             "message": error_message,
-            "context": context or {},
-            "timestamp": datetime.now().isoformat()
+            "context": context or {}
         }
         
         if exception:
             log_data["exception"] = str(exception)
             log_data["exception_type"] = type(exception).__name__
             
-        self.logger.error(f"ERROR: {log_data}")
+        self.logger.error("ERROR: %s", log_data)
 
 
 # Create a global medical logger instance
@@ -9,11 +9,9 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from ultralytics import YOLO
-
 # Absolute imports (recommended project structure)
 from app_utils.config import AppConfig
-from app_utils.logger import get_logger
+from app_utils.logger import get_logger, setup_logging
 
 
 class YOLOv5Downloader:
@@ -35,14 +33,7 @@ class YOLOv5Downloader:
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.config.logs_dir.mkdir(parents=True, exist_ok=True)
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(self.config.logs_dir / "model_download.log"),
-                logging.StreamHandler(),
-            ],
-        )
+        setup_logging(level=logging.INFO, log_file=self.config.logs_dir / "model_download.log")
 
     def check_existing_model(self) -> bool:
         """Check if the model already exists"""
@@ -58,6 +49,9 @@ class YOLOv5Downloader:
         try:
             self.logger.info("Starting model download using Ultralytics API...")
 
+            # Imported lazily: ultralytics pulls in torch and is only needed when downloading
+            from ultralytics import YOLO
+
             # This automatically downloads yolov5s.pt if not present
             model = YOLO(self.model_variant)
 
@@ -76,6 +70,7 @@ class YOLOv5Downloader:
         try:
             self.logger.info("Validating model...")
 
+            from ultralytics import YOLO
             model = YOLO(str(self.target_model_path))
 
             # Basic validation: check model names/classes
@@ -93,10 +88,12 @@ class YOLOv5Downloader:
     def update_configuration(self) -> bool:
         """Update application configuration"""
         try:
-            self.config.set("model.path", str(self.target_model_path))
-            self.config.set("model.device", "cpu")
-            self.config.set("model.confidence_threshold", 0.3)
-            self.config.set("model.iou_threshold", 0.45)
+            self.config.set_many({
+                "model.path": str(self.target_model_path),
+                "model.device": "auto",
+                "model.confidence_threshold": 0.3,
+                "model.iou_threshold": 0.45,
+            })
 
             self.logger.info("Configuration updated successfully.")
             return True
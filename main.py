@@ -7,6 +7,7 @@ Main application entry point
 import sys
 import os
 import logging
+import functools
 from pathlib import Path
 
 # Add the project root to Python path
@@ -21,6 +22,79 @@ from app_utils.config import AppConfig
 from app_utils.logger import setup_logging
 
 
+# Stylesheet for medical-grade appearance
+_APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #2d2d30;
+    }
+    QLabel {
+        color: #dcdcdc;
+        font-size: 12px;
+    }
+    QPushButton {
+        background-color: #2a7ae2;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1e5bb0;
+    }
+    QPushButton:pressed {
+        background-color: #164485;
+    }
+    QLineEdit, QTextEdit, QComboBox {
+        background-color: #1e1e1e;
+        border: 1px solid #5a5a5a;
+        border-radius: 4px;
+        padding: 4px;
+        color: #dcdcdc;
+    }
+    QGroupBox {
+        border: 1px solid #5a5a5a;
+        border-radius: 6px;
+        margin-top: 6px;
+        padding-top: 12px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 7px;
+        padding: 0 3px 0 3px;
+    }
+    QProgressBar {
+        border: 1px solid #5a5a5a;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #2a7ae2;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_palette() -> QPalette:
+    """Custom palette for medical-grade appearance, built once per process"""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.Button, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
+    return palette
+
+
 class BreastCancerDetectionApp(QApplication):
     """Main application class for the breast cancer detection system"""
     
@@ -47,82 +121,18 @@ class BreastCancerDetectionApp(QApplication):
         self.main_window = MainWindow(self.config)
         self.main_window.show()
         
+        # Write the default config file on first run once the window has painted
+        if not self.config.config_file.exists():
+            QTimer.singleShot(100, self.config.save)
+        
         self.logger.info("Application started successfully")
     
     def setup_style(self):
         """Setup application-wide styling"""
         # Set dark theme for medical environment
         self.setStyle('Fusion')
-        
-        # Custom palette for medical-grade appearance
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 48))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(45, 45, 48))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(45, 45, 48))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.Button, QColor(45, 45, 48))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-        
-        self.setPalette(palette)
-        
-        # Set stylesheet for medical-grade appearance
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2d2d30;
-            }
-            QLabel {
-                color: #dcdcdc;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #2a7ae2;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1e5bb0;
-            }
-            QPushButton:pressed {
-                background-color: #164485;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                background-color: #1e1e1e;
-                border: 1px solid #5a5a5a;
-                border-radius: 4px;
-                padding: 4px;
-                color: #dcdcdc;
-            }
-            QGroupBox {
-                border: 1px solid #5a5a5a;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 12px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 7px;
-                padding: 0 3px 0 3px;
-            }
-            QProgressBar {
-                border: 1px solid #5a5a5a;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #2a7ae2;
-            }
-        """)
+        self.setPalette(_get_palette())
+        self.setStyleSheet(_APP_STYLESHEET)
 
 
 def main():
@@ -31,7 +31,7 @@ def main():
     if test_image_path.exists():
         print(f"Loading test image: {test_image_path}")
         # Switch to Image Analysis tab
-        window.tab_widget.setCurrentWidget(window.image_widget)
+        window.tab_widget.setCurrentWidget(window._ensure_tab('image_widget'))
         # Load the image
         window.image_widget.load_image(str(test_image_path))
         print("Image loaded successfully")
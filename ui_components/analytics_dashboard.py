@@ -5,14 +5,22 @@ Provides detailed analytics with interactive charts and comparative analysis too
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QPushButton, QComboBox, QSpinBox, 
-                            QGroupBox, QSplitter, QMessageBox, QTextEdit)
-from PyQt6.QtCore import Qt
+                            QGroupBox, QSplitter, QMessageBox, QTextEdit,
+                            QStackedWidget)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba_array
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from contextlib import contextmanager
+from pathlib import Path
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+import sqlite3
 import json
 
 from database.manager import DatabaseManager
@@ -20,6 +28,245 @@ from app_utils.config import AppConfig
 from app_utils.logger import get_logger, get_medical_logger
 
 
+# Vertex merge tolerance (pixels) of the dashboard's own line charts; the global
+# rcParams, and so every other figure in the application, stay at their defaults
+_LINE_SIMPLIFY_THRESHOLD = 0.5
+
+# Cached query each analysis type renders from
+_VIEW_QUERIES = {
+    "System Overview": "system_statistics",
+    "Patient Trends": "patient_trends",
+    "Model Performance": "model_performance",
+    "Comparative Analysis": "comparative_counts",
+    "Export Reports": "system_statistics",
+}
+
+
+# Fixed series of the Comparative Analysis and Export Reports charts, built once at import
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun')
+
+# Bar colour sets, resolved to RGBA once instead of per bar() call
+_ROI_COLORS = to_rgba_array(['lightgreen', 'lightblue', 'gold', 'lightcoral'])
+_EXPORT_COLORS = to_rgba_array(['lightblue', 'lightgreen', 'lightcoral', 'gold'])
+_QUALITY_COLORS = to_rgba_array(['green', 'blue', 'orange', 'red'])
+_EFFICIENCY_COLORS = to_rgba_array(['lightcoral', 'lightblue', 'lightgreen', 'gold'])
+
+_X3 = np.arange(3)
+_X4 = np.arange(4)
+
+_COMPARISON_CATEGORIES = ('Patients', 'Images', 'Analyses')
+_COMPARISON_TARGET_FACTORS = np.array([1.2, 1.5, 1.3], dtype=np.float32)
+_BENCHMARKS = ('Processing Speed', 'Detection Accuracy', 'Memory Efficiency', 'User Satisfaction')   # need to fix
+_CURRENT_SCORES = np.array([85, 92, 78, 88], dtype=np.float32)
+_INDUSTRY_SCORES = np.array([80, 85, 75, 82], dtype=np.float32)
+_QUALITY_METRICS = ('Detection Quality', 'Image Quality', 'Report Quality', 'User Experience')   # need to fix
+_QUALITY_SCORES = np.array([95, 90, 88, 92], dtype=np.float32)
+_EFFICIENCY_CATEGORIES = ('Resource Usage', 'Processing Time', 'Storage Efficiency', 'Network Usage')
+_EFFICIENCY_SCORES = np.array([85, 90, 88, 92], dtype=np.float32)
+_PATIENT_TRENDS = np.array([100, 120, 135, 150, 165, 180], dtype=np.float32)
+_ANALYSIS_TRENDS = np.array([200, 240, 280, 320, 360, 400], dtype=np.float32)
+_ROI_CATEGORIES = ('Time Savings', 'Cost Reduction', 'Accuracy Improvement', 'Patient Outcomes')
+_ROI_VALUES = np.array([40, 35, 50, 45], dtype=np.float32)  # Percentage improvements
+
+_EXPORT_FORMATS = ('PDF Reports', 'Excel Data', 'CSV Data', 'JSON Export')
+# Export counts per format, shared by the chart and the statistics text
+_EXPORT_COUNTS = (150, 89, 234, 67)
+_EXPORT_TOTAL = sum(_EXPORT_COUNTS)
+_EXPORT_MAX = max(_EXPORT_COUNTS)
+_REPORT_TYPES = ('Diagnostic', 'Follow-up', 'Comparative', 'Research')
+_REPORT_COUNTS = np.array([300, 150, 89, 45], dtype=np.float32)
+_EXPORT_QUALITY_METRICS = ('Data Completeness', 'Format Accuracy', 'Export Speed', 'File Size')
+_EXPORT_QUALITY_SCORES = np.array([98, 95, 92, 88], dtype=np.float32)
+_EXPORT_SIZES = ('Small (<1MB)', 'Medium (1-10MB)', 'Large (10-100MB)', 'Huge (>100MB)')
+_EXPORT_TIMES = np.array([2, 15, 45, 120], dtype=np.float32)  # Average times in seconds
+_EXPORT_TRENDS = np.array([120, 135, 150, 165, 180, 200], dtype=np.float32)
+_COMPLIANCE_AREAS = ('HIPAA', 'GDPR', 'Data Integrity', 'Security')
+_COMPLIANCE_SCORES = np.array([100, 100, 98, 99], dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """One chart of a fixed dashboard view, drawn by AnalyticsDashboardWidget._render_spec"""
+    ax_idx: int                     # position in the flattened 2x3 grid
+    kind: str                       # 'bar', 'grouped_bar', 'pie' or 'line'
+    labels: tuple                   # categories, wedge labels or x values
+    values: object                  # one array, or one per series for 'grouped_bar'/'line'
+    title: str
+    ylabel: str = ''
+    colors: object = None           # bar colours, or one colour per 'grouped_bar' series
+    series_labels: tuple = ()       # legend entries; a legend is drawn when given
+    styles: tuple = ()              # 'line' format strings, one per series
+    positions: object = None        # 'grouped_bar' x positions
+    ylim: tuple = None
+    rotate: bool = False            # tilt the category labels by 45 degrees
+    annotate: str = None            # value label format of 'bar' charts
+    padding: float = 2              # value label offset in points
+    grid: bool = False
+    animated: bool = False          # 'line' artists are blitted, see _set_trend_data
+    key: str = None                 # name the returned artists are kept under in the view's _artists
+
+
+_COMPARATIVE_SPECS = (
+    ChartSpec(0, 'grouped_bar', _COMPARISON_CATEGORIES, (np.zeros(3, np.float32),) * 2, 'Current vs Target Metrics',
+              ylabel='Count', colors=('lightblue', 'lightcoral'), series_labels=('Current', 'Target'),
+              positions=_X3, key='comparison_bars'),
+    ChartSpec(1, 'grouped_bar', _BENCHMARKS, (_CURRENT_SCORES, _INDUSTRY_SCORES), 'Performance Benchmarks',
+              ylabel='Score (%)', colors=('green', 'orange'), series_labels=('Our System', 'Industry Avg'),
+              positions=_X4, ylim=(0, 100), rotate=True),
+    ChartSpec(2, 'bar', _QUALITY_METRICS, _QUALITY_SCORES, 'Quality Assessment',
+              ylabel='Quality Score (%)', colors='gold', ylim=(0, 100), annotate='{:.0f}%', key='quality_labels'),
+    ChartSpec(3, 'pie', _EFFICIENCY_CATEGORIES, _EFFICIENCY_SCORES, 'Efficiency Analysis'),
+    ChartSpec(4, 'line', _MONTHS, (_PATIENT_TRENDS, _ANALYSIS_TRENDS), 'Growth Trends Comparison',
+              ylabel='Count', styles=('bo-', 'ro-'), series_labels=('Patients', 'Analyses'),
+              grid=True, animated=True, key='trend_lines'),
+    ChartSpec(5, 'bar', _ROI_CATEGORIES, _ROI_VALUES, 'Return on Investment',
+              ylabel='Improvement (%)', colors=_ROI_COLORS, annotate='+{:.0f}%', key='roi_labels'),
+)
+
+_EXPORT_SPECS = (
+    ChartSpec(0, 'bar', _EXPORT_FORMATS, _EXPORT_COUNTS, 'Export Format Usage',
+              ylabel='Export Count', colors=_EXPORT_COLORS, rotate=True),
+    ChartSpec(1, 'pie', _REPORT_TYPES, _REPORT_COUNTS, 'Report Type Distribution'),
+    ChartSpec(2, 'bar', _EXPORT_QUALITY_METRICS, _EXPORT_QUALITY_SCORES, 'Export Quality Metrics',
+              ylabel='Quality Score (%)', colors=_QUALITY_COLORS, ylim=(0, 100), annotate='{:.0f}%',
+              key='quality_labels'),
+    ChartSpec(3, 'bar', _EXPORT_SIZES, _EXPORT_TIMES, 'Export Performance by Size',
+              ylabel='Average Time (seconds)', colors=_ROI_COLORS, rotate=True),
+    ChartSpec(4, 'line', _MONTHS, (_EXPORT_TRENDS,), 'Export Trend Analysis',
+              ylabel='Number of Exports', styles=('bo-',), grid=True, animated=True, key='trend_lines'),
+    ChartSpec(5, 'bar', _COMPLIANCE_AREAS, _COMPLIANCE_SCORES, 'Export Compliance Status',
+              ylabel='Compliance Score (%)', colors=_QUALITY_COLORS, ylim=(0, 100), annotate='{:.0f}%',
+              padding=1, key='compliance_labels'),
+)
+
+
+def _payload_hash(data) -> int:
+    """Content hash of a cached query result (dicts, sqlite rows, tuples and arrays)"""
+    def freeze(value):
+        if isinstance(value, np.ndarray):
+            return (value.dtype.str, value.shape, value.tobytes())
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, sqlite3.Row)):
+            return tuple(freeze(v) for v in value)
+        return value
+    return hash(freeze(data))
+
+
+def _simplify_line_paths(lines):
+    """Let the given lines merge near-collinear vertices when rasterised, and return them"""
+    # get_path() rebuilds a stale path first, so this runs after every data change
+    for line in lines:
+        line.get_path().simplify_threshold = _LINE_SIMPLIFY_THRESHOLD
+    return lines
+
+# Summary HTML templates, filled with str.format_map on refresh
+_SYS_OVERVIEW_HTML = """
+            <h3>System Overview - {timestamp}</h3>
+            <p><b>Total Patients:</b> {total_patients}</p>
+            <p><b>Total Images:</b> {total_images}</p>
+            <p><b>Processed Images:</b> {processed_images}</p>
+            <p><b>Processing Completion Rate:</b> {completion_rate:.1f}%</p>
+            <p><b>Completed Analyses:</b> {completed_analyses}</p>
+            <p><b>Total Detections:</b> {total_detections}</p>
+            <p><b>Average Confidence:</b> {average_confidence:.3f}</p>
+            """
+
+_SYS_OVERVIEW_STATUS_HTML = "<h4>System Overview Complete</h4><p>All system components are functioning normally.</p>"
+
+_SYS_KPI_HTML = """
+            <h4>Key Performance Indicators</h4>
+            <ul>
+            <li>System Uptime: 100%</li>
+            <li>Database Performance: Optimal</li>
+            <li>Model Accuracy: {average_confidence:.3f}</li>
+            <li>Data Integrity: Verified</li>
+            </ul>
+            """
+
+_PATIENT_TRENDS_HTML = """
+            <h3>Patient Trends Analysis - Top 20 Active Patients</h3>
+            <p><b>Total Patients with Analysis:</b> {analysed_patients}</p>
+            <p><b>Analysis Period:</b> Last 90 days</p>
+            <p><b>Average Analyses per Patient:</b> {avg_analyses:.1f}</p>
+            """
+
+_MODEL_PERFORMANCE_HTML = """
+            <h3>Model Performance Analytics</h3>
+            <p><b>Total Analyses:</b> {total_analyses}</p>
+            <p><b>Average Processing Time:</b> {avg_time:.1f} ms</p>
+            <p><b>Min Processing Time:</b> {min_time:.1f} ms</p>
+            <p><b>Max Processing Time:</b> {max_time:.1f} ms</p>
+            """
+
+_COMPARATIVE_HTML = """
+            <h3>Comparative Analysis Tools</h3>
+            <p><b>Comparison Scope:</b> System-wide metrics and benchmarks</p>
+            <p><b>Analysis Period:</b> Last 90 days</p>
+            <p><b>Comparison Categories:</b> Performance, Quality, Efficiency</p>
+            """
+
+_COMPARATIVE_RESULTS_HTML = """
+            <h4>Comparative Analysis Results</h4>
+            <ul>
+            <li>System Performance: Above industry average in 3/4 categories</li>
+            <li>Quality Metrics: Exceeding targets by 15-20%</li>
+            <li>Efficiency Gains: 35-50% improvement in key areas</li>
+            <li>Growth Trajectory: Consistent upward trend</li>
+            </ul>
+            """
+
+_COMPARATIVE_METRICS_HTML = """
+            <h4>Competitive Advantages</h4>
+            <ul>
+            <li>Processing Speed: 25% faster than average</li>
+            <li>Detection Accuracy: 7% higher than industry standard</li>
+            <li>User Satisfaction: 92% positive feedback</li>
+            <li>System Reliability: 99.5% uptime</li>
+            </ul>
+            """
+
+_EXPORT_REPORTS_HTML = """
+            <h3>Export Reports and Data</h3>
+            <p><b>Available Data:</b> {total_patients} patients, {total_images} images</p>
+            <p><b>Export Formats:</b> PDF, Excel, CSV</p>
+            <p><b>Report Types:</b> Diagnostic, Comparative, Trend Analysis</p>
+            <p><b>Data Range:</b> Configurable date ranges and filters</p>
+            """
+
+_EXPORT_CAPABILITIES_HTML = """
+            <h4>Export Capabilities</h4>
+            <ul>
+            <li>Format Support: PDF, Excel, CSV, JSON</li>
+            <li>Compliance: HIPAA, GDPR compliant</li>
+            <li>Performance: Average export time 45 seconds</li>
+            <li>Quality: 98% data completeness</li>
+            </ul>
+            """
+
+_EXPORT_STATISTICS_HTML = f"""
+            <h4>Export Statistics</h4>
+            <ul>
+            <li>Total Exports: {_EXPORT_TOTAL}</li>
+            <li>Most Popular Format: CSV ({_EXPORT_MAX} exports)</li>
+            <li>Average File Size: 2.5MB</li>
+            <li>Success Rate: 99.2%</li>
+            </ul>
+            """
+
+
+@lru_cache(maxsize=8)
+def _system_kpi_html(average_confidence):
+    """System Overview KPI text for an average confidence"""
+    return _SYS_KPI_HTML.format(average_confidence=average_confidence)
+
+
+@lru_cache(maxsize=8)
+def _export_summary_html(total_patients, total_images):
+    """Export Reports summary for the given totals"""
+    return _EXPORT_REPORTS_HTML.format(total_patients=total_patients, total_images=total_images)
+
+
 class AnalyticsDashboardWidget(QWidget):
     """Main analytics dashboard with interactive charts and comparative analysis"""
     
@@ -33,9 +280,39 @@ class AnalyticsDashboardWidget(QWidget):
         # Initialize database manager
         self.db_manager = DatabaseManager(config)
         
+        # Query results keyed by (query name, start date text, end date text);
+        # switching analysis type re-renders from here, "Update Analytics" refetches
+        self._stats_cache = {}
+        
+        # Cache keys currently being fetched on the thread pool
+        self._pending_fetches = set()
+        self._workers = set()
+        
+        # Rendered chart + text snapshots per analysis type, shown on tab flips until "Update Analytics"
+        self._chart_cache = {}
+        
+        # Payload hash of the view last drawn on the live canvas; an unchanged payload skips re-plotting
+        self._last_render_hash = {}
+        self._canvas_view = None
+        
+        # Text panel HTML of each view's last render, rewritten when re-plotting is skipped
+        self._view_texts = {}
+        
+        # Every analysis type draws on its own subplot grid; switching views hides the other
+        # grids instead of clearing them, so each view's persistent artists survive the switch.
+        # self.axes / self._artists point at the grid and artists of the current view.
+        self._view_axes = {}
+        self._view_artists = {}
+        self._artists = {}
+        
+        # Chart 5 pixels without its animated trend lines, for blitting line updates
+        self._trend_background = None
+        
+        # Data is loaded the first time the tab is shown, not at application startup
+        self._loaded = False
+        
         # Setup UI
         self.setup_ui()
-        self.load_initial_data()
         
     def setup_ui(self):
         """Setup the analytics dashboard UI"""
@@ -82,7 +359,7 @@ class AnalyticsDashboardWidget(QWidget):
         
         # Update button
         self.update_analytics_button = QPushButton("Update Analytics")
-        self.update_analytics_button.clicked.connect(self.update_analytics)
+        self.update_analytics_button.clicked.connect(self.on_update_clicked)
         self.update_analytics_button.setStyleSheet("background-color: #2a7ae2; color: white; font-weight: bold;")
         controls_layout.addWidget(self.update_analytics_button, 1, 2, 1, 2)
         
@@ -118,8 +395,14 @@ class AnalyticsDashboardWidget(QWidget):
         charts_layout = QVBoxLayout()
         
         # Create matplotlib figure with 2x3 grid for more comprehensive analytics
-        self.figure, self.axes = plt.subplots(2, 3, figsize=(18, 20))
-        # self.figure.tight_layout(pad=10.0, h_pad=8.0, w_pad=6.0)
+        # (plain Figure, not registered with pyplot's global figure manager)
+        # Sized to the on-screen canvas; the scroll area handles any overflow
+        self.figure = Figure(figsize=(12, 8), dpi=100)
+        # Axes are created on the first render, see _show_view_axes()
+        self.axes = None
+        # Fixed margins below; no layout engine re-solving the grid on every refresh
+        if hasattr(self.figure, "set_layout_engine"):
+            self.figure.set_layout_engine(None)
         self.figure.subplots_adjust(
             left=0.06,
             right=0.97,
@@ -130,7 +413,9 @@ class AnalyticsDashboardWidget(QWidget):
         )
         
         self.canvas = FigureCanvas(self.figure)
-        self.canvas.setMinimumHeight(500)
+        self.canvas.setMinimumSize(1200, 800)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
         
         # Add canvas to scroll area for better handling of large charts
         from PyQt6.QtWidgets import QScrollArea
@@ -141,7 +426,14 @@ class AnalyticsDashboardWidget(QWidget):
         # Create a widget to hold the canvas
         canvas_widget = QWidget()
         canvas_layout = QVBoxLayout(canvas_widget)
-        canvas_layout.addWidget(self.canvas)
+        
+        # Live canvas, plus a label that shows cached snapshots of previously rendered views
+        self.chart_stack = QStackedWidget()
+        self.chart_snapshot = QLabel()
+        self.chart_snapshot.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.chart_stack.addWidget(self.canvas)
+        self.chart_stack.addWidget(self.chart_snapshot)
+        canvas_layout.addWidget(self.chart_stack)
         canvas_layout.addStretch()
         
         charts_scroll.setWidget(canvas_widget)
@@ -235,6 +527,67 @@ class AnalyticsDashboardWidget(QWidget):
         
         layout.addWidget(splitter)
         
+    def _ensure_indexes(self):
+        """Create the indexes the dashboard aggregate queries rely on"""
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(*) FROM sqlite_master
+                    WHERE type = 'index'
+                      AND name IN ('idx_ar_status_date', 'idx_ar_status_img', 'idx_images_patient')
+                """)
+                indexes_existed = cursor.fetchone()[0] == 3
+                
+                # Lets the monthly activity GROUP BY resolve from the index alone
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_ar_status_date
+                    ON analysis_results(result_status, analysis_date)
+                """)
+                # Patient -> image -> completed result joins of the trends queries
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_ar_status_img
+                    ON analysis_results(result_status, image_id)
+                    WHERE result_status = 'completed'
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_images_patient
+                    ON images(patient_id, id)
+                """)
+                # A full ANALYZE scans every table, so it only runs when indexes were just created;
+                # otherwise optimize refreshes whatever statistics have gone stale
+                cursor.execute("PRAGMA optimize" if indexes_existed else "ANALYZE")
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Could not create analytics indexes: {e}")
+            
+    @contextmanager
+    def _readonly_connection(self):
+        """
+        Open a read-only SQLite connection for dashboard queries
+        
+        Read-only mode with query_only avoids write locks and journaling, so
+        dashboard reads don't contend with patient/analysis inserts.
+        """
+        db_path = Path(self.config.get_database_path()).resolve()
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, cached_statements=128)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            yield conn
+        finally:
+            conn.close()
+            
+    def showEvent(self, event):
+        """Load analytics on first display of the tab"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self._ensure_indexes()
+            self.load_initial_data()
+            
     def load_initial_data(self):
         """Load initial analytics data"""
         try:
@@ -246,13 +599,255 @@ class AnalyticsDashboardWidget(QWidget):
             
     def on_analysis_type_changed(self, analysis_type):
         """Handle analysis type change"""
+        if self._restore_snapshot(analysis_type):
+            return
+        self.update_analytics()
+        
+    def on_update_clicked(self):
+        """Refetch analytics data for the current settings"""
+        self._stats_cache.clear()
+        self._chart_cache.clear()
         self.update_analytics()
         
+    def _store_snapshot(self, analysis_type):
+        """Remember the rendered charts and texts of a view"""
+        self._chart_cache[analysis_type] = (
+            self.canvas.grab(),  # paints any pending draw_idle first
+            *self._texts(),
+        )
+        
+    def _texts(self):
+        """HTML of the summary, comparison and metrics panels"""
+        return (self.summary_text.toHtml(), self.comparison_text.toHtml(), self.metrics_text.toHtml())
+        
+    def _set_texts(self, summary_html, comparison_html, metrics_html):
+        """Show the given HTML in the summary, comparison and metrics panels"""
+        self.summary_text.setHtml(summary_html)
+        self.comparison_text.setHtml(comparison_html)
+        self.metrics_text.setHtml(metrics_html)
+        
+    def _restore_snapshot(self, analysis_type) -> bool:
+        """Show a cached view without redrawing matplotlib; False when nothing is cached"""
+        snapshot = self._chart_cache.get(analysis_type)
+        if snapshot is None:
+            return False
+            
+        pixmap, summary_html, comparison_html, metrics_html = snapshot
+        self.chart_snapshot.setPixmap(pixmap)
+        self.chart_stack.setCurrentWidget(self.chart_snapshot)
+        self._set_texts(summary_html, comparison_html, metrics_html)
+        return True
+        
+    def _cache_key(self, name):
+        """Cache key of a query for the current date range"""
+        return (name, self.start_date.currentText(), self.end_date.currentText())
+        
+    def _query_fetchers(self):
+        """Map query names to the callables that run them"""
+        return {
+            "system_statistics": self._fetch_system_statistics,
+            "patient_trends": self._fetch_patient_trends,
+            "model_performance": self._fetch_model_performance,
+            "comparative_counts": self._fetch_comparative_counts,
+        }
+        
+    def _start_fetch(self, name, key):
+        """Run a query on the global thread pool; the result lands in the cache"""
+        if key in self._pending_fetches:
+            return
+            
+        self._pending_fetches.add(key)
+        self.update_analytics_button.setEnabled(False)
+        
+        worker = AnalyticsWorker(key, self._query_fetchers()[name])
+        worker.signals.finished.connect(self.on_fetch_finished)
+        worker.signals.error.connect(self.on_fetch_error)
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _fetch_done(self, key):
+        """Bookkeeping shared by the fetch result slots"""
+        self._pending_fetches.discard(key)
+        self._workers = {w for w in self._workers if w.key != key}
+        if not self._pending_fetches:
+            self.update_analytics_button.setEnabled(True)
+            
+    def on_fetch_finished(self, payload):
+        """Store a fetched query result and render it if it is still the current view"""
+        key = payload['key']
+        self._fetch_done(key)
+        self._stats_cache[key] = payload['data']
+        
+        if key == self._cache_key(_VIEW_QUERIES.get(self.analysis_type.currentText(), "")):
+            self.update_analytics()
+            
+    def on_fetch_error(self, key, error_msg):
+        """Handle a failed background query"""
+        self._fetch_done(key)
+        self.logger.error(f"Failed to fetch analytics data: {error_msg}")
+        self.clear_charts()
+        self._canvas_view = None
+        
+    def _cached(self, name, fetch):
+        """Return the cached result of fetch() for the current date range, fetching on a miss"""
+        key = self._cache_key(name)
+        try:
+            return self._stats_cache[key]
+        except KeyError:
+            result = self._stats_cache[key] = fetch()
+            return result
+            
+    def _get_system_statistics(self):
+        """Get system statistics for the current date range"""
+        return self._cached("system_statistics", self._fetch_system_statistics)
+        
+    def _fetch_system_statistics(self):
+        """System statistics plus derived metrics computed by SQLite"""
+        stats = dict(self.db_manager.get_system_statistics())
+        
+        with self._readonly_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COALESCE(
+                    CAST((SELECT SUM(detection_count) FROM analysis_results
+                          WHERE result_status = 'completed') AS REAL)
+                    / NULLIF((SELECT COUNT(*) FROM patients WHERE is_active = 1), 0),
+                    0)
+            """)
+            stats['avg_detections_per_patient'] = cursor.fetchone()[0]
+            
+        return stats
+        
+    def _fetch_patient_trends(self):
+        """Query top patient activity rows and monthly active patient counts"""
+        with self._readonly_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Get detection count trends
+            cursor.execute("""
+                SELECT p.patient_id, p.first_name, p.last_name, 
+                       COUNT(ar.id) as analysis_count,
+                       AVG(ar.max_confidence) as avg_confidence,
+                       MAX(ar.analysis_date) as last_analysis
+                FROM patients p
+                LEFT JOIN images i ON p.id = i.patient_id
+                LEFT JOIN analysis_results ar ON i.id = ar.image_id
+                WHERE p.is_active = 1 AND ar.result_status = 'completed'
+                GROUP BY p.id
+                ORDER BY analysis_count DESC
+                LIMIT 20
+            """)
+            
+            patient_data = cursor.fetchall()
+            
+            # Monthly activity bucketed by SQLite instead of in Python
+            cursor.execute("""
+                SELECT strftime('%Y-%m', ar.analysis_date) AS month,
+                       COUNT(DISTINCT p.id) AS active_patients
+                FROM patients p
+                JOIN images i ON p.id = i.patient_id
+                JOIN analysis_results ar ON i.id = ar.image_id
+                WHERE p.is_active = 1 AND ar.result_status = 'completed'
+                GROUP BY month
+                ORDER BY month
+            """)
+            
+            monthly_rows = cursor.fetchall()
+            
+            # Average over every analysed patient, not just the 20 rows fetched above
+            cursor.execute("""
+                SELECT AVG(c), COUNT(*) FROM (
+                    SELECT COUNT(ar.id) AS c
+                    FROM patients p
+                    JOIN images i ON p.id = i.patient_id
+                    JOIN analysis_results ar ON i.id = ar.image_id
+                    WHERE p.is_active = 1 AND ar.result_status = 'completed'
+                    GROUP BY p.id
+                )
+            """)
+            
+            patient_totals = cursor.fetchone()
+            
+        return patient_data, monthly_rows, patient_totals
+        
+    def _fetch_model_performance(self):
+        """Query processing time statistics and per-analysis time/confidence samples"""
+        with self._readonly_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Get processing time statistics
+            cursor.execute("""
+                SELECT AVG(processing_time_ms) as avg_time,
+                       MIN(processing_time_ms) as min_time,
+                       MAX(processing_time_ms) as max_time,
+                       COUNT(*) as total_analyses
+                FROM analysis_results 
+                WHERE result_status = 'completed'
+            """)
+            
+            perf_data = cursor.fetchone()
+            
+            cursor.execute("""
+                SELECT processing_time_ms FROM analysis_results
+                WHERE result_status = 'completed' AND processing_time_ms IS NOT NULL
+            """)
+            processing_times = np.fromiter((r[0] for r in cursor), dtype=np.float32)
+            
+            cursor.execute("""
+                SELECT max_confidence FROM analysis_results
+                WHERE result_status = 'completed' AND max_confidence IS NOT NULL
+            """)
+            confidences = np.fromiter((r[0] for r in cursor), dtype=np.float32)
+            
+        return perf_data, processing_times, confidences
+            
+    def _fetch_comparative_counts(self):
+        """Current and target totals as chart-ready arrays; runs on the thread pool"""
+        values = np.asarray(self._query_comparative_counts(), dtype=np.float32)
+        return values, values * _COMPARISON_TARGET_FACTORS
+        
+    def _query_comparative_counts(self):
+        """Query patient, image and completed analysis totals"""
+        with self._readonly_connection() as conn:
+            cursor = conn.cursor()
+            
+            # All three totals in a single round-trip
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM patients WHERE is_active = 1),
+                       (SELECT COUNT(*) FROM images),
+                       (SELECT COUNT(*) FROM analysis_results WHERE result_status = 'completed')
+            """)
+            total_patients, total_images, total_analyses = cursor.fetchone()
+            
+        return total_patients, total_images, total_analyses
+        
     def update_analytics(self):
         """Update analytics based on current settings"""
         try:
             analysis_type = self.analysis_type.currentText()
             
+            # Fetch in the background on a cache miss; the view renders when data arrives
+            name = _VIEW_QUERIES.get(analysis_type)
+            payload_hash = None
+            if name is not None:
+                key = self._cache_key(name)
+                if key not in self._stats_cache:
+                    self._start_fetch(name, key)
+                    return
+                payload_hash = _payload_hash(self._stats_cache[key])
+            
+            self.chart_stack.setCurrentWidget(self.canvas)
+            self._show_view_axes(analysis_type, 2, 3)
+            
+            # The canvas already shows this view drawn from identical data; the text
+            # panels may hold another view's restored snapshot, so only they are rewritten
+            if (payload_hash is not None and self._canvas_view == analysis_type
+                    and self._last_render_hash.get(analysis_type) == payload_hash
+                    and analysis_type in self._view_texts):
+                self._set_texts(*self._view_texts[analysis_type])
+                return
+            self._canvas_view = analysis_type
+            
             if analysis_type == "System Overview":
                 self.show_system_overview()
             elif analysis_type == "Patient Trends":
@@ -264,7 +859,14 @@ class AnalyticsDashboardWidget(QWidget):
             elif analysis_type == "Export Reports":
                 self.show_export_reports()
                 
+            # The show_* error handlers reset _canvas_view when a view failed to render
+            if self._canvas_view == analysis_type:
+                self._last_render_hash[analysis_type] = payload_hash
+                self._view_texts[analysis_type] = self._texts()
+                self._store_snapshot(analysis_type)
+                
         except Exception as e:
+            self._canvas_view = None
             self.logger.error(f"Failed to update analytics: {e}")
             QMessageBox.critical(self, "Error", f"Failed to update analytics: {str(e)}")
             
@@ -272,165 +874,198 @@ class AnalyticsDashboardWidget(QWidget):
         """Display system-wide overview analytics"""
         try:
             # Get system statistics
-            stats = self.db_manager.get_system_statistics()
+            stats = self._get_system_statistics()
             
             # Update summary text
-            summary = f"""
-            <h3>System Overview - {datetime.now().strftime('%Y-%m-%d %H:%M')}</h3>
-            <p><b>Total Patients:</b> {stats.get('total_patients', 0)}</p>
-            <p><b>Total Images:</b> {stats.get('total_images', 0)}</p>
-            <p><b>Processed Images:</b> {stats.get('processed_images', 0)}</p>
-            <p><b>Processing Completion Rate:</b> {stats.get('completion_rate', 0):.1f}%</p>
-            <p><b>Completed Analyses:</b> {stats.get('completed_analyses', 0)}</p>
-            <p><b>Total Detections:</b> {stats.get('total_detections', 0)}</p>
-            <p><b>Average Confidence:</b> {stats.get('average_confidence', 0):.3f}</p>
-            """
-            
-            self.summary_text.setHtml(summary)
-            
-            # Update charts
-            self.clear_charts()
-            
-            # Chart 1: Patient vs Image Statistics
-            ax1 = self.axes[0, 0]
-            categories = ['Patients', 'Images', 'Analyses']
-            values = [stats.get('total_patients', 0), stats.get('total_images', 0), stats.get('completed_analyses', 0)]
-            colors = ['skyblue', 'lightgreen', 'lightcoral']
-            
-            bars = ax1.bar(categories, values, color=colors)
-            ax1.set_title('System Statistics Overview', fontweight='bold')
-            ax1.set_ylabel('Count')
-            
-            # Add value labels on bars
-            for bar, value in zip(bars, values):
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values)*0.01,
-                        str(value), ha='center', va='bottom')
-            
-            # Chart 2: Processing Completion Rate
-            ax2 = self.axes[0, 1]
-            completion_rate = stats.get('completion_rate', 0)
-            not_completed = 100 - completion_rate
+            values = defaultdict(lambda: 0, stats)
+            values['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+            self.summary_text.setHtml(_SYS_OVERVIEW_HTML.format_map(values))
             
-            wedges, texts, autotexts = ax2.pie([completion_rate, not_completed], 
-                                              labels=['Completed', 'Not Processed'],
-                                              colors=['lightgreen', 'lightcoral'],
-                                              autopct='%1.1f%%', startangle=90)
-            ax2.set_title('Image Processing Status', fontweight='bold')
-            
-            # Chart 3: Average Confidence Distribution
-            ax3 = self.axes[0, 2]
-            confidence = stats.get('average_confidence', 0)
-            ax3.bar(['Average Confidence'], [confidence], color='gold')
-            ax3.set_title('Model Confidence Score', fontweight='bold')
-            ax3.set_ylim(0, 1)
-            ax3.text(0, confidence + 0.05, f'{confidence:.3f}', ha='center')
-            
-            # Chart 4: Detection Count vs Patients
-            ax4 = self.axes[1, 0]
-            total_detections = stats.get('total_detections', 0)
-            total_patients = stats.get('total_patients', 1)
-            avg_detections_per_patient = total_detections / total_patients if total_patients > 0 else 0
-            
-            ax4.bar(['Average Detections per Patient'], [avg_detections_per_patient], color='lightblue')
-            ax4.set_title('Detection Analysis', fontweight='bold')
-            ax4.text(0, avg_detections_per_patient + max(1, avg_detections_per_patient*0.1), 
-                    f'{avg_detections_per_patient:.1f}', ha='center')
-            
-            # Chart 5: System Health Indicators
-            ax5 = self.axes[1, 1]
-            health_metrics = ['Model Loaded', 'Database Connected', 'Backup Enabled', 'Analytics Enabled']
-            health_values = [1, 1, 1, 1]  # All good for now
-            colors = ['green' if v == 1 else 'red' for v in health_values]
-            
-            bars = ax5.bar(health_metrics, health_values, color=colors)
-            ax5.set_title('System Health Status', fontweight='bold')
-            ax5.set_ylim(0, 1.2)
-            ax5.set_yticks([0, 1])
-            ax5.set_yticklabels(['No', 'Yes'])
-            
-            # Chart 6: Data Retention Overview
-            ax6 = self.axes[1, 2]
-            retention_days = self.config.get_history_retention_days()
-            current_data_days = 365  # Assume 1 year of data
-            
-            ax6.bar(['Data Retention Policy'], [retention_days], color='lightsteelblue')
-            ax6.set_title('Data Retention Policy', fontweight='bold')
-            ax6.set_ylabel('Days')
-            ax6.text(0, retention_days + retention_days*0.1, f'{retention_days} days', ha='center')
+            # Build the chart scaffolding when switching into this view, then only update artist data
+            if 'overview' not in self._artists:
+                self.clear_charts()
+                self._build_system_overview_charts()
+            self._update_system_overview_charts(stats)
             
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             # Update detailed analysis
-            self.comparison_text.setHtml("<h4>System Overview Complete</h4><p>All system components are functioning normally.</p>")
-            self.metrics_text.setHtml(f"""
-            <h4>Key Performance Indicators</h4>
-            <ul>
-            <li>System Uptime: 100%</li>
-            <li>Database Performance: Optimal</li>
-            <li>Model Accuracy: {stats.get('average_confidence', 0):.3f}</li>
-            <li>Data Integrity: Verified</li>
-            </ul>
-            """)
+            self.comparison_text.setHtml(_SYS_OVERVIEW_STATUS_HTML)
+            self.metrics_text.setHtml(_system_kpi_html(stats.get('average_confidence', 0)))
             
         except Exception as e:
             self.logger.error(f"Failed to show system overview: {e}")
             self.clear_charts()
+            self._canvas_view = None
+            
+    def _build_system_overview_charts(self):
+        """Create the System Overview axes decorations and artists with placeholder data"""
+        artists = {}
+        
+        # Chart 1: Patient vs Image Statistics
+        ax1 = self.axes[0, 0]
+        categories = ['Patients', 'Images', 'Analyses']
+        colors = ['skyblue', 'lightgreen', 'lightcoral']
+        
+        artists['stats_bars'] = ax1.bar(categories, [0, 0, 0], color=colors)
+        artists['stats_labels'] = self._annotate_bars(ax1, artists['stats_bars'], (0, 0, 0), fmt='{:.0f}')
+        ax1.set_title('System Statistics Overview', fontweight='bold')
+        ax1.set_ylabel('Count')
+        
+        # Chart 2: Processing Completion Rate
+        ax2 = self.axes[0, 1]
+        artists['status_pie'] = ax2.pie([0, 100],
+                                        labels=['Completed', 'Not Processed'],
+                                        colors=['lightgreen', 'lightcoral'],
+                                        autopct='%1.1f%%', startangle=90)
+        ax2.set_title('Image Processing Status', fontweight='bold')
+        ax2.set_axis_off()  # pies draw no ticks or spines
+        
+        # Chart 3: Average Confidence Distribution
+        ax3 = self.axes[0, 2]
+        artists['confidence_bar'] = ax3.bar(['Average Confidence'], [0], color='gold')[0]
+        artists['confidence_label'] = ax3.text(0, 0.05, '0.000', ha='center')
+        ax3.set_title('Model Confidence Score', fontweight='bold')
+        ax3.set_ylim(0, 1)
+        
+        # Chart 4: Detection Count vs Patients
+        ax4 = self.axes[1, 0]
+        artists['detections_bar'] = ax4.bar(['Average Detections per Patient'], [0], color='lightblue')[0]
+        artists['detections_label'] = ax4.text(0, 1, '0.0', ha='center')
+        ax4.set_title('Detection Analysis', fontweight='bold')
+        
+        # Chart 5: System Health Indicators
+        ax5 = self.axes[1, 1]
+        health_metrics = ['Model Loaded', 'Database Connected', 'Backup Enabled', 'Analytics Enabled']
+        health_values = [1, 1, 1, 1]  # All good for now
+        colors = ['green' if v == 1 else 'red' for v in health_values]
+        
+        ax5.bar(health_metrics, health_values, color=colors)
+        ax5.set_title('System Health Status', fontweight='bold')
+        ax5.set_ylim(0, 1.2)
+        ax5.set_yticks([0, 1])
+        ax5.set_yticklabels(['No', 'Yes'])
+        
+        # Chart 6: Data Retention Overview
+        ax6 = self.axes[1, 2]
+        artists['retention_bar'] = ax6.bar(['Data Retention Policy'], [0], color='lightsteelblue')[0]
+        artists['retention_label'] = ax6.text(0, 0, '', ha='center')
+        ax6.set_title('Data Retention Policy', fontweight='bold')
+        ax6.set_ylabel('Days')
+        
+        self._artists['overview'] = artists
+        
+    def _update_system_overview_charts(self, stats):
+        """Push new statistics into the persistent System Overview artists"""
+        artists = self._artists['overview']
+        
+        # Chart 1: Patient vs Image Statistics
+        values = np.asarray([stats.get('total_patients', 0), stats.get('total_images', 0),
+                             stats.get('completed_analyses', 0)], dtype=np.float32)
+        top = float(values.max()) or 1.0
+        for bar, value in zip(artists['stats_bars'], values.tolist()):
+            bar.set_height(value)
+        self._annotate_bars(self.axes[0, 0], artists['stats_bars'], values.tolist(),
+                            fmt='{:.0f}', texts=artists['stats_labels'])
+        self.axes[0, 0].set_ylim(0, top*1.1)
+        
+        # Chart 2: Processing Completion Rate
+        completion_rate = stats.get('completion_rate', 0)
+        self._update_pie(artists['status_pie'], [completion_rate, 100 - completion_rate])
+        
+        # Chart 3: Average Confidence Distribution
+        confidence = stats.get('average_confidence', 0)
+        artists['confidence_bar'].set_height(confidence)
+        artists['confidence_label'].set_y(confidence + 0.05)
+        artists['confidence_label'].set_text(f'{confidence:.3f}')
+        
+        # Chart 4: Detection Count vs Patients
+        avg_detections_per_patient = stats.get('avg_detections_per_patient', 0)
+        
+        artists['detections_bar'].set_height(avg_detections_per_patient)
+        label_y = avg_detections_per_patient + max(1, avg_detections_per_patient*0.1)
+        artists['detections_label'].set_y(label_y)
+        artists['detections_label'].set_text(f'{avg_detections_per_patient:.1f}')
+        self.axes[1, 0].set_ylim(0, label_y*1.1)
+        
+        # Chart 6: Data Retention Overview
+        retention_days = self.config.get_history_retention_days()
+        artists['retention_bar'].set_height(retention_days)
+        artists['retention_label'].set_y(retention_days + retention_days*0.1)
+        artists['retention_label'].set_text(f'{retention_days} days')
+        self.axes[1, 2].set_ylim(0, max(retention_days*1.25, 1))
+        
+    @staticmethod
+    def _annotate_bars(ax, bars, values, fmt='{:.0f}%', padding=2, texts=None):
+        """Label bars with their values; one bar_label call on first use, then only moves and relabels them"""
+        labels = [fmt.format(value) for value in values]
+        if texts is None:
+            return ax.bar_label(bars, labels=labels, padding=padding)
+            
+        for bar, text, label in zip(bars, texts, labels):
+            text.xy = (bar.get_x() + bar.get_width()/2, bar.get_height())
+            text.set_text(label)
+        return texts
+        
+    @staticmethod
+    def _update_pie(pie, values, startangle=90):
+        """Move existing pie wedges and labels to new values (same geometry as Axes.pie)"""
+        wedges, texts, autotexts = pie
+        total = float(sum(values)) or 1.0
+        theta1 = startangle
+        for wedge, text, autotext, value in zip(wedges, texts, autotexts, values):
+            fraction = value / total
+            theta2 = theta1 + 360.0 * fraction
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            
+            mid = np.deg2rad((theta1 + theta2) / 2)
+            x, y = np.cos(mid), np.sin(mid)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((0.6 * x, 0.6 * y))
+            autotext.set_text(f'{fraction * 100:.1f}%')
+            theta1 = theta2
             
     def show_patient_trends(self):
         """Display patient trend analysis"""
         try:
             # Get patient analytics data
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get detection count trends
-                cursor.execute("""
-                    SELECT p.patient_id, p.first_name, p.last_name, 
-                           COUNT(ar.id) as analysis_count,
-                           AVG(ar.max_confidence) as avg_confidence,
-                           MAX(ar.analysis_date) as last_analysis
-                    FROM patients p
-                    LEFT JOIN images i ON p.id = i.patient_id
-                    LEFT JOIN analysis_results ar ON i.id = ar.image_id
-                    WHERE p.is_active = 1 AND ar.result_status = 'completed'
-                    GROUP BY p.id
-                    ORDER BY analysis_count DESC
-                    LIMIT 20
-                """)
-                
-                patient_data = cursor.fetchall()
+            patient_data, monthly_rows, (avg_analyses, analysed_patients) = self._cached(
+                "patient_trends", self._fetch_patient_trends
+            )
                 
             if not patient_data:
                 self.summary_text.setHtml("<h3>No patient trend data available</h3>")
                 self.clear_charts()
                 return
                 
+            # Positional columns straight into arrays
+            ids, first_names, last_names, analysis_counts, confs, last_dates = zip(*patient_data)
+            counts = np.asarray(analysis_counts, dtype=np.int32)
+            all_confidences = np.asarray([c or 0 for c in confs], dtype=np.float32)
+                
             # Update summary
-            summary = f"""
-            <h3>Patient Trends Analysis - Top 20 Active Patients</h3>
-            <p><b>Total Patients with Analysis:</b> {len(patient_data)}</p>
-            <p><b>Analysis Period:</b> Last 90 days</p>
-            <p><b>Average Analyses per Patient:</b> {sum(p['analysis_count'] for p in patient_data) / len(patient_data):.1f}</p>
-            """
-            self.summary_text.setHtml(summary)
+            self.summary_text.setHtml(_PATIENT_TRENDS_HTML.format_map({
+                'analysed_patients': analysed_patients,
+                'avg_analyses': avg_analyses or 0
+            }))
             
             # Update charts
             self.clear_charts()
             
             # Chart 1: Analysis Count Distribution
             ax1 = self.axes[0, 0]
-            analysis_counts = [p['analysis_count'] for p in patient_data]
-            ax1.hist(analysis_counts, bins=10, color='skyblue', alpha=0.7, edgecolor='black')
+            hist_counts, hist_edges = np.histogram(counts, bins=10)
+            ax1.stairs(hist_counts, hist_edges, fill=True, color='skyblue', alpha=0.7)
             ax1.set_title('Analysis Count Distribution', fontweight='bold')
             ax1.set_xlabel('Number of Analyses')
             ax1.set_ylabel('Number of Patients')
             
             # Chart 2: Average Confidence by Patient (Top 10)
             ax2 = self.axes[0, 1]
-            top_10_patients = patient_data[:10]
-            patient_names = [f"{p['first_name']} {p['last_name']}" for p in top_10_patients]
-            avg_confidences = [p['avg_confidence'] or 0 for p in top_10_patients]
+            patient_names = [f"{first} {last}" for first, last in zip(first_names[:10], last_names[:10])]
+            avg_confidences = all_confidences[:10]
             
             bars = ax2.barh(patient_names, avg_confidences, color='lightgreen')
             ax2.set_title('Avg Confidence by Patient (Top 10)', fontweight='bold')
@@ -439,67 +1074,46 @@ class AnalyticsDashboardWidget(QWidget):
             
             # Chart 3: Patient Activity Timeline
             ax3 = self.axes[0, 2]
-            # Group by month for trend analysis
-            monthly_data = {}
-            for p in patient_data:
-                if p['last_analysis']:
-                    month = p['last_analysis'][:7]  # YYYY-MM format
-                    monthly_data[month] = monthly_data.get(month, 0) + 1
-            
-            if monthly_data:
-                months = sorted(monthly_data.keys())
-                counts = [monthly_data[m] for m in months]
-                ax3.plot(months, counts, 'bo-', linewidth=2, markersize=6)
+            if monthly_rows:
+                months, active = zip(*monthly_rows)
+                _simplify_line_paths(ax3.plot(months, active, 'bo-', linewidth=2, markersize=6))
                 ax3.set_title('Patient Activity Timeline', fontweight='bold')
                 ax3.set_ylabel('Active Patients')
                 ax3.tick_params(axis='x', rotation=45)
             
             # Chart 4: Analysis Frequency Analysis
             ax4 = self.axes[1, 0]
-            freq_categories = {'1-2': 0, '3-5': 0, '6-10': 0, '10+': 0}
-            for count in analysis_counts:
-                if count <= 2:
-                    freq_categories['1-2'] += 1
-                elif count <= 5:
-                    freq_categories['3-5'] += 1
-                elif count <= 10:
-                    freq_categories['6-10'] += 1
-                else:
-                    freq_categories['10+'] += 1
-            
-            categories = list(freq_categories.keys())
-            values = list(freq_categories.values())
+            categories = ['1-2', '3-5', '6-10', '10+']
+            values = np.bincount(np.digitize(counts, [3, 6, 11]), minlength=4).tolist()
             ax4.pie(values, labels=categories, autopct='%1.1f%%', startangle=90)
             ax4.set_title('Analysis Frequency Distribution', fontweight='bold')
+            ax4.set_axis_off()  # pies draw no ticks or spines
             
             # Chart 5: Confidence Score Distribution
             ax5 = self.axes[1, 1]
-            ax5.hist(avg_confidences, bins=10, color='gold', alpha=0.7, edgecolor='black')
+            hist_counts, hist_edges = np.histogram(avg_confidences, bins=10)
+            ax5.stairs(hist_counts, hist_edges, fill=True, color='gold', alpha=0.7)
             ax5.set_title('Confidence Score Distribution', fontweight='bold')
             ax5.set_xlabel('Average Confidence Score')
             ax5.set_ylabel('Number of Patients')
             
             # Chart 6: Patient Engagement Score
             ax6 = self.axes[1, 2]
-            engagement_scores = []
-            for p in patient_data:
-                score = min(p['analysis_count'] * 10, 100)  # Scale to 0-100
-                engagement_scores.append(score)
+            engagement_scores = np.minimum(counts * 10, 100).astype(np.float32)  # Scale to 0-100
             
             ax6.boxplot(engagement_scores)
             ax6.set_title('Patient Engagement Analysis', fontweight='bold')
             ax6.set_ylabel('Engagement Score (0-100)')
             
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             # Update detailed analysis
             self.comparison_text.setHtml(f"""
             <h4>Top Performing Patients</h4>
             <ul>
-            <li>Most Active: {patient_names[0] if patient_names else 'N/A'} ({max(analysis_counts) if analysis_counts else 0} analyses)</li>
-            <li>Highest Confidence: {patient_names[avg_confidences.index(max(avg_confidences))] if avg_confidences else 'N/A'}</li>
-            <li>Average Engagement Score: {sum(engagement_scores)/len(engagement_scores):.1f}</li>
+            <li>Most Active: {patient_names[0]} ({counts.max()} analyses)</li>
+            <li>Highest Confidence: {patient_names[int(np.argmax(avg_confidences))]}</li>
+            <li>Average Engagement Score: {engagement_scores.mean():.1f}</li>
             </ul>
             """)
             
@@ -507,7 +1121,7 @@ class AnalyticsDashboardWidget(QWidget):
             <h4>Trend Analysis Metrics</h4>
             <ul>
             <li>Analysis Growth Rate: Calculating...</li>
-            <li>Patient Retention: {len([p for p in patient_data if p['analysis_count'] > 1]) / len(patient_data) * 100:.1f}%</li>
+            <li>Patient Retention: {np.count_nonzero(counts > 1) / counts.size * 100:.1f}%</li>
             <li>Average Analysis Interval: Estimating...</li>
             <li>System Adoption Rate: High</li>
             </ul>
@@ -516,25 +1130,15 @@ class AnalyticsDashboardWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Failed to show patient trends: {e}")
             self.clear_charts()
+            self._canvas_view = None
             
     def show_model_performance(self):
         """Display model performance analytics"""
         try:
             # Get model performance data
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get processing time statistics
-                cursor.execute("""
-                    SELECT AVG(processing_time_ms) as avg_time,
-                           MIN(processing_time_ms) as min_time,
-                           MAX(processing_time_ms) as max_time,
-                           COUNT(*) as total_analyses
-                    FROM analysis_results 
-                    WHERE result_status = 'completed'
-                """)
-                
-                perf_data = cursor.fetchone()
+            perf_data, processing_times, confidences = self._cached(
+                "model_performance", self._fetch_model_performance
+            )
                 
             if not perf_data:
                 self.summary_text.setHtml("<h3>No model performance data available</h3>")
@@ -542,24 +1146,16 @@ class AnalyticsDashboardWidget(QWidget):
                 return
                 
             # Update summary
-            summary = f"""
-            <h3>Model Performance Analytics</h3>
-            <p><b>Total Analyses:</b> {perf_data['total_analyses']}</p>
-            <p><b>Average Processing Time:</b> {perf_data['avg_time']:.1f} ms</p>
-            <p><b>Min Processing Time:</b> {perf_data['min_time']:.1f} ms</p>
-            <p><b>Max Processing Time:</b> {perf_data['max_time']:.1f} ms</p>
-            """
-            self.summary_text.setHtml(summary)
+            # sqlite3.Row supports lookup by column name, so it is the mapping itself
+            self.summary_text.setHtml(_MODEL_PERFORMANCE_HTML.format_map(perf_data))
             
             # Update charts
             self.clear_charts()
             
             # Chart 1: Processing Time Distribution
             ax1 = self.axes[0, 0]
-            # Simulate processing time data for histogram
-            np.random.seed(42)
-            processing_times = np.random.normal(perf_data['avg_time'], perf_data['avg_time']*0.2, 1000)
-            ax1.hist(processing_times, bins=30, color='lightblue', alpha=0.7, edgecolor='black')
+            hist_counts, hist_edges = np.histogram(processing_times, bins=30)
+            ax1.stairs(hist_counts, hist_edges, fill=True, color='lightblue', alpha=0.7)
             ax1.set_title('Processing Time Distribution', fontweight='bold')
             ax1.set_xlabel('Processing Time (ms)')
             ax1.set_ylabel('Frequency')
@@ -568,20 +1164,18 @@ class AnalyticsDashboardWidget(QWidget):
             ax2 = self.axes[0, 1]
             metrics = ['Accuracy', 'Precision', 'Recall', 'F1-Score']
             values = [0.85, 0.82, 0.88, 0.85]  # Example values
-            bars = ax2.bar(metrics, values, color=['green', 'blue', 'orange', 'red'])
+            bars = ax2.bar(metrics, values, color=_QUALITY_COLORS)
             ax2.set_title('Model Performance Metrics', fontweight='bold')
             ax2.set_ylim(0, 1)
             ax2.set_ylabel('Score')
             
             # Add value labels
-            for bar, value in zip(bars, values):
-                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.02,
-                        f'{value:.2f}', ha='center')
+            self._annotate_bars(ax2, bars, values, fmt='{:.2f}', padding=3)
             
             # Chart 3: Confidence Score Analysis
             ax3 = self.axes[0, 2]
-            confidence_data = np.random.beta(2, 1, 1000)  # Beta distribution for confidence scores
-            ax3.hist(confidence_data, bins=20, color='gold', alpha=0.7, edgecolor='black')
+            hist_counts, hist_edges = np.histogram(confidences, bins=20)
+            ax3.stairs(hist_counts, hist_edges, fill=True, color='gold', alpha=0.7)
             ax3.set_title('Confidence Score Distribution', fontweight='bold')
             ax3.set_xlabel('Confidence Score')
             ax3.set_ylabel('Frequency')
@@ -590,15 +1184,13 @@ class AnalyticsDashboardWidget(QWidget):
             ax4 = self.axes[1, 0]
             efficiency_metrics = ['Memory Usage', 'CPU Usage', 'GPU Utilization', 'I/O Efficiency']
             efficiency_values = [75, 60, 85, 90]  # Percentage values
-            bars = ax4.bar(efficiency_metrics, efficiency_values, color=['lightcoral', 'lightblue', 'lightgreen', 'gold'])
+            bars = ax4.bar(efficiency_metrics, efficiency_values, color=_EFFICIENCY_COLORS)
             ax4.set_title('Model Efficiency Metrics', fontweight='bold')
             ax4.set_ylabel('Efficiency (%)')
             ax4.set_ylim(0, 100)
             
             # Add value labels
-            for bar, value in zip(bars, efficiency_values):
-                ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2,
-                        f'{value}%', ha='center')
+            self._annotate_bars(ax4, bars, efficiency_values, padding=3)
             
             # Chart 5: Detection Quality Analysis
             ax5 = self.axes[1, 1]
@@ -607,19 +1199,19 @@ class AnalyticsDashboardWidget(QWidget):
             ax5.pie(quality_counts, labels=quality_categories, autopct='%1.1f%%', 
                    colors=['green', 'orange', 'red'], startangle=90)
             ax5.set_title('Detection Quality Distribution', fontweight='bold')
+            ax5.set_axis_off()  # pies draw no ticks or spines
             
             # Chart 6: Performance Over Time
             ax6 = self.axes[1, 2]
             time_points = range(10)
             performance_scores = [0.8, 0.82, 0.81, 0.83, 0.85, 0.84, 0.86, 0.87, 0.85, 0.88]
-            ax6.plot(time_points, performance_scores, 'bo-', linewidth=2, markersize=6)
+            _simplify_line_paths(ax6.plot(time_points, performance_scores, 'bo-', linewidth=2, markersize=6))
             ax6.set_title('Model Performance Trend', fontweight='bold')
             ax6.set_ylabel('Performance Score')
             ax6.set_xlabel('Time Period')
             ax6.grid(True, alpha=0.3)
             
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             # Update detailed analysis
             self.comparison_text.setHtml(f"""
@@ -645,287 +1237,236 @@ class AnalyticsDashboardWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Failed to show model performance: {e}")
             self.clear_charts()
+            self._canvas_view = None
             
     def show_comparative_analysis(self):
         """Display comparative analysis tools"""
         try:
-            # Get comparative data
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get data for comparison
-                cursor.execute("""
-                    SELECT COUNT(*) as patient_count FROM patients WHERE is_active = 1
-                """)
-                total_patients = cursor.fetchone()[0]
-                
-                cursor.execute("""
-                    SELECT COUNT(*) as image_count FROM images
-                """)
-                total_images = cursor.fetchone()[0]
-                
-                cursor.execute("""
-                    SELECT COUNT(*) as analysis_count FROM analysis_results WHERE result_status = 'completed'
-                """)
-                total_analyses = cursor.fetchone()[0]
-                
-            # Update summary
-            summary = f"""
-            <h3>Comparative Analysis Tools</h3>
-            <p><b>Comparison Scope:</b> System-wide metrics and benchmarks</p>
-            <p><b>Analysis Period:</b> Last 90 days</p>
-            <p><b>Comparison Categories:</b> Performance, Quality, Efficiency</p>
-            """
-            self.summary_text.setHtml(summary)
-            
-            # Update charts
-            self.clear_charts()
-            
-            # Chart 1: System Comparison
-            ax1 = self.axes[0, 0]
-            categories = ['Patients', 'Images', 'Analyses']
-            values = [total_patients, total_images, total_analyses]
-            target_values = [total_patients * 1.2, total_images * 1.5, total_analyses * 1.3]  # Targets
-            
-            x = np.arange(len(categories))
-            width = 0.35
-            
-            bars1 = ax1.bar(x - width/2, values, width, label='Current', color='lightblue')
-            bars2 = ax1.bar(x + width/2, target_values, width, label='Target', color='lightcoral', alpha=0.7)
-            
-            ax1.set_title('Current vs Target Metrics', fontweight='bold')
-            ax1.set_ylabel('Count')
-            ax1.set_xticks(x)
-            ax1.set_xticklabels(categories)
-            ax1.legend()
-            
-            # # Chart 2: Performance Benchmarks
-            ax2 = self.axes[0, 1]
-            benchmarks = ['Processing Speed', 'Detection Accuracy', 'Memory Efficiency', 'User Satisfaction']   # need to fix
-
-            current_scores = [85, 92, 78, 88]
-            industry_scores = [80, 85, 75, 82]
-            
-            x = np.arange(len(benchmarks))
-            width = 0.35
-            
-            bars1 = ax2.bar(x - width/2, current_scores, width, label='Our System', color='green')
-            bars2 = ax2.bar(x + width/2, industry_scores, width, label='Industry Avg', color='orange', alpha=0.7)
-            
-            ax2.set_title('Performance Benchmarks', fontweight='bold')
-            ax2.set_ylabel('Score (%)')
-            ax2.set_xticks(x)
-            ax2.set_xticklabels(benchmarks, rotation=45, ha='right')
-            ax2.legend()
-            ax2.set_ylim(0, 100)
-            
-            # Chart 3: Quality Comparison
-            ax3 = self.axes[0, 2]
-            quality_metrics = ['Detection Quality', 'Image Quality', 'Report Quality', 'User Experience']   # need to fix
-            quality_scores = [95, 90, 88, 92]
-            
-            bars = ax3.bar(quality_metrics, quality_scores, color='gold')
-            ax3.set_title('Quality Assessment', fontweight='bold')
-            ax3.set_ylabel('Quality Score (%)')
-            ax3.set_ylim(0, 100)
-            
-            # Add value labels
-            for bar, score in zip(bars, quality_scores):
-                ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                        f'{score}%', ha='center')
-            
-            # Chart 4: Efficiency Analysis
-            ax4 = self.axes[1, 0]
-            efficiency_categories = ['Resource Usage', 'Processing Time', 'Storage Efficiency', 'Network Usage']
-            efficiency_scores = [85, 90, 88, 92]
-            
-            wedges, texts, autotexts = ax4.pie(efficiency_scores, labels=efficiency_categories, 
-                                              autopct='%1.1f%%', startangle=90)
-            ax4.set_title('Efficiency Analysis', fontweight='bold')
-            
-            # Chart 5: Trend Comparison
-            ax5 = self.axes[1, 1]
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-            patient_trends = [100, 120, 135, 150, 165, 180]
-            analysis_trends = [200, 240, 280, 320, 360, 400]
-            
-            ax5.plot(months, patient_trends, 'bo-', label='Patients', linewidth=2, markersize=6)
-            ax5.plot(months, analysis_trends, 'ro-', label='Analyses', linewidth=2, markersize=6)
-            ax5.set_title('Growth Trends Comparison', fontweight='bold')
-            ax5.set_ylabel('Count')
-            ax5.legend()
-            ax5.grid(True, alpha=0.3)
-            
-            # Chart 6: ROI Analysis
-            ax6 = self.axes[1, 2]
-            roi_categories = ['Time Savings', 'Cost Reduction', 'Accuracy Improvement', 'Patient Outcomes']
-            roi_values = [40, 35, 50, 45]  # Percentage improvements
-            
-            bars = ax6.bar(roi_categories, roi_values, color=['lightgreen', 'lightblue', 'gold', 'lightcoral'])
-            ax6.set_title('Return on Investment', fontweight='bold')
-            ax6.set_ylabel('Improvement (%)')
-            
-            # Add value labels
-            for bar, value in zip(bars, roi_values):
-                ax6.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                        f'+{value}%', ha='center')
-            
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
-            
-            # Update detailed analysis
-            self.comparison_text.setHtml(f"""
-            <h4>Comparative Analysis Results</h4>
-            <ul>
-            <li>System Performance: Above industry average in 3/4 categories</li>
-            <li>Quality Metrics: Exceeding targets by 15-20%</li>
-            <li>Efficiency Gains: 35-50% improvement in key areas</li>
-            <li>Growth Trajectory: Consistent upward trend</li>
-            </ul>
-            """)
-            
-            self.metrics_text.setHtml(f"""
-            <h4>Competitive Advantages</h4>
-            <ul>
-            <li>Processing Speed: 25% faster than average</li>
-            <li>Detection Accuracy: 7% higher than industry standard</li>
-            <li>User Satisfaction: 92% positive feedback</li>
-            <li>System Reliability: 99.5% uptime</li>
-            </ul>
-            """)
-            
+            # Get comparative data, already shaped for the charts by the fetch worker
+            values, target_values = self._cached("comparative_counts", self._fetch_comparative_counts)
         except Exception as e:
             self.logger.error(f"Failed to show comparative analysis: {e}")
             self.clear_charts()
+            self._canvas_view = None
+            return
             
+        self._render_comparative(values, target_values)
+        
+    def _render_comparative(self, values, target_values):
+        """Draw the Comparative Analysis charts and texts from prepared totals"""
+        # Update summary
+        self.summary_text.setHtml(_COMPARATIVE_HTML)
+        
+        # Build the static charts once per switch into this view, then only update the totals
+        if 'comparative' not in self._artists:
+            self.clear_charts()
+            self._build_comparative_charts()
+        self._update_comparative_charts(values, target_values)
+        
+        self.canvas.draw_idle()
+        
+        # Update detailed analysis
+        self.comparison_text.setHtml(_COMPARATIVE_RESULTS_HTML)
+        self.metrics_text.setHtml(_COMPARATIVE_METRICS_HTML)
+        
+    def _build_comparative_charts(self):
+        """Create the Comparative Analysis charts; only the Chart 1 totals change afterwards"""
+        self._artists['comparative'] = self._render_specs(_COMPARATIVE_SPECS)
+        
+    def _update_comparative_charts(self, values, target_values):
+        """Push new totals into the persistent Comparative Analysis bars"""
+        artists = self._artists['comparative']
+        
+        # Chart 1: System Comparison
+        current_bars, target_bars = artists['comparison_bars']
+        for bar, value in zip(current_bars, values.tolist()):
+            bar.set_height(value)
+        for bar, value in zip(target_bars, target_values.tolist()):
+            bar.set_height(value)
+        ax1 = self.axes[0, 0]
+        ax1.relim()
+        ax1.autoscale_view()
+        
+        # Chart 5: Trend Comparison
+        self._set_trend_data((_PATIENT_TRENDS, _ANALYSIS_TRENDS))
+        
     def show_export_reports(self):
         """Display export report options"""
         try:
             # Get export statistics
-            stats = self.db_manager.get_system_statistics()
-            
-            # Update summary
-            summary = f"""
-            <h3>Export Reports and Data</h3>
-            <p><b>Available Data:</b> {stats.get('total_patients', 0)} patients, {stats.get('total_images', 0)} images</p>
-            <p><b>Export Formats:</b> PDF, Excel, CSV</p>
-            <p><b>Report Types:</b> Diagnostic, Comparative, Trend Analysis</p>
-            <p><b>Data Range:</b> Configurable date ranges and filters</p>
-            """
-            self.summary_text.setHtml(summary)
-            
-            # Update charts with export preview
-            self.clear_charts()
-            
-            # Chart 1: Export Format Distribution
-            ax1 = self.axes[0, 0]
-            formats = ['PDF Reports', 'Excel Data', 'CSV Data', 'JSON Export']
-            export_counts = [150, 89, 234, 67]
-            colors = ['lightblue', 'lightgreen', 'lightcoral', 'gold']
-            
-            bars = ax1.bar(formats, export_counts, color=colors)
-            ax1.set_title('Export Format Usage', fontweight='bold')
-            ax1.set_ylabel('Export Count')
-            ax1.tick_params(axis='x', rotation=45)
-            
-            # Chart 2: Report Type Distribution
-            ax2 = self.axes[0, 1]
-            report_types = ['Diagnostic', 'Follow-up', 'Comparative', 'Research']
-            report_counts = [300, 150, 89, 45]
-            
-            wedges, texts, autotexts = ax2.pie(report_counts, labels=report_types, 
-                                              autopct='%1.1f%%', startangle=90)
-            ax2.set_title('Report Type Distribution', fontweight='bold')
-            
-            # Chart 3: Export Quality Metrics
-            ax3 = self.axes[0, 2]
-            quality_metrics = ['Data Completeness', 'Format Accuracy', 'Export Speed', 'File Size']
-            quality_scores = [98, 95, 92, 88]
-            
-            bars = ax3.bar(quality_metrics, quality_scores, color=['green', 'blue', 'orange', 'red'])
-            ax3.set_title('Export Quality Metrics', fontweight='bold')
-            ax3.set_ylabel('Quality Score (%)')
-            ax3.set_ylim(0, 100)
-            
-            # Add value labels
-            for bar, score in zip(bars, quality_scores):
-                ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                        f'{score}%', ha='center')
-            
-            # Chart 4: Export Performance
-            ax4 = self.axes[1, 0]
-            export_sizes = ['Small (<1MB)', 'Medium (1-10MB)', 'Large (10-100MB)', 'Huge (>100MB)']
-            export_times = [2, 15, 45, 120]  # Average times in seconds
-            
-            bars = ax4.bar(export_sizes, export_times, color=['lightblue', 'lightgreen', 'gold', 'lightcoral'])
-            ax4.set_title('Export Performance by Size', fontweight='bold')
-            ax4.set_ylabel('Average Time (seconds)')
-            ax4.tick_params(axis='x', rotation=45)
-            
-            # Chart 5: Data Export Trends
-            ax5 = self.axes[1, 1]
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-            export_trends = [120, 135, 150, 165, 180, 200]
-            
-            ax5.plot(months, export_trends, 'bo-', linewidth=2, markersize=6)
-            ax5.set_title('Export Trend Analysis', fontweight='bold')
-            ax5.set_ylabel('Number of Exports')
-            ax5.grid(True, alpha=0.3)
-            
-            # Chart 6: Export Compliance
-            ax6 = self.axes[1, 2]
-            compliance_areas = ['HIPAA', 'GDPR', 'Data Integrity', 'Security']
-            compliance_scores = [100, 100, 98, 99]
-            
-            bars = ax6.bar(compliance_areas, compliance_scores, color=['green', 'blue', 'orange', 'red'])
-            ax6.set_title('Export Compliance Status', fontweight='bold')
-            ax6.set_ylabel('Compliance Score (%)')
-            ax6.set_ylim(0, 100)
-            
-            # Add value labels
-            for bar, score in zip(bars, compliance_scores):
-                ax6.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                        f'{score}%', ha='center')
-            
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
-            
-            # Update detailed analysis
-            self.comparison_text.setHtml(f"""
-            <h4>Export Capabilities</h4>
-            <ul>
-            <li>Format Support: PDF, Excel, CSV, JSON</li>
-            <li>Compliance: HIPAA, GDPR compliant</li>
-            <li>Performance: Average export time 45 seconds</li>
-            <li>Quality: 98% data completeness</li>
-            </ul>
-            """)
-            
-            self.metrics_text.setHtml(f"""
-            <h4>Export Statistics</h4>
-            <ul>
-            <li>Total Exports: {sum(export_counts)}</li>
-            <li>Most Popular Format: CSV ({max(export_counts)} exports)</li>
-            <li>Average File Size: 2.5MB</li>
-            <li>Success Rate: 99.2%</li>
-            </ul>
-            """)
-            
+            stats = self._get_system_statistics()
         except Exception as e:
             self.logger.error(f"Failed to show export reports: {e}")
             self.clear_charts()
+            self._canvas_view = None
+            return
             
+        self._render_export_reports(stats.get('total_patients', 0), stats.get('total_images', 0))
+        
+    def _render_export_reports(self, total_patients, total_images):
+        """Draw the Export Reports preview charts and texts"""
+        # Update summary
+        self.summary_text.setHtml(_export_summary_html(total_patients, total_images))
+        
+        # The export preview charts are static; build them once per switch into this view
+        if 'export' not in self._artists:
+            self.clear_charts()
+            self._build_export_charts()
+            
+        self.canvas.draw_idle()
+        
+        # Update detailed analysis
+        self.comparison_text.setHtml(_EXPORT_CAPABILITIES_HTML)
+        self.metrics_text.setHtml(_EXPORT_STATISTICS_HTML)
+        
+    def _build_export_charts(self):
+        """Create the Export Reports preview charts"""
+        self._artists['export'] = self._render_specs(_EXPORT_SPECS)
+        
+    def _render_specs(self, specs):
+        """Draw a view's ChartSpecs; returns the artists of every spec that has a key"""
+        artists = {}
+        axes = self.axes.flat
+        for spec in specs:
+            result = self._render_spec(spec, axes[spec.ax_idx])
+            if spec.key is not None:
+                artists[spec.key] = result
+        return artists
+        
+    def _render_spec(self, spec, ax):
+        """Draw one ChartSpec; returns its bar containers, value labels, lines or pie artists"""
+        if spec.kind == 'pie':
+            result = ax.pie(spec.values, labels=spec.labels, autopct='%1.1f%%', startangle=90)
+            ax.set_title(spec.title, fontweight='bold')
+            ax.set_axis_off()  # pies draw no ticks or spines
+            return result
+            
+        if spec.kind == 'grouped_bar':
+            width = 0.35
+            result = tuple(
+                ax.bar(spec.positions + offset, values, width, label=label, color=color, alpha=alpha)
+                for offset, values, label, color, alpha in zip((-width/2, width/2), spec.values,
+                                                               spec.series_labels, spec.colors, (None, 0.7))
+            )
+            ax.set_xticks(spec.positions)
+            if spec.rotate:
+                ax.set_xticklabels(spec.labels, rotation=45, ha='right')
+            else:
+                ax.set_xticklabels(spec.labels)
+        elif spec.kind == 'line':
+            series_labels = spec.series_labels or ('_nolegend_',) * len(spec.values)
+            result = _simplify_line_paths(tuple(
+                ax.plot(spec.labels, values, style, label=label, linewidth=2, markersize=6,
+                        animated=spec.animated)[0]
+                for values, style, label in zip(spec.values, spec.styles, series_labels)
+            ))
+        else:
+            result = ax.bar(spec.labels, spec.values, color=spec.colors)
+            if spec.rotate:
+                ax.tick_params(axis='x', rotation=45)
+                
+        ax.set_title(spec.title, fontweight='bold')
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel)
+        if spec.series_labels:
+            ax.legend()
+        if spec.ylim is not None:
+            ax.set_ylim(*spec.ylim)
+        if spec.grid:
+            ax.grid(True, alpha=0.3)
+        if spec.annotate is not None:
+            result = self._annotate_bars(ax, result, spec.values, fmt=spec.annotate, padding=spec.padding)
+        return result
+        
+    def _trend_lines(self):
+        """Animated Chart 5 lines of the view currently built on the axes"""
+        for artists in self._artists.values():
+            if 'trend_lines' in artists:
+                return artists['trend_lines']
+        return ()
+        
+    def _on_canvas_draw(self, event):
+        """After a full draw, keep the Chart 5 background and paint the animated trend lines over it"""
+        lines = self._trend_lines()
+        if not lines:
+            self._trend_background = None
+            return
+            
+        ax5 = self.axes[1, 1]
+        self._trend_background = self.canvas.copy_from_bbox(ax5.bbox)
+        for line in lines:
+            ax5.draw_artist(line)
+            
+    def _on_canvas_resize(self, event):
+        """A resized canvas invalidates the saved Chart 5 background"""
+        self._trend_background = None
+        
+    def _set_trend_data(self, series):
+        """Update the Chart 5 trend lines, blitting only that axes when its background is saved"""
+        lines = self._trend_lines()
+        changed = False
+        for line, ydata in zip(lines, series):
+            if not np.array_equal(line.get_ydata(), ydata):
+                line.set_ydata(ydata)
+                _simplify_line_paths((line,))
+                changed = True
+        if not changed:
+            return
+            
+        if self._trend_background is None:
+            self.canvas.draw_idle()
+            return
+            
+        ax5 = self.axes[1, 1]
+        self.canvas.restore_region(self._trend_background)
+        for line in lines:
+            ax5.draw_artist(line)
+        self.canvas.blit(ax5.bbox)
+        
+    def _show_view_axes(self, view, rows, cols):
+        """Make a view's subplot grid current, creating it on first use; other grids are hidden, not cleared"""
+        axes = self._view_axes.get(view)
+        if axes is None or axes.shape != (rows, cols):
+            if axes is not None:
+                for ax in axes.flat:
+                    ax.remove()
+            axes = self._view_axes[view] = self.figure.subplots(rows, cols, squeeze=False)
+            for ax in axes.flat:
+                self._reset_axes(ax)
+            self._view_artists[view] = {}
+            
+        if axes is not self.axes:
+            for other_axes in self._view_axes.values():
+                visible = other_axes is axes
+                for ax in other_axes.flat:
+                    ax.set_visible(visible)
+            self._trend_background = None
+            
+        self.axes = axes
+        self._artists = self._view_artists[view]
+        return axes
+        
+    @staticmethod
+    def _reset_axes(ax):
+        """Restore a cleared axes to the dashboard defaults: axis shown, no minor ticks, tight tick labels"""
+        ax.set_axis_on()
+        ax.minorticks_off()
+        ax.xaxis.set_tick_params(pad=2)
+        
     def clear_charts(self):
-        """Clear all charts"""
+        """Clear the charts of the current view"""
         try:
+            self._artists.clear()
+            if self.axes is None:
+                return
             for ax in self.axes.flat:
                 ax.clear()
+                self._reset_axes(ax)
                 # ax.text(0.5, 0.5, 'Select analysis type to view charts', 
                 #        horizontalalignment='center', verticalalignment='center',
                 #        transform=ax.transAxes, fontsize=12, style='italic')
                 
-            self.figure.tight_layout(pad=3.0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception as e:
             self.logger.error(f"Failed to clear charts: {e}")
             
@@ -957,4 +1498,28 @@ class AnalyticsDashboardWidget(QWidget):
             self.logger.info("CSV export requested")
         except Exception as e:
             self.logger.error(f"Failed to export CSV: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {str(e)}")
\ No newline at end of file
+            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {str(e)}")
+
+
+class AnalyticsWorkerSignals(QObject):
+    """Signals emitted by AnalyticsWorker (QRunnable cannot define signals itself)"""
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(object, str)
+
+
+class AnalyticsWorker(QRunnable):
+    """Thread pool task running one dashboard query off the GUI thread"""
+    
+    def __init__(self, key, fetch):
+        super().__init__()
+        self.key = key
+        self.fetch = fetch
+        self.signals = AnalyticsWorkerSignals()
+        
+    def run(self):
+        """Run the query in background"""
+        try:
+            data = self.fetch()
+            self.signals.finished.emit({'key': self.key, 'data': data})
+        except Exception as e:
+            self.signals.error.emit(self.key, str(e))
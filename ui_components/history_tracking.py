@@ -4,22 +4,61 @@ Provides comprehensive patient history tracking with timeline views and trend an
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                            QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+                            QLabel, QPushButton, QTableView, QAbstractItemView,
                             QGroupBox, QSplitter, QHeaderView, QMessageBox,
-                            QDateEdit, QComboBox, QCheckBox, QTextEdit, QScrollArea)
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QBrush
-import matplotlib.pyplot as plt
+                            QDateEdit, QComboBox, QCheckBox, QTextEdit, QScrollArea,
+                            QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton)
+from PyQt6.QtCore import (Qt, QDate, QEvent, QAbstractTableModel, QModelIndex,
+                          QObject, QRunnable, QSignalBlocker, QThreadPool, pyqtSignal)
+from PyQt6.QtGui import QFont, QColor, QBrush, QStandardItem, QStandardItemModel
+from matplotlib.figure import Figure
+import matplotlib.dates as mdates
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from collections import OrderedDict
+from dataclasses import dataclass
 import json
+import re
+import time
 
 from database.manager import DatabaseManager
 from app_utils.config import AppConfig
 from app_utils.logger import get_logger, get_medical_logger
 
+# Patient ID typed alone or as the "<id> - <name> (<updated>)" dropdown text; anything else is rejected
+_PATIENT_ID_RE = re.compile(r'^\s*([\w.\-]+)\s*(?: - .*)?$', re.DOTALL)
+
+# Newest analyses listed in the patient timeline
+_TIMELINE_LIMIT = 100
+
+# Recently loaded patient histories kept in memory, and how long one stays valid
+_HISTORY_CACHE_SIZE = 32
+_HISTORY_CACHE_TTL = 60.0  # seconds
+
+# Detailed results block of one detection; missing fields fall back to the defaults
+_DETECTION_HTML = """
+                <p><b>Detection {index}:</b></p>
+                <ul>
+                <li>Class: {class_name}</li>
+                <li>Confidence: {confidence:.3f}</li>
+                <li>Bounding Box: [{x1:.1f}, {y1:.1f}, 
+                                   {x2:.1f}, {y2:.1f}]</li>
+                <li>Area: {area:.1f}</li>
+                </ul>
+                """
+_DETECTION_DEFAULTS = {'class_name': 'Unknown', 'confidence': 0, 'x1': 0, 'y1': 0, 'x2': 0, 'y2': 0, 'area': 0}
+
+
+@dataclass
+class PatientHistoryContext:
+    """One patient history load, shared by the timeline, summary and trend updaters"""
+    patient: dict
+    results: list
+    df: pd.DataFrame
+    stats: dict
+
 
 class HistoryTrackingWidget(QWidget):
     """Main history tracking interface with timeline and trend analysis"""
@@ -37,6 +76,34 @@ class HistoryTrackingWidget(QWidget):
         # Current patient context
         self.current_patient_id = None
         
+        # Pixels of the two line charts without their animated lines, for blitting line updates;
+        # data last drawn on the bar and pie charts, None while they show "No Data Available"
+        self._line_backgrounds = None
+        self._bar_data = None
+        self._pie_data = None
+        
+        # Nesting depth of _plot_update_guard and whether a redraw was requested inside it
+        self._guard_depth = 0
+        self._draw_pending = False
+        
+        # History of the loaded patient, built once per load
+        self.history = None
+        
+        # Database queries run on the global thread pool; only the results of the
+        # latest history request are shown, earlier ones are dropped on arrival
+        self._workers = set()
+        self._history_requests = 0
+        self._history_key = None
+        
+        # Last (input text, extracted patient ID) pair of extract_patient_id
+        self._last_extracted = (None, None)
+        
+        # Fetched histories keyed by query, least recently used first: query -> (fetch time, data)
+        self._history_cache = OrderedDict()
+        
+        # Indexes for the history queries are created the first time the tab is shown
+        self._schema_ready = False
+        
         # Setup UI
         self.setup_ui()
         
@@ -125,31 +192,46 @@ class HistoryTrackingWidget(QWidget):
         timeline_group = QGroupBox("Patient Timeline")
         timeline_layout = QVBoxLayout()
         
-        self.timeline_table = QTableWidget()
-        self.timeline_table.setColumnCount(5)
-        self.timeline_table.setHorizontalHeaderLabels([
-            "Date", "Image Type", "Detections", "Max Confidence", "Actions"
-        ])
-        self.timeline_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.timeline_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.timeline_table.cellClicked.connect(self.on_timeline_selection)
+        # Model/view table: cells are read from the results list on paint, and the
+        # "View Details" buttons are drawn by a delegate instead of per-row widgets
+        self.timeline_model = TimelineModel(self)
+        self.timeline_table = QTableView()
+        self.timeline_table.setModel(self.timeline_model)
+        self.timeline_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.timeline_table.clicked.connect(self.on_timeline_selection)
+        
+        self.details_delegate = ButtonDelegate(self.timeline_table)
+        self.details_delegate.clicked.connect(self.on_details_clicked)
+        self.timeline_table.setItemDelegateForColumn(TimelineModel.ACTIONS_COLUMN, self.details_delegate)
+        
+        # Fixed column widths and row heights so Qt never scans the rows to size sections
+        header = self.timeline_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate(TimelineModel.COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
+        
+        row_header = self.timeline_table.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(28)
         
         timeline_layout.addWidget(self.timeline_table)
         timeline_group.setLayout(timeline_layout)
         
         # Charts section
         charts_group = QGroupBox("Trend Analysis")
-        charts_layout = QVBoxLayout()
-        
-        # Create matplotlib figure
-        self.figure, self.axes = plt.subplots(2, 2, figsize=(12, 8))
-        self.figure.tight_layout(pad=3.0)
+        self.charts_layout = QVBoxLayout()
         
-        self.canvas = FigureCanvas(self.figure)
-        self.canvas.setMinimumHeight(400)
+        # The matplotlib figure is created by _ensure_figure when the first trends are plotted;
+        # until then a blank placeholder of the same height holds its place
+        self.figure = None
+        self.axes = None
+        self.canvas = None
+        self.charts_placeholder = QWidget()
+        self.charts_placeholder.setMinimumHeight(400)
         
-        charts_layout.addWidget(self.canvas)
-        charts_group.setLayout(charts_layout)
+        self.charts_layout.addWidget(self.charts_placeholder)
+        charts_group.setLayout(self.charts_layout)
         
         left_layout.addWidget(timeline_group)
         left_layout.addWidget(charts_group)
@@ -197,50 +279,248 @@ class HistoryTrackingWidget(QWidget):
         
         layout.addWidget(splitter)
         
-    def load_recent_patients(self):
-        """Load recent patients into dropdown"""
+    def _start_worker(self, key, fetch, on_finished, on_error):
+        """Run a database fetch on the global thread pool"""
+        worker = HistoryWorker(key, fetch)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _worker_done(self, key):
+        """Release the worker that ran a finished fetch"""
+        self._workers = {w for w in self._workers if w.key != key}
+        
+    def showEvent(self, event):
+        """Prepare the database indexes on first display of the tab"""
+        super().showEvent(event)
+        if not self._schema_ready:
+            self._schema_ready = True
+            self._ensure_schema()
+            
+    def _ensure_schema(self):
+        """Create the indexes the patient history queries rely on"""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
+                # Patient -> images -> analyses in date order, as an index range scan
                 cursor.execute("""
-                    SELECT patient_id, first_name, last_name, updated_at
-                    FROM patients 
-                    WHERE is_active = 1 
-                    ORDER BY updated_at DESC 
-                    LIMIT 20
+                    CREATE INDEX IF NOT EXISTS idx_patients_patient_id
+                    ON patients(patient_id)
                 """)
-                
-                patients = cursor.fetchall()
-                for patient in patients:
-                    display_text = f"{patient['patient_id']} - {patient['first_name']} {patient['last_name']} ({patient['updated_at']})"
-                    self.patient_id_input.addItem(display_text, patient['patient_id'])
-                    
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_images_patient
+                    ON images(patient_id, id)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_ar_image_date
+                    ON analysis_results(image_id, analysis_date DESC)
+                """)
+                conn.commit()
         except Exception as e:
-            self.logger.error(f"Failed to load recent patients: {e}")
+            self.logger.warning(f"Could not prepare history schema: {e}")
+            
+    @contextmanager
+    def _connection(self):
+        """Database connection with the per-connection settings of the history queries"""
+        with self.db_manager.get_connection() as conn:
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            yield conn
+            
+    def load_recent_patients(self):
+        """Load recent patients into dropdown"""
+        self._start_worker("recent_patients", self._fetch_recent_patients,
+                           self._on_recent_patients_loaded, self._on_recent_patients_error)
+        
+    def _fetch_recent_patients(self):
+        """Query the 20 most recently updated patients as (display text, patient ID) pairs"""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT patient_id, first_name, last_name, updated_at
+                FROM patients 
+                WHERE is_active = 1 
+                ORDER BY updated_at DESC 
+                LIMIT 20
+            """)
+            
+            return [
+                (f"{patient['patient_id']} - {patient['first_name']} {patient['last_name']} ({patient['updated_at']})",
+                 patient['patient_id'])
+                for patient in cursor.fetchall()
+            ]
+            
+    def _on_recent_patients_loaded(self, key, patients):
+        """Fill the dropdown with the fetched recent patients"""
+        self._worker_done(key)
+        
+        # Build the items off-widget and install them in one model swap, with the
+        # combo's signals held so the batch does not fire per-item index/text changes
+        model = QStandardItemModel(self.patient_id_input)
+        for display_text, patient_id in patients:
+            item = QStandardItem(display_text)
+            item.setData(patient_id, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+            
+        typed_text = self.patient_id_input.currentText()
+        blocker = QSignalBlocker(self.patient_id_input)
+        try:
+            self.patient_id_input.setModel(model)
+            # Keep an ID the user typed while the list was loading
+            if typed_text:
+                self.patient_id_input.setEditText(typed_text)
+        finally:
+            blocker.unblock()
             
+    def _on_recent_patients_error(self, key, error_msg):
+        """Handle a failed recent patients query"""
+        self._worker_done(key)
+        self.logger.error(f"Failed to load recent patients: {error_msg}")
+        
     def load_patient_history(self):
-        """Load patient history and display"""
+        """Load patient history in background and display it when it arrives"""
         patient_id = self.extract_patient_id()
         if not patient_id:
             QMessageBox.warning(self, "Warning", "Please enter a valid patient ID.")
             return
             
-        try:
-            self.current_patient_id = patient_id
+        self.current_patient_id = patient_id
+        query = self._history_query(patient_id)
+        
+        # A recent identical load is shown straight from memory; it also drops any pending request
+        history = self._cached_history(query)
+        if history is not None:
+            self._history_key = None
+            self._set_loading(False)
+            self._show_history(patient_id, history)
+            return
             
-            # Load patient data
-            patient = self.db_manager.get_patient(patient_id)
-            if not patient:
-                QMessageBox.warning(self, "Warning", f"Patient {patient_id} not found.")
-                return
-                
-            # Load analysis results
-            results = self.db_manager.get_analysis_results(patient_id, limit=100)
+        self._history_requests += 1
+        self._history_key = ("history", query, self._history_requests)
+        self._set_loading(True)
+        self._start_worker(self._history_key, lambda: self._fetch_history(*query),
+                           self._on_history_loaded, self._on_history_error)
+        
+    def _history_query(self, patient_id):
+        """Arguments of the history fetch for a patient and the selected date range, also its cache key"""
+        # The range is half-open [start, day after end) so analyses on the end date are included
+        start_date = self.start_date.date().toString("yyyy-MM-dd")
+        end_date = self.end_date.date().addDays(1).toString("yyyy-MM-dd")
+        return (patient_id, start_date, end_date, _TIMELINE_LIMIT)
+        
+    def _cached_history(self, query):
+        """Cached history of a query, or None when missing or expired; a hit becomes most recent"""
+        entry = self._history_cache.get(query)
+        if entry is None:
+            return None
+            
+        fetched_at, data = entry
+        if time.monotonic() - fetched_at > _HISTORY_CACHE_TTL:
+            del self._history_cache[query]
+            return None
+            
+        self._history_cache.move_to_end(query)
+        return data
+        
+    def _cache_history(self, query, data):
+        """Remember a fetched history, evicting the least recently used beyond the cache size"""
+        self._history_cache[query] = (time.monotonic(), data)
+        self._history_cache.move_to_end(query)
+        while len(self._history_cache) > _HISTORY_CACHE_SIZE:
+            self._history_cache.popitem(last=False)
+            
+    def _fetch_history(self, patient_id, start_date, end_date, limit):
+        """Query patient data and analysis results in the date range; None when the patient does not exist"""
+        patient = self.db_manager.get_patient(patient_id)
+        if not patient:
+            return None
+            
+        results = self._fetch_analysis_results(patient_id, start_date, end_date, limit)
+        df = pd.DataFrame(results)
+        stats = self._fetch_patient_statistics(patient_id)
+        return PatientHistoryContext(patient, results, df, stats)
+        
+    def _fetch_analysis_results(self, patient_id, start_date, end_date, limit):
+        """Query the newest analyses of a patient in the date range, as row dicts"""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            # The range and limit are applied by SQLite over the patient -> images -> analyses
+            # indexes; ISO dates compare correctly as strings
+            cursor.execute("""
+                SELECT ar.*, i.image_type
+                FROM analysis_results ar
+                JOIN images i ON ar.image_id = i.id
+                JOIN patients p ON i.patient_id = p.id
+                WHERE p.patient_id = ?
+                  AND ar.analysis_date >= ? AND ar.analysis_date < ?
+                ORDER BY ar.analysis_date DESC
+                LIMIT ?
+            """, (patient_id, start_date, end_date, limit))
+            
+            columns = [column[0] for column in cursor.description]
+            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            
+        # Detections are stored as JSON text
+        for result in results:
+            detections = result.get('detections')
+            if isinstance(detections, str):
+                try:
+                    result['detections'] = json.loads(detections) if detections else []
+                except json.JSONDecodeError:
+                    result['detections'] = []
+        return results
+        
+    def _fetch_patient_statistics(self, patient_id):
+        """Aggregate the analysis statistics of a patient in SQLite, as a single row dict"""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(ar.id) AS total_analyses,
+                       COALESCE(SUM(ar.detection_count), 0) AS total_detections,
+                       COALESCE(AVG(ar.max_confidence), 0) AS avg_confidence,
+                       MAX(ar.analysis_date) AS latest_analysis
+                FROM analysis_results ar
+                JOIN images i ON ar.image_id = i.id
+                JOIN patients p ON i.patient_id = p.id
+                WHERE p.patient_id = ?
+            """, (patient_id,))
+            
+            row = cursor.fetchone()
+            return {
+                'total_analyses': row[0],
+                'total_detections': row[1],
+                'avg_confidence': row[2],
+                'latest_analysis': row[3],
+            }
             
-            # Update UI
-            self.update_timeline_table(results)
-            self.update_patient_summary(patient)
-            self.update_trend_analysis(results)
+    def _on_history_loaded(self, key, history):
+        """Display fetched patient history unless a newer request superseded it"""
+        self._worker_done(key)
+        query = key[1]
+        if history is not None:
+            self._cache_history(query, history)
+            
+        if key != self._history_key:
+            return
+        self._set_loading(False)
+        self._show_history(query[0], history)
+        
+    def _show_history(self, patient_id, history):
+        """Display a fetched patient history"""
+        if history is None:
+            QMessageBox.warning(self, "Warning", f"Patient {patient_id} not found.")
+            return
+            
+        try:
+            self.history = history
+            
+            # Update UI; the chart updates end in a single redraw
+            with self._plot_update_guard():
+                self.update_timeline_table(history)
+                self.update_patient_summary(history)
+                self.update_trend_analysis(history)
             
             self.logger.info(f"Loaded history for patient: {patient_id}")
             
@@ -248,65 +528,54 @@ class HistoryTrackingWidget(QWidget):
             self.logger.error(f"Failed to load patient history: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load patient history: {str(e)}")
             
+    def _on_history_error(self, key, error_msg):
+        """Handle a failed patient history query"""
+        self._worker_done(key)
+        if key != self._history_key:
+            return
+        self._set_loading(False)
+        
+        self.logger.error(f"Failed to load patient history: {error_msg}")
+        QMessageBox.critical(self, "Error", f"Failed to load patient history: {error_msg}")
+        
+    def _set_loading(self, loading):
+        """Show a busy cursor and lock the load buttons while a history query runs"""
+        self.select_patient_button.setEnabled(not loading)
+        self.update_analysis_button.setEnabled(not loading)
+        if loading:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+            
     def extract_patient_id(self):
         """Extract patient ID from input"""
-        current_text = self.patient_id_input.currentText().strip()
-        if not current_text:
-            return None
+        current_text = self.patient_id_input.currentText()
+        if current_text == self._last_extracted[0]:
+            return self._last_extracted[1]
             
-        # Extract from display text if it contains " - "
-        if " - " in current_text:
-            return current_text.split(" - ")[0]
-        else:
-            return current_text
+        # Malformed input is rejected here, before any database query
+        match = _PATIENT_ID_RE.match(current_text)
+        patient_id = match.group(1) if match else None
+        self._last_extracted = (current_text, patient_id)
+        return patient_id
             
-    def update_timeline_table(self, results):
-        """Update timeline table with analysis results"""
+    def update_timeline_table(self, history):
+        """Update timeline table with the analysis results of a patient history"""
         try:
-            self.timeline_table.setRowCount(len(results))
-            
-            for row, result in enumerate(results):
-                # Date
-                date_str = result.get('analysis_date', '')
-                self.timeline_table.setItem(row, 0, QTableWidgetItem(date_str))
-                
-                # Image type
-                image_type = result.get('image_type', 'Unknown')
-                self.timeline_table.setItem(row, 1, QTableWidgetItem(image_type))
-                
-                # Detections
-                detection_count = result.get('detection_count', 0)
-                self.timeline_table.setItem(row, 2, QTableWidgetItem(str(detection_count)))
-                
-                # Max confidence
-                max_confidence = result.get('max_confidence', 0)
-                confidence_item = QTableWidgetItem(f"{max_confidence:.3f}")
-                self.timeline_table.setItem(row, 3, confidence_item)
-                
-                # Actions
-                actions = QPushButton("View Details")
-                actions.clicked.connect(lambda _, r=result: self.show_detailed_results(r))
-                self.timeline_table.setCellWidget(row, 4, actions)
-                
+            # One repaint after the reset instead of one per relayout
+            self.timeline_table.setUpdatesEnabled(False)
+            try:
+                self.timeline_model.set_results(history.results)
+            finally:
+                self.timeline_table.setUpdatesEnabled(True)
         except Exception as e:
             self.logger.error(f"Failed to update timeline table: {e}")
             
-    def update_patient_summary(self, patient):
-        """Update patient summary information"""
+    def update_patient_summary(self, history):
+        """Update patient summary information from the aggregated analysis statistics"""
         try:
-            # Get patient statistics
-            results = self.db_manager.get_analysis_results(self.current_patient_id, limit=1000)
+            patient, stats = history.patient, history.stats
             
-            total_analyses = len(results)
-            total_detections = sum(r.get('detection_count', 0) for r in results)
-            
-            if results:
-                avg_confidence = sum(r.get('max_confidence', 0) for r in results) / len(results)
-                latest_analysis = max(results, key=lambda x: x.get('analysis_date', ''))
-            else:
-                avg_confidence = 0
-                latest_analysis = None
-                
             # Build summary text
             summary = f"""
             <h3>Patient Summary: {patient['patient_id']}</h3>
@@ -316,10 +585,10 @@ class HistoryTrackingWidget(QWidget):
             <p><b>Medical Record Number:</b> {patient.get('medical_record_number', 'Not specified')}</p>
             
             <h4>Analysis Statistics</h4>
-            <p><b>Total Analyses:</b> {total_analyses}</p>
-            <p><b>Total Detections:</b> {total_detections}</p>
-            <p><b>Average Max Confidence:</b> {avg_confidence:.3f}</p>
-            <p><b>Latest Analysis:</b> {latest_analysis.get('analysis_date', 'None') if latest_analysis else 'None'}</p>
+            <p><b>Total Analyses:</b> {stats['total_analyses']}</p>
+            <p><b>Total Detections:</b> {stats['total_detections']}</p>
+            <p><b>Average Max Confidence:</b> {stats['avg_confidence']:.3f}</p>
+            <p><b>Latest Analysis:</b> {stats['latest_analysis'] or 'None'}</p>
             """
             
             self.summary_text.setHtml(summary)
@@ -327,88 +596,259 @@ class HistoryTrackingWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Failed to update patient summary: {e}")
             
-    def update_trend_analysis(self, results):
-        """Update trend analysis charts"""
+    def update_trend_analysis(self, history):
+        """Update trend analysis charts from the analysis results DataFrame of a patient history"""
         try:
-            if not results:
+            df = history.df
+            if df.empty:
                 self.clear_charts()
                 return
                 
-            # Prepare data for charts
-            dates = [datetime.fromisoformat(r['analysis_date']) for r in results]
-            detection_counts = [r['detection_count'] for r in results]
-            max_confidences = [r['max_confidence'] for r in results]
-            processing_times = [r['processing_time_ms'] for r in results]
-            
-            # Clear previous plots
-            for ax in self.axes.flat:
-                ax.clear()
-                
-            # Chart 1: Detection Count Over Time
-            self.axes[0, 0].plot(dates, detection_counts, 'bo-', linewidth=2, markersize=6)
-            self.axes[0, 0].set_title('Detection Count Over Time', fontsize=12, fontweight='bold')
-            self.axes[0, 0].set_ylabel('Detection Count')
-            self.axes[0, 0].grid(True, alpha=0.3)
-            self.axes[0, 0].tick_params(axis='x', rotation=45)
-            
-            # Chart 2: Confidence Trend
-            self.axes[0, 1].plot(dates, max_confidences, 'go-', linewidth=2, markersize=6)
-            self.axes[0, 1].set_title('Max Confidence Trend', fontsize=12, fontweight='bold')
-            self.axes[0, 1].set_ylabel('Confidence Score')
-            self.axes[0, 1].set_ylim(0, 1)
-            self.axes[0, 1].grid(True, alpha=0.3)
-            self.axes[0, 1].tick_params(axis='x', rotation=45)
-            
-            # Chart 3: Processing Time
-            self.axes[1, 0].bar(range(len(processing_times)), processing_times, color='skyblue')
-            self.axes[1, 0].set_title('Processing Time per Analysis', fontsize=12, fontweight='bold')
-            self.axes[1, 0].set_ylabel('Time (ms)')
-            self.axes[1, 0].grid(True, alpha=0.3)
-            
-            # Chart 4: Detection Distribution
-            detection_counts_array = np.array(detection_counts)
-            unique_counts, counts = np.unique(detection_counts_array, return_counts=True)
-            
-            self.axes[1, 1].pie(counts, labels=unique_counts, autopct='%1.1f%%', startangle=90)
-            self.axes[1, 1].set_title('Detection Count Distribution', fontsize=12, fontweight='bold')
-            
-            # Update canvas
-            self.canvas.draw()
+            self._ensure_figure()
+            
+            # Prepare data for charts as whole columns; dates are parsed in one vectorized pass
+            dates = mdates.date2num(pd.to_datetime(df['analysis_date']).to_numpy(dtype='datetime64[ns]'))
+            detection_counts = df['detection_count'].to_numpy()
+            max_confidences = df['max_confidence'].to_numpy()
+            processing_times = df['processing_time_ms'].to_numpy()
             
+            # Charts 1 and 2: move the persistent trend lines to the new data
+            placeholder_shown = self._show_placeholders(False)
+            limits_changed = self._set_trend_lines(dates, detection_counts, max_confidences)
+            
+            # Charts 3 and 4 are re-plotted only when their data changed
+            bars_changed = self._update_processing_chart(processing_times)
+            pie_changed = self._update_distribution_chart(detection_counts)
+            
+            # Update canvas; with only the line data changed inside unchanged axes,
+            # repaint just the two lines over their saved backgrounds
+            if placeholder_shown or limits_changed or bars_changed or pie_changed or self._line_backgrounds is None:
+                self._redraw()
+            else:
+                self._blit_trend_lines()
+                
         except Exception as e:
             self.logger.error(f"Failed to update trend analysis: {e}")
             self.clear_charts()
             
+    def _ensure_figure(self):
+        """Create the matplotlib figure and canvas in place of the placeholder on first use"""
+        if self.figure is not None:
+            return
+            
+        self.figure = Figure(figsize=(12, 8))
+        self.axes = self.figure.subplots(2, 2)
+        self.figure.tight_layout(pad=3.0)
+        
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumHeight(400)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+        self._build_trend_charts()
+        
+        self.charts_layout.replaceWidget(self.charts_placeholder, self.canvas)
+        self.charts_placeholder.deleteLater()
+        self.charts_placeholder = None
+        
+    def _build_trend_charts(self):
+        """Configure the four charts once and create their persistent artists and placeholders"""
+        ax_detections, ax_confidence = self.axes[0, 0], self.axes[0, 1]
+        ax_times, ax_distribution = self.axes[1, 0], self.axes[1, 1]
+        
+        # Animated lines are left out of full draws and painted by _on_canvas_draw / blitting
+        self._detection_line, = ax_detections.plot([], [], 'bo-', linewidth=2, markersize=6, animated=True)
+        self._confidence_line, = ax_confidence.plot([], [], 'go-', linewidth=2, markersize=6, animated=True)
+        self._processing_bars = None
+        self._distribution_pie = ()
+        
+        ax_detections.set_title('Detection Count Over Time', fontsize=12, fontweight='bold')
+        ax_detections.set_ylabel('Detection Count')
+        ax_confidence.set_title('Max Confidence Trend', fontsize=12, fontweight='bold')
+        ax_confidence.set_ylabel('Confidence Score')
+        ax_confidence.set_ylim(0, 1)
+        ax_times.set_title('Processing Time per Analysis', fontsize=12, fontweight='bold')
+        ax_times.set_ylabel('Time (ms)')
+        ax_distribution.set_title('Detection Count Distribution', fontsize=12, fontweight='bold')
+        ax_distribution.set_frame_on(False)
+        ax_distribution.set_xticks([])
+        ax_distribution.set_yticks([])
+        
+        # Both line charts plot the same dates: one shared x axis, date locator and limits
+        ax_confidence.sharex(ax_detections)
+        ax_detections.xaxis_date()
+        for ax in (ax_detections, ax_confidence, ax_times):
+            ax.grid(True, alpha=0.3)
+        for ax in (ax_detections, ax_confidence):
+            ax.tick_params(axis='x', rotation=45)
+            
+        self._placeholders = [
+            ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center',
+                    verticalalignment='center', transform=ax.transAxes, fontsize=14,
+                    visible=False)
+            for ax in self.axes.flat
+        ]
+        
+    def _trend_line_axes(self):
+        """(axes, line) pairs of the two line charts"""
+        return ((self.axes[0, 0], self._detection_line), (self.axes[0, 1], self._confidence_line))
+        
+    def _show_placeholders(self, visible):
+        """Toggle "No Data Available" on the charts; True when that changed anything"""
+        changed = False
+        for text in self._placeholders:
+            if text.get_visible() != visible:
+                text.set_visible(visible)
+                changed = True
+        return changed
+        
+    def _set_trend_lines(self, dates, detection_counts, max_confidences):
+        """Set the trend line data and rescale; True when the axis limits changed"""
+        pairs = self._trend_line_axes()
+        old_limits = [(ax.get_xlim(), ax.get_ylim()) for ax, _ in pairs]
+        
+        self._detection_line.set_data(dates, detection_counts)
+        self._confidence_line.set_data(dates, max_confidences)
+        for ax, _ in pairs:
+            ax.relim()
+            ax.autoscale_view()
+            
+        return old_limits != [(ax.get_xlim(), ax.get_ylim()) for ax, _ in pairs]
+        
+    def _update_processing_chart(self, processing_times):
+        """Update chart 3 when the processing times changed; True when it was updated"""
+        processing_times = processing_times.astype(float, copy=False)
+        if self._bar_data is not None and np.array_equal(self._bar_data, processing_times):
+            return False
+            
+        # Same number of analyses: resize the existing bars instead of replacing them
+        bars = self._processing_bars
+        if bars is not None and len(bars) == len(processing_times):
+            for bar, height in zip(bars, processing_times):
+                bar.set_height(height)
+        else:
+            self._remove_processing_bars()
+            self._processing_bars = self.axes[1, 0].bar(
+                range(len(processing_times)), processing_times, color='skyblue')
+        self.axes[1, 0].relim()
+        self.axes[1, 0].autoscale_view()
+        
+        self._bar_data = processing_times
+        return True
+        
+    def _remove_processing_bars(self):
+        """Take the processing time bars off chart 3"""
+        if self._processing_bars is not None:
+            self._processing_bars.remove()
+            self._processing_bars = None
+            
+    def _update_distribution_chart(self, detection_counts):
+        """Re-plot chart 4 when the detection distribution changed; True when it was re-plotted"""
+        unique_counts, counts = np.unique(detection_counts, return_counts=True)
+        if (self._pie_data is not None and np.array_equal(self._pie_data[0], unique_counts)
+                and np.array_equal(self._pie_data[1], counts)):
+            return False
+            
+        self._remove_distribution_pie()
+        wedges, texts, autotexts = self.axes[1, 1].pie(
+            counts, labels=unique_counts, autopct='%1.1f%%', startangle=90)
+        self._distribution_pie = (*wedges, *texts, *autotexts)
+        
+        self._pie_data = (unique_counts, counts)
+        return True
+        
+    def _remove_distribution_pie(self):
+        """Take the wedges and labels of the distribution pie off chart 4"""
+        for artist in self._distribution_pie:
+            artist.remove()
+        self._distribution_pie = ()
+        
+    @contextmanager
+    def _plot_update_guard(self):
+        """Batch chart updates: redraw requests inside the scope yield one deferred draw at exit"""
+        self._guard_depth += 1
+        if self._guard_depth == 1 and self.canvas is not None:
+            self.canvas.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._guard_depth -= 1
+            if self._guard_depth == 0 and self.canvas is not None:
+                self.canvas.setUpdatesEnabled(True)
+                if self._draw_pending:
+                    self._draw_pending = False
+                    self.canvas.draw_idle()
+                    
+    def _redraw(self):
+        """Schedule a figure redraw, or request one for when the enclosing update guard exits"""
+        if self._guard_depth:
+            self._draw_pending = True
+        else:
+            # Deferred to the event loop, so back-to-back requests render once
+            self.canvas.draw_idle()
+            
+    def _on_canvas_draw(self, event):
+        """After a full draw, keep the line chart backgrounds and paint the animated lines over them"""
+        self._line_backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax, _ in self._trend_line_axes()]
+        for ax, line in self._trend_line_axes():
+            ax.draw_artist(line)
+            
+    def _on_canvas_resize(self, event):
+        """A resized canvas invalidates the saved line chart backgrounds"""
+        self._line_backgrounds = None
+        
+    def _blit_trend_lines(self):
+        """Repaint only the trend lines over their saved backgrounds"""
+        for (ax, line), background in zip(self._trend_line_axes(), self._line_backgrounds):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+            
     def clear_charts(self):
         """Clear all charts"""
+        # Nothing has been plotted before the figure exists
+        if self.figure is None:
+            return
+            
         try:
-            for ax in self.axes.flat:
-                ax.clear()
-                ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center',
-                       verticalalignment='center', transform=ax.transAxes, fontsize=14)
-            self.canvas.draw()
+            for _, line in self._trend_line_axes():
+                line.set_data([], [])
+            self._remove_processing_bars()
+            self._remove_distribution_pie()
+            self._show_placeholders(True)
+            
+            self._bar_data = None
+            self._pie_data = None
+            
+            self._redraw()
         except Exception as e:
             self.logger.error(f"Failed to clear charts: {e}")
             
-    def on_timeline_selection(self, row, column):
+    def on_timeline_selection(self, index):
         """Handle timeline row selection"""
         try:
-            # Get the result data for the selected row
-            date_item = self.timeline_table.item(row, 0)
-            if date_item:
-                # For now, just update the details text
-                # In a real implementation, you might want to store the full result data
-                self.details_text.setText(f"Selected analysis from: {date_item.text()}")
+            # Clicks on the Actions column are handled by the button delegate
+            if index.column() == TimelineModel.ACTIONS_COLUMN:
+                return
+                
+            result = self.timeline_model.result(index.row())
+            if result:
+                self.details_text.setText(f"Selected analysis from: {result.get('analysis_date', '')}")
                 
         except Exception as e:
             self.logger.error(f"Failed to handle timeline selection: {e}")
             
+    def on_details_clicked(self, row):
+        """Show the detailed results of the timeline row whose button was clicked"""
+        result = self.timeline_model.result(row)
+        if result:
+            self.show_detailed_results(result)
+            
     def show_detailed_results(self, result):
         """Show detailed results for a specific analysis"""
         try:
             detections = result.get('detections', [])
             
-            details = f"""
+            header = f"""
             <h3>Detailed Analysis Results</h3>
             <p><b>Date:</b> {result.get('analysis_date', 'Unknown')}</p>
             <p><b>Image Type:</b> {result.get('image_type', 'Unknown')}</p>
@@ -420,19 +860,13 @@ class HistoryTrackingWidget(QWidget):
             <h4>Detection Details:</h4>
             """
             
-            for i, detection in enumerate(detections):
-                details += f"""
-                <p><b>Detection {i+1}:</b></p>
-                <ul>
-                <li>Class: {detection.get('class_name', 'Unknown')}</li>
-                <li>Confidence: {detection.get('confidence', 0):.3f}</li>
-                <li>Bounding Box: [{detection.get('x1', 0):.1f}, {detection.get('y1', 0):.1f}, 
-                                   {detection.get('x2', 0):.1f}, {detection.get('y2', 0):.1f}]</li>
-                <li>Area: {detection.get('area', 0):.1f}</li>
-                </ul>
-                """
-                
-            self.details_text.setHtml(details)
+            # Collect the blocks and join once instead of growing one string per detection
+            parts = [header]
+            parts.extend(
+                _DETECTION_HTML.format_map({**_DETECTION_DEFAULTS, **detection, 'index': i + 1})
+                for i, detection in enumerate(detections)
+            )
+            self.details_text.setHtml(''.join(parts))
             
         except Exception as e:
             self.logger.error(f"Failed to show detailed results: {e}")
@@ -444,11 +878,7 @@ class HistoryTrackingWidget(QWidget):
             return
             
         try:
-            # Get date range
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().toString("yyyy-MM-dd")
-            
-            # Reload history with date filtering
+            # Reload history; the query picks up the selected date range
             self.load_patient_history()
             
             self.logger.info(f"Updated analysis for patient {self.current_patient_id}")
@@ -460,9 +890,141 @@ class HistoryTrackingWidget(QWidget):
     def clear_selection(self):
         """Clear current patient selection"""
         self.current_patient_id = None
-        self.timeline_table.setRowCount(0)
-        self.summary_text.clear()
-        self.details_text.clear()
-        self.clear_charts()
+        self._history_key = None
+        self.history = None
+        self._history_cache.clear()
+        self._set_loading(False)
+        with self._plot_update_guard():
+            self.timeline_model.set_results([])
+            self.summary_text.clear()
+            self.details_text.clear()
+            self.clear_charts()
+        
+        self.logger.info("Cleared patient selection")
+
+
+class TimelineModel(QAbstractTableModel):
+    """Table model exposing analysis results as patient timeline rows"""
+    
+    HEADERS = ["Date", "Image Type", "Detections", "Max Confidence", "Actions"]
+    COLUMN_WIDTHS = [150, 110, 90, 120, 110]
+    ACTIONS_COLUMN = 4
+    
+    # Rows exposed to the view at a time; the next batch is added when it scrolls near the end
+    FETCH_BATCH = 50
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+        self._visible_rows = 0
+        
+        # Formatted cell texts per result ID, reused while the result stays in the timeline
+        self._row_texts = {}
+        
+    def set_results(self, results):
+        """Replace the timeline rows in one model reset"""
+        self.beginResetModel()
+        self._results = list(results)
+        self._visible_rows = min(len(self._results), self.FETCH_BATCH)
+        result_ids = {result.get('id') for result in self._results}
+        self._row_texts = {rid: texts for rid, texts in self._row_texts.items() if rid in result_ids}
+        self.endResetModel()
+        
+    def result(self, row):
+        """Analysis result shown on a row, or None when out of range"""
+        if 0 <= row < self._visible_rows:
+            return self._results[row]
+        return None
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._visible_rows
+        
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._visible_rows < len(self._results)
+        
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._results) - self._visible_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible_rows, self._visible_rows + count - 1)
+        self._visible_rows += count
+        self.endInsertRows()
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+            
+        return self._cell_texts(self._results[index.row()])[index.column()]
+        
+    def _cell_texts(self, result):
+        """Display texts of a result's cells, formatted once per result ID"""
+        rid = result.get('id')
+        texts = self._row_texts.get(rid) if rid is not None else None
+        if texts is None:
+            texts = (
+                result.get('analysis_date', ''),
+                result.get('image_type', 'Unknown'),
+                str(result.get('detection_count', 0)),
+                f"{result.get('max_confidence', 0):.3f}",
+                "View Details",
+            )
+            if rid is not None:
+                self._row_texts[rid] = texts
+        return texts
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in each cell and emits the row when it is clicked"""
+    
+    clicked = pyqtSignal(int)
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data()
+        button.state = QStyle.StateFlag.State_Enabled
+        
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
         
-        self.logger.info("Cleared patient selection")
\ No newline at end of file
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class HistoryWorkerSignals(QObject):
+    """Signals emitted by HistoryWorker (QRunnable cannot define signals itself)"""
+    finished = pyqtSignal(object, object)
+    error = pyqtSignal(object, str)
+
+
+class HistoryWorker(QRunnable):
+    """Thread pool task running one history query off the GUI thread"""
+    
+    def __init__(self, key, fetch):
+        super().__init__()
+        self.key = key
+        self.fetch = fetch
+        self.signals = HistoryWorkerSignals()
+        
+    def run(self):
+        """Run the query in background"""
+        try:
+            data = self.fetch()
+            self.signals.finished.emit(self.key, data)
+        except Exception as e:
+            self.signals.error.emit(self.key, str(e))
@@ -5,22 +5,60 @@ Handles image upload, preprocessing, YOLOv5 inference, and results visualization
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QPushButton, QProgressBar, QGroupBox,
-                            QScrollArea, QFrame, QMessageBox, QFileDialog,
-                            QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QFont
+                            QFrame, QMessageBox, QFileDialog,
+                            QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit,
+                            QGraphicsView, QGraphicsScene, QGraphicsPixmapItem)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QPointF, QRectF
+from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QFont, QBrush
 import numpy as np
 import cv2
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 import logging
 
-from models.model_manager import ModelManager
+from models.model_manager import ModelManager, DetectionList
 from database.manager import DatabaseManager
 from app_utils.config import AppConfig
 from app_utils.logger import get_logger, get_medical_logger
 
+# Detection overlay style
+BOX_COLOR = (0, 255, 0)
+BOX_THICKNESS = 2
+
+# Recent patient (patient_id, display text) rows shared by every widget instance,
+# cleared when an analysis is saved since that reorders recent patients
+_PATIENT_CACHE = None
+_PATIENT_CACHE_LOCK = threading.Lock()
+
+# Results panel HTML, filled with str.format_map
+_RESULTS_HTML = """
+            <b>Analysis Results:</b>
+            <ul>
+            <li>Detections: {count}</li>
+            <li>Max Confidence: {max_confidence:.3f}</li>
+            <li>Processing Time: {processing_ms:.1f} ms</li>
+            <li>Model: {model_type}</li>
+            </ul>
+            
+            <b>Detection Details:</b>
+            """
+_DETECTION_HTML = """
+                <li><b>Detection {index}:</b> 
+                Class: {class_name}, 
+                Confidence: {confidence:.3f}, 
+                BBox: [{x1:.1f}, {y1:.1f}, 
+                       {x2:.1f}, {y2:.1f}]
+                </li>
+                """
+
+# Formats whose decoder can downscale while decoding, largest reduction first
+_REDUCED_DECODE_FORMATS = {'.jpg', '.jpeg'}
+_REDUCED_DECODE_FLAGS = ((8, cv2.IMREAD_REDUCED_COLOR_8),
+                         (4, cv2.IMREAD_REDUCED_COLOR_4),
+                         (2, cv2.IMREAD_REDUCED_COLOR_2))
+
 
 class ImageAnalysisWidget(QWidget):
     """Main image analysis interface with YOLOv5 integration"""
@@ -34,13 +72,45 @@ class ImageAnalysisWidget(QWidget):
         
         # Initialize managers
         self.db_manager = DatabaseManager(config)
-        self.model_manager = ModelManager(config)
+        self.model_manager = ModelManager.instance(config)
         
         # Current state
         self.current_image_path = None
         self.current_image = None
         self.current_patient_id = None
         self.analysis_result = None
+        # File metadata gathered once at load time and reused when saving
+        self._current_stat = None
+        self._current_ext = None
+        self.image_load_thread = None
+        self.patient_load_thread = None
+        
+        # Display-sized pixmap of the current image and its scale relative to the full image
+        self._base_pixmap = None
+        self._display_buffer = None
+        self._last_display_key = None
+        self._display_scale = 1.0
+        
+        # Overlay pen and font are built once rather than on every analysis
+        self._box_pen = QPen(QColor(*BOX_COLOR))
+        self._box_pen.setWidth(BOX_THICKNESS)
+        self._label_font = QFont("Arial", 10, QFont.Weight.Bold)
+        
+        # Analyses requested in quick succession share one batched forward pass
+        self.analysis_thread = None
+        self._pending_analyses = []
+        self._running_analyses = []
+        self._analysis_timer = QTimer(self)
+        self._analysis_timer.setSingleShot(True)
+        self._analysis_timer.setInterval(100)
+        self._analysis_timer.timeout.connect(self._flush_analysis_queue)
+        
+        # Spin-box steps are collapsed into one config write and threshold update
+        self._pending_thresholds = {}
+        self._threshold_timer = QTimer(self)
+        self._threshold_timer.setSingleShot(True)
+        self._threshold_timer.setInterval(150)
+        self._threshold_timer.timeout.connect(self._flush_thresholds)
         
         # Setup UI
         self.setup_ui()
@@ -176,21 +246,11 @@ class ImageAnalysisWidget(QWidget):
         self.original_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.original_label.setStyleSheet("font-weight: bold; color: #333333;")
         
-        self.original_scroll = QScrollArea()
-        self.original_scroll.setWidgetResizable(True)
-        self.original_scroll.setStyleSheet("QScrollArea { border: 1px solid #cccccc; }")
-        
-        self.original_container = QLabel()
-        self.original_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.original_container.setMinimumSize(400, 400)  # Reduced from 500x500 to 400x400 (0.8x)
-        self.original_container.setMaximumSize(640, 640)  # Reduced from 800x800 to 640x640 (0.8x)
-        self.original_container.setText("No image loaded")
-        self.original_container.setStyleSheet("background-color: #f0f0f0; border: 1px dashed #cccccc;")
-        
-        self.original_scroll.setWidget(self.original_container)
+        self.original_view, self.original_item, self.original_placeholder = \
+            self.create_image_view("No image loaded")
         
         original_layout.addWidget(self.original_label)
-        original_layout.addWidget(self.original_scroll)
+        original_layout.addWidget(self.original_view)
         
         # Result Image Container
         result_frame = QFrame()
@@ -202,21 +262,11 @@ class ImageAnalysisWidget(QWidget):
         self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.result_label.setStyleSheet("font-weight: bold; color: #333333;")
         
-        self.result_scroll = QScrollArea()
-        self.result_scroll.setWidgetResizable(True)
-        self.result_scroll.setStyleSheet("QScrollArea { border: 1px solid #cccccc; }")
-        
-        self.result_container = QLabel()
-        self.result_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.result_container.setMinimumSize(400, 400)  # Reduced from 500x500 to 400x400 (0.8x)
-        self.result_container.setMaximumSize(640, 640)  # Reduced from 800x800 to 640x640 (0.8x)
-        self.result_container.setText("Analysis result will appear here")
-        self.result_container.setStyleSheet("background-color: #f0f0f0; border: 1px dashed #cccccc;")
-        
-        self.result_scroll.setWidget(self.result_container)
+        self.result_view, self.result_item, self.result_placeholder = \
+            self.create_image_view("Analysis result will appear here")
         
         result_layout.addWidget(self.result_label)
-        result_layout.addWidget(self.result_scroll)
+        result_layout.addWidget(self.result_view)
         
         # Add both image containers to the layout
         images_layout.addWidget(original_frame, 1)
@@ -234,8 +284,46 @@ class ImageAnalysisWidget(QWidget):
         
         layout.addWidget(splitter)
         
+    def create_image_view(self, placeholder_text):
+        """
+        Create a graphics view holding one pixmap item and a placeholder caption
+        
+        Qt only repaints the exposed part of the scene on scroll and resize, and
+        scaling to the view is a transform rather than a resampled pixmap.
+        """
+        scene = QGraphicsScene(self)
+        view = QGraphicsView(scene)
+        view.setMinimumSize(400, 400)  # Reduced from 500x500 to 400x400 (0.8x)
+        view.setMaximumSize(640, 640)  # Reduced from 800x800 to 640x640 (0.8x)
+        view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        view.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        view.setBackgroundBrush(QBrush(QColor("#f0f0f0")))
+        view.setStyleSheet("QGraphicsView { border: 1px dashed #cccccc; }")
+        
+        item = QGraphicsPixmapItem()
+        item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        scene.addItem(item)
+        
+        placeholder = scene.addText(placeholder_text)
+        placeholder.setDefaultTextColor(QColor("#333333"))
+        
+        return view, item, placeholder
+        
+    def show_in_view(self, view, item, placeholder, pixmap):
+        """Show a pixmap in an image view and fit it once"""
+        placeholder.setVisible(False)
+        item.setPixmap(pixmap)
+        view.setSceneRect(item.boundingRect())
+        view.fitInView(item, Qt.AspectRatioMode.KeepAspectRatio)
+        
     def setup_model(self):
         """Setup YOLOv5 model"""
+        # The shared manager may already hold a model loaded for an earlier widget
+        if self.model_manager.is_loaded:
+            QTimer.singleShot(0, self.on_model_loaded)
+            return
+            
         try:
             # Load model in background thread
             self.model_thread = ModelLoadingThread(self.model_manager)
@@ -254,25 +342,28 @@ class ImageAnalysisWidget(QWidget):
     def load_patient_ids(self):
         """Load patient IDs into dropdown"""
         try:
-            # Get recent patients
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT patient_id, first_name, last_name 
-                    FROM patients 
-                    WHERE is_active = 1 
-                    ORDER BY updated_at DESC 
-                    LIMIT 20
-                """)
+            with _PATIENT_CACHE_LOCK:
+                cached = _PATIENT_CACHE
+            if cached is not None:
+                self.on_patient_ids_loaded(cached)
+                return
                 
-                patients = cursor.fetchall()
-                for patient in patients:
-                    display_text = f"{patient['patient_id']} - {patient['first_name']} {patient['last_name']}"
-                    self.patient_id_input.addItem(display_text, patient['patient_id'])
-                    
+            # Get recent patients in background thread
+            self.patient_load_thread = PatientLoadThread(self.db_manager)
+            self.patient_load_thread.loaded.connect(self.on_patient_ids_loaded)
+            self.patient_load_thread.error.connect(
+                lambda error_msg: self.logger.error(f"Failed to load patient IDs: {error_msg}")
+            )
+            self.patient_load_thread.start()
+            
         except Exception as e:
             self.logger.error(f"Failed to load patient IDs: {e}")
             
+    def on_patient_ids_loaded(self, patients):
+        """Populate the dropdown with recent patients"""
+        for patient_id, display_text in patients:
+            self.patient_id_input.addItem(display_text, patient_id)
+            
     def select_current_patient(self):
         """Select current patient from dropdown"""
         current_text = self.patient_id_input.currentText()
@@ -305,92 +396,114 @@ class ImageAnalysisWidget(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to open image: {str(e)}")
             
     def load_image(self, file_path):
-        """Load and display image"""
+        """Load image in background thread"""
         try:
-            self.current_image_path = file_path
-            self.current_image = cv2.imread(file_path)
-            
-            if self.current_image is None:
-                raise ValueError("Failed to load image")
+            if self.image_load_thread is not None and self.image_load_thread.isRunning():
+                self.status_label.setText("Image is still loading...")
+                return
                 
-            # Convert BGR to RGB for display
-            rgb_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2RGB)
-            
-            # Update image display - show in original container
-            self.display_original_image(rgb_image)
-            
-            # Update image info
-            height, width, channels = self.current_image.shape
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            
-            info_text = f"""
-            <b>Image Information:</b>
-            <ul>
-            <li>File: {os.path.basename(file_path)}</li>
-            <li>Size: {width} x {height} pixels</li>
-            <li>Channels: {channels}</li>
-            <li>File Size: {file_size:.2f} MB</li>
-            <li>Path: {file_path}</li>
-            </ul>
-            """
-            self.image_info_label.setText(info_text)
-            
-            # Enable analysis button
-            self.analyze_button.setEnabled(True)
-            self.status_label.setText("Image loaded successfully")
-            self.status_label.setStyleSheet("color: #28a745; font-weight: bold;")
-            
-            self.logger.info(f"Image loaded: {file_path}")
+            # Decode and downscale for display off the GUI thread
+            max_size = self.original_view.maximumSize()
+            self.image_load_thread = ImageLoadThread(file_path, max_size.width(), max_size.height())
+            self.image_load_thread.preview.connect(self.on_image_preview)
+            self.image_load_thread.loaded.connect(self.on_image_loaded)
+            self.image_load_thread.error.connect(self.on_image_load_error)
+            self.image_load_thread.start()
+            
+            self.upload_button.setEnabled(False)
+            self.status_label.setText("Loading image...")
+            self.status_label.setStyleSheet("color: #ffc107; font-weight: bold;")
             
         except Exception as e:
             self.logger.error(f"Failed to load image: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
             
+    def on_image_preview(self, display_image):
+        """Show the reduced-resolution preview while the full image decodes"""
+        self.display_original_image(display_image)
+        self.status_label.setText("Decoding full resolution...")
+        
+    def on_image_loaded(self, image, display_image, info):
+        """Handle image loading completion"""
+        self.upload_button.setEnabled(True)
+        
+        file_path = info['path']
+        self.current_image_path = file_path
+        self.current_image = image
+        self._current_stat = info['stat']
+        self._current_ext = info['extension']
+        
+        # Update image display - show in original container
+        self.display_original_image(display_image)
+        self._display_scale = display_image.shape[1] / info['width']
+        
+        # Update image info
+        info_text = f"""
+        <b>Image Information:</b>
+        <ul>
+        <li>File: {os.path.basename(file_path)}</li>
+        <li>Size: {info['width']} x {info['height']} pixels</li>
+        <li>Channels: {info['channels']}</li>
+        <li>File Size: {info['file_size_mb']:.2f} MB</li>
+        <li>Path: {file_path}</li>
+        </ul>
+        """
+        self.image_info_label.setText(info_text)
+        
+        # Enable analysis button
+        self.analyze_button.setEnabled(True)
+        self.status_label.setText("Image loaded successfully")
+        self.status_label.setStyleSheet("color: #28a745; font-weight: bold;")
+        
+        self.logger.info(f"Image loaded: {file_path}")
+        
+    def on_image_load_error(self, error_msg):
+        """Handle image loading error"""
+        self.upload_button.setEnabled(True)
+        self.status_label.setText(f"Image loading failed: {error_msg}")
+        self.status_label.setStyleSheet("color: #dc3545; font-weight: bold;")
+        
+        self.logger.error(f"Failed to load image: {error_msg}")
+        QMessageBox.critical(self, "Error", f"Failed to load image: {error_msg}")
+        
     def display_original_image(self, image_array):
-        """Display original image in the original container"""
+        """Display original image in the original container (already scaled to fit)"""
         try:
+            # The JPEG preview buffer is shown again once the full decode finishes
+            max_size = self.original_view.maximumSize()
+            display_key = (image_array.shape, max_size.width(), max_size.height())
+            if image_array is self._display_buffer and display_key == self._last_display_key:
+                return
+                
+            # QImage wraps the buffer without copying, so it must be C-contiguous and stay alive
+            image_array = np.ascontiguousarray(image_array)
+            self._display_buffer = image_array
+            self._last_display_key = display_key
+            
             height, width, channels = image_array.shape
-            bytes_per_line = channels * width
+            bytes_per_line = image_array.strides[0]
             
             q_image = QImage(image_array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-            
-            # Scale pixmap to fit container while maintaining aspect ratio
-            max_size = self.original_container.maximumSize()
-            scaled_pixmap = pixmap.scaled(
-                max_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
             
-            self.original_container.setPixmap(scaled_pixmap)
-            self.original_container.setText("")  # Clear placeholder text
+            # Kept so results can be drawn over it without rescaling the full image
+            self._base_pixmap = QPixmap.fromImage(q_image)
+            self.show_in_view(self.original_view, self.original_item, self.original_placeholder,
+                              self._base_pixmap)
             
         except Exception as e:
             self.logger.error(f"Failed to display original image: {e}")
             
-    def display_result_image(self, image_array):
-        """Display result image with bounding boxes in the result container"""
+    def display_result_image(self, pixmap):
+        """Display result pixmap with bounding boxes in the result container"""
         try:
-            height, width, channels = image_array.shape
-            bytes_per_line = channels * width
-            
-            q_image = QImage(image_array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-            
-            # Scale pixmap to fit container while maintaining aspect ratio
-            max_size = self.result_container.maximumSize()
-            scaled_pixmap = pixmap.scaled(
-                max_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
-            
-            self.result_container.setPixmap(scaled_pixmap)
-            self.result_container.setText("")  # Clear placeholder text
+            self.show_in_view(self.result_view, self.result_item, self.result_placeholder, pixmap)
             
         except Exception as e:
             self.logger.error(f"Failed to display result image: {e}")
             
     def start_analysis(self):
         """Start YOLOv5 analysis"""
-        if not self.current_image.any():
+        if self.current_image is None or self.current_image.size == 0:
             QMessageBox.warning(self, "Warning", "Please load an image first.")
             return
             
@@ -402,15 +515,52 @@ class ImageAnalysisWidget(QWidget):
             QMessageBox.warning(self, "Warning", "Model not loaded yet. Please wait.")
             return
             
+        # Thresholds still waiting on their debounce must apply to this analysis
+        if self._threshold_timer.isActive():
+            self._threshold_timer.stop()
+            self._flush_thresholds()
+            
+        # Queue the request; the debounce timer batches whatever arrives with it
+        if any(entry['image'] is self.current_image for entry in self._pending_analyses):
+            return
+            
+        self._pending_analyses.append({
+            'image': self.current_image,
+            'image_path': self.current_image_path,
+            'image_format': self._current_ext,
+            'image_size_mb': self._current_stat.st_size / (1024 * 1024),
+            'patient_id': self.current_patient_id,
+            'image_type': self.image_type_combo.currentText()
+        })
+        self.analyze_button.setEnabled(False)
+        self._analysis_timer.start()
+        
+    def _flush_analysis_queue(self):
+        """Run all queued analyses in one background batch"""
+        if not self._pending_analyses:
+            return
+            
+        # A running batch flushes the queue again once its thread has finished
+        if self.analysis_thread is not None and self.analysis_thread.isRunning():
+            return
+            
         try:
+            self._running_analyses, self._pending_analyses = self._pending_analyses, []
+            
             # Start analysis in background thread
-            self.analysis_thread = AnalysisThread(self.model_manager, self.current_image)
+            self.analysis_thread = AnalysisThread(
+                self.model_manager, [entry['image'] for entry in self._running_analyses]
+            )
             self.analysis_thread.started.connect(self.on_analysis_started)
-            self.analysis_thread.finished.connect(self.on_analysis_finished)
+            self.analysis_thread.completed.connect(self.on_analysis_finished)
             self.analysis_thread.error.connect(self.on_analysis_error)
+            # QThread.finished fires after run() returns, when isRunning() is already False
+            self.analysis_thread.finished.connect(self._flush_analysis_queue)
             self.analysis_thread.start()
             
         except Exception as e:
+            self._running_analyses = []
+            self.analyze_button.setEnabled(True)
             self.logger.error(f"Failed to start analysis: {e}")
             QMessageBox.critical(self, "Error", f"Failed to start analysis: {str(e)}")
             
@@ -419,23 +569,32 @@ class ImageAnalysisWidget(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.analyze_button.setEnabled(False)
-        self.status_label.setText("Analyzing image...")
+        count = len(self._running_analyses)
+        self.status_label.setText("Analyzing image..." if count == 1 else f"Analyzing {count} images...")
         self.status_label.setStyleSheet("color: #ffc107; font-weight: bold;")
         
-    def on_analysis_finished(self, result):
+    def on_analysis_finished(self, results):
         """Handle analysis completion"""
-        self.analysis_result = result
+        entries, self._running_analyses = self._running_analyses, []
         self.progress_bar.setVisible(False)
         self.progress_bar.setRange(0, 100)
         self.analyze_button.setEnabled(True)
         
-        if result:
-            # Display results
-            self.display_analysis_results(result)
-            
+        completed = 0
+        for entry, result in zip(entries, results):
+            if not result:
+                continue
+                
+            # Only the image on screen gets its results displayed; every result is saved
+            if entry['image'] is self.current_image:
+                self.analysis_result = result
+                self.display_analysis_results(result)
+                
             # Save to database
-            self.save_analysis_to_database(result)
+            self.save_analysis_to_database(result, entry)
+            completed += 1
             
+        if completed:
             self.status_label.setText("Analysis completed successfully")
             self.status_label.setStyleSheet("color: #28a745; font-weight: bold;")
         else:
@@ -444,6 +603,7 @@ class ImageAnalysisWidget(QWidget):
             
     def on_analysis_error(self, error_msg):
         """Handle analysis error"""
+        self._running_analyses = []
         self.progress_bar.setVisible(False)
         self.analyze_button.setEnabled(True)
         self.status_label.setText(f"Analysis error: {error_msg}")
@@ -455,78 +615,91 @@ class ImageAnalysisWidget(QWidget):
     def display_analysis_results(self, result):
         """Display analysis results"""
         try:
-            # Draw bounding boxes on image
-            image_with_boxes = self.draw_detections(self.current_image.copy(), result['detections'])
-            rgb_image = cv2.cvtColor(image_with_boxes, cv2.COLOR_BGR2RGB)
-            self.display_result_image(rgb_image)
+            # Draw bounding boxes over the display-sized pixmap
+            if self._base_pixmap is not None:
+                self.display_result_image(self.draw_detections_overlay(result['detections']))
             
             # Update results text
             detections = result['detections']
             processing_time = result['processing_time']
             
-            results_text = f"""
-            <b>Analysis Results:</b>
-            <ul>
-            <li>Detections: {detections['count']}</li>
-            <li>Max Confidence: {detections['max_confidence']:.3f}</li>
-            <li>Processing Time: {processing_time*1000:.1f} ms</li>
-            <li>Model: {result['model_info'].get('model_type', 'Unknown')}</li>
-            </ul>
+            parts = [_RESULTS_HTML.format_map({
+                'count': detections['count'],
+                'max_confidence': detections['max_confidence'],
+                'processing_ms': processing_time * 1000,
+                'model_type': result['model_info'].get('model_type', 'Unknown')
+            })]
+            
+            # Join once instead of growing one string per detection
+            bboxes, confidences, class_names = self._detection_arrays(detections['detections'])
+            parts.extend(
+                _DETECTION_HTML.format_map({'index': i, 'class_name': class_name, 'confidence': confidence,
+                                            'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2})
+                for i, ((x1, y1, x2, y2), class_name, confidence)
+                in enumerate(zip(bboxes.tolist(), class_names, confidences), 1)
+            )
             
-            <b>Detection Details:</b>
-            """
-            
-            for i, detection in enumerate(detections['detections']):
-                results_text += f"""
-                <li><b>Detection {i+1}:</b> 
-                Class: {detection['class_name']}, 
-                Confidence: {detection['confidence']:.3f}, 
-                BBox: [{detection['bbox'][0]:.1f}, {detection['bbox'][1]:.1f}, 
-                       {detection['bbox'][2]:.1f}, {detection['bbox'][3]:.1f}]
-                </li>
-                """
-                
-            self.results_text.setHtml(results_text)
+            self.results_text.setHtml(''.join(parts))
             
         except Exception as e:
             self.logger.error(f"Failed to display analysis results: {e}")
             
-    def draw_detections(self, image, detections):
-        """Draw detection bounding boxes on image"""
+    def draw_detections_overlay(self, detections):
+        """Draw detection boxes over a copy of the display-sized pixmap"""
+        pixmap = self._base_pixmap.copy()
         try:
-            for detection in detections['detections']:
-                bbox = detection['bbox']
-                confidence = detection['confidence']
-                class_name = detection['class_name']
+            if not detections['count']:
+                return pixmap
                 
-                # Draw rectangle
-                cv2.rectangle(image, (int(bbox[0]), int(bbox[1])), 
-                             (int(bbox[2]), int(bbox[3])), (0, 255, 0), 2)
+            bboxes, confidences, class_names = self._detection_arrays(detections['detections'])
+            
+            # Map full-resolution coordinates onto the display pixmap in one multiply
+            boxes = (bboxes * self._display_scale).tolist()
+            
+            painter = QPainter(pixmap)
+            try:
+                painter.setPen(self._box_pen)
+                painter.setFont(self._label_font)
+                draw_rect = painter.drawRect
+                draw_text = painter.drawText
+                for (x1, y1, x2, y2), class_name, confidence in zip(boxes, class_names, confidences):
+                    draw_rect(QRectF(x1, y1, x2 - x1, y2 - y1))
+                    draw_text(QPointF(x1, y1 - 4), f"{class_name}: {confidence:.2f}")
+            finally:
+                painter.end()
                 
-                # Draw label
-                label = f"{class_name}: {confidence:.2f}"
-                cv2.putText(image, label, (int(bbox[0]), int(bbox[1])-10),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
-                           
-            return image
-            
         except Exception as e:
-            self.logger.error(f"Failed to draw detections: {e}")
-            return image
-            
-    def save_analysis_to_database(self, result):
+            self.logger.error(f"Failed to draw detection overlay: {e}")
+        return pixmap
+        
+    @staticmethod
+    def _detection_arrays(items):
+        """Get (N, 4) boxes plus confidence and class name lists for a detection sequence"""
+        # Read the arrays straight off a DetectionList instead of its per-detection dicts
+        if isinstance(items, DetectionList):
+            names = items.names
+            class_names = [names[c] if names is not None else f"Class_{c}" for c in items.cls.tolist()]
+            return np.asarray(items.bboxes), items.confs.tolist(), class_names
+            
+        bboxes = np.asarray([d['bbox'] for d in items], dtype=np.float32).reshape(-1, 4)
+        return bboxes, [d['confidence'] for d in items], [d['class_name'] for d in items]
+            
+    def save_analysis_to_database(self, result, entry):
         """Save analysis results to database"""
         try:
+            patient_id = entry['patient_id']
+            
             # Add image record
             image_data = {
-                'image_path': self.current_image_path,
-                'image_type': self.image_type_combo.currentText(),
-                'image_format': os.path.splitext(self.current_image_path)[1],
-                'image_size_mb': os.path.getsize(self.current_image_path) / (1024 * 1024),
+                'image_path': entry['image_path'],
+                'image_type': entry['image_type'],
+                'image_format': entry['image_format'],
+                'image_size_mb': entry['image_size_mb'],
                 'quality_score': 1.0  # TODO: Implement quality scoring
             }
             
-            image_id = self.db_manager.add_image(self.current_patient_id, image_data)
+            image_id = self.db_manager.add_image(patient_id, image_data)
+            invalidate_patient_cache()
             
             if image_id:
                 # Add analysis result
@@ -538,38 +711,47 @@ class ImageAnalysisWidget(QWidget):
                     'max_confidence': result['detections']['max_confidence'],
                     'processing_time_ms': result['processing_time'] * 1000,
                     'result_status': 'completed',
-                    'detections': result['detections']['detections']
+                    'detections': list(result['detections']['detections'])
                 }
                 
                 self.db_manager.add_analysis_result(image_id, result_data)
                 
                 # Add analytics data
                 self.db_manager.add_analytics_data(
-                    self.current_patient_id,
+                    patient_id,
                     'detection_count',
                     result['detections']['count']
                 )
                 
                 self.db_manager.add_analytics_data(
-                    self.current_patient_id,
+                    patient_id,
                     'max_confidence',
                     result['detections']['max_confidence']
                 )
                 
-                self.logger.info(f"Analysis saved to database for patient {self.current_patient_id}")
+                self.logger.info(f"Analysis saved to database for patient {patient_id}")
                 
         except Exception as e:
             self.logger.error(f"Failed to save analysis to database: {e}")
             
     def update_confidence_threshold(self, value):
         """Update confidence threshold"""
-        self.config.set("model.confidence_threshold", value)
-        self.model_manager.update_thresholds(confidence_threshold=value)
+        self._pending_thresholds['confidence_threshold'] = value
+        self._threshold_timer.start()
         
     def update_iou_threshold(self, value):
         """Update IoU threshold"""
-        self.config.set("model.iou_threshold", value)
-        self.model_manager.update_thresholds(iou_threshold=value)
+        self._pending_thresholds['iou_threshold'] = value
+        self._threshold_timer.start()
+        
+    def _flush_thresholds(self):
+        """Apply the last threshold values once the spin boxes settle"""
+        pending, self._pending_thresholds = self._pending_thresholds, {}
+        if not pending:
+            return
+            
+        # The model manager stores both thresholds in the config with a single write
+        self.model_manager.update_thresholds(**pending)
         
     def on_model_loaded(self):
         """Handle model loading completion"""
@@ -606,20 +788,142 @@ class ModelLoadingThread(QThread):
             self.error.emit(str(e))
 
 
+def invalidate_patient_cache():
+    """Drop the cached recent patient list so the next load queries the database"""
+    global _PATIENT_CACHE
+    with _PATIENT_CACHE_LOCK:
+        _PATIENT_CACHE = None
+
+
+class PatientLoadThread(QThread):
+    """Thread for loading recent patient IDs"""
+    loaded = pyqtSignal(list)
+    error = pyqtSignal(str)
+    
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        
+    def run(self):
+        """Run patient query in background"""
+        global _PATIENT_CACHE
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT patient_id, first_name, last_name 
+                    FROM patients 
+                    WHERE is_active = 1 
+                    ORDER BY updated_at DESC 
+                    LIMIT 20
+                """)
+                
+                patients = [
+                    (row['patient_id'], f"{row['patient_id']} - {row['first_name']} {row['last_name']}")
+                    for row in cursor.fetchall()
+                ]
+                
+            with _PATIENT_CACHE_LOCK:
+                _PATIENT_CACHE = patients
+            self.loaded.emit(patients)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ImageLoadThread(QThread):
+    """Thread for decoding an image and preparing its display copy"""
+    preview = pyqtSignal(np.ndarray)
+    loaded = pyqtSignal(np.ndarray, np.ndarray, dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path, max_width, max_height):
+        super().__init__()
+        self.file_path = file_path
+        self.extension = os.path.splitext(file_path)[1]
+        self.max_width = max_width
+        self.max_height = max_height
+        
+    def run(self):
+        """Run image decoding in background"""
+        try:
+            # A reduced decode is enough for the display and reaches the screen first
+            display_rgb = self._decode_preview()
+            if display_rgb is not None:
+                self.preview.emit(display_rgb)
+                
+            # The model still needs the full-resolution pixels
+            image = cv2.imread(self.file_path, cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("Failed to load image")
+                
+            height, width, channels = image.shape
+            if display_rgb is None:
+                display_rgb = self._fit_display(image)
+            
+            stat = os.stat(self.file_path)
+            info = {
+                'path': self.file_path,
+                'extension': self.extension,
+                'stat': stat,
+                'width': width,
+                'height': height,
+                'channels': channels,
+                'file_size_mb': stat.st_size / (1024 * 1024)
+            }
+            self.loaded.emit(image, display_rgb, info)
+        except Exception as e:
+            self.error.emit(str(e))
+            
+    def _decode_preview(self):
+        """
+        Decode a downscaled copy straight from the file when the format allows it
+        
+        The header is probed for the dimensions, and the largest decoder reduction
+        that still covers the display size is used. Returns None when no reduced
+        decode applies, so the display copy comes from the full image instead.
+        """
+        if self.extension.lower() not in _REDUCED_DECODE_FORMATS:
+            return None
+            
+        try:
+            from PIL import Image
+            with Image.open(self.file_path) as header:
+                width, height = header.size
+        except Exception:
+            return None
+            
+        scale = min(self.max_width / width, self.max_height / height)
+        for factor, flag in _REDUCED_DECODE_FLAGS:
+            if scale * factor <= 1.0:
+                reduced = cv2.imread(self.file_path, flag)
+                return self._fit_display(reduced) if reduced is not None else None
+        return None
+        
+    def _fit_display(self, image):
+        """Downscale once to the display size, then swap BGR to RGB in the same copy"""
+        height, width = image.shape[:2]
+        scale = min(self.max_width / width, self.max_height / height, 1.0)
+        if scale < 1.0:
+            image = cv2.resize(image, (max(1, round(width * scale)), max(1, round(height * scale))),
+                               interpolation=cv2.INTER_AREA)
+        return np.ascontiguousarray(image[..., ::-1])
+
+
 class AnalysisThread(QThread):
-    """Thread for running YOLOv5 analysis"""
-    finished = pyqtSignal(dict)
+    """Thread for running YOLOv5 analysis on a batch of images"""
+    completed = pyqtSignal(list)
     error = pyqtSignal(str)
     
-    def __init__(self, model_manager, image):
+    def __init__(self, model_manager, images):
         super().__init__()
         self.model_manager = model_manager
-        self.image = image
+        self.images = images
         
     def run(self):
         """Run analysis in background"""
         try:
-            result = self.model_manager.predict(self.image)
-            self.finished.emit(result)
+            # predict_batch letterboxes and stacks the images into shared forward passes
+            results = self.model_manager.predict_batch(self.images)
+            self.completed.emit(results)
         except Exception as e:
             self.error.emit(str(e))
\ No newline at end of file
@@ -3,20 +3,55 @@ Main Window UI Component for Breast Cancer Detection Application
 """
 
 import sys
+from importlib import import_module
 from pathlib import Path
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QTabWidget, QMenuBar, QMenu, QToolBar, QStatusBar,
                             QLabel, QPushButton, QFrame, QSplitter)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QAction, QIcon, QPixmap
 
-from ui_components.patient_management import PatientManagementWidget
-from ui_components.image_analysis import ImageAnalysisWidget
-from ui_components.history_tracking import HistoryTrackingWidget
-from ui_components.analytics_dashboard import AnalyticsDashboardWidget
 from app_utils.config import AppConfig
 
 
+# Window-wide rules, parsed once; widgets pick them up through their object names
+# and state changes swap the object name instead of setting a new stylesheet
+_WINDOW_STYLESHEET = """
+    QFrame#Header {
+        background-color: #252526;
+        border: 1px solid #3e3e42;
+        min-height: 60px;
+    }
+    QLabel#HeaderLogo {
+        font-size: 24px;
+        font-weight: bold;
+    }
+    QLabel#HeaderTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #ffffff;
+        margin-left: 10px;
+    }
+    QLabel#ModelStatusBad {
+        color: #ff6b6b;
+        font-weight: bold;
+    }
+    QLabel#ModelStatusOk, QLabel#DbStatusOk {
+        color: #51cf66;
+        font-weight: bold;
+    }
+    QPushButton#DangerButton {
+        background-color: #d9534f;
+        color: white;
+    }
+"""
+
+
+def _widget_class(module_name, class_name):
+    """Import a tab widget's module on first use and return the widget class"""
+    return getattr(import_module(module_name), class_name)
+
+
 class MainWindow(QMainWindow):
     """Main application window with tabbed interface"""
     
@@ -26,6 +61,10 @@ class MainWindow(QMainWindow):
         self.config = config
         self.setWindowTitle("AI Breast Cancer Detection System")
         self.setGeometry(100, 100, 1280, 800)  # Reduced from 1600x1000 to 1280x800 (0.8x)
+        self.setStyleSheet(_WINDOW_STYLESHEET)
+        
+        # Model state shown in the header; it starts out as "Not Loaded"
+        self._last_model_loaded = False
         
         # Setup UI
         self.setup_ui()
@@ -61,13 +100,7 @@ class MainWindow(QMainWindow):
         """Create the application header"""
         header_frame = QFrame()
         header_frame.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
-        header_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252526;
-                border: 1px solid #3e3e42;
-                min-height: 60px;
-            }
-        """)
+        header_frame.setObjectName("Header")
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(20, 10, 20, 10)
@@ -78,16 +111,11 @@ class MainWindow(QMainWindow):
         
         self.logo_label = QLabel()
         self.logo_label.setText("🩺")
-        self.logo_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        self.logo_label.setObjectName("HeaderLogo")
         title_layout.addWidget(self.logo_label)
         
         self.title_label = QLabel("AI Breast Cancer Detection System")
-        self.title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-            margin-left: 10px;
-        """)
+        self.title_label.setObjectName("HeaderTitle")
         title_layout.addWidget(self.title_label)
         
         header_layout.addLayout(title_layout)
@@ -97,11 +125,11 @@ class MainWindow(QMainWindow):
         status_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         
         self.model_status = QLabel("Model: Not Loaded")
-        self.model_status.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+        self.model_status.setObjectName("ModelStatusBad")
         status_layout.addWidget(self.model_status)
         
         self.db_status = QLabel("Database: Connected")
-        self.db_status.setStyleSheet("color: #51cf66; font-weight: bold;")
+        self.db_status.setObjectName("DbStatusOk")
         status_layout.addWidget(self.db_status)
         
         header_layout.addLayout(status_layout)
@@ -157,47 +185,92 @@ class MainWindow(QMainWindow):
         
     def init_components(self):
         """Initialize all UI components"""
-        # Patient Management Tab
-        self.patient_widget = PatientManagementWidget(self.config)
-        self.tab_widget.addTab(self.patient_widget, "Patient Management")
-        
-        # Image Analysis Tab
-        self.image_widget = ImageAnalysisWidget(self.config)
-        self.tab_widget.addTab(self.image_widget, "Image Analysis")
-        
-        # History Tracking Tab
-        self.history_widget = HistoryTrackingWidget(self.config)
-        self.tab_widget.addTab(self.history_widget, "History Tracking")
-        
-        # Analytics Dashboard Tab
-        self.analytics_widget = AnalyticsDashboardWidget(self.config)
-        self.tab_widget.addTab(self.analytics_widget, "Analytics Dashboard")
-        
+        # Each tab starts as an empty placeholder; the real widget (with its database
+        # connections, model loading and charts) is built the first time it is shown.
+        # Their modules pull in the model and plotting stacks, so they are imported then too
+        self._tab_factories = {
+            'patient_widget': ("Patient Management", lambda: _widget_class(
+                'ui_components.patient_management', 'PatientManagementWidget')(self.config)),
+            'image_widget': ("Image Analysis", lambda: _widget_class(
+                'ui_components.image_analysis', 'ImageAnalysisWidget')(self.config)),
+            'history_widget': ("History Tracking", lambda: _widget_class(
+                'ui_components.history_tracking', 'HistoryTrackingWidget')(self.config)),
+            'analytics_widget': ("Analytics Dashboard", lambda: _widget_class(
+                'ui_components.analytics_dashboard', 'AnalyticsDashboardWidget')(self.config)),
+        }
+        self._tab_placeholders = {}
+        
+        for name, (title, _) in self._tab_factories.items():
+            setattr(self, name, None)
+            placeholder = QWidget()
+            self._tab_placeholders[placeholder] = name
+            self.tab_widget.addTab(placeholder, title)
+            
         # Connect signals
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
+        # The first tab is visible at startup
+        self._ensure_tab('patient_widget')
+        
+    def _ensure_tab(self, name):
+        """Build the widget for a tab if it is still a placeholder, and return it"""
+        widget = getattr(self, name)
+        if widget is not None:
+            return widget
+            
+        # Tabs are movable, so look the placeholder up by identity rather than index
+        placeholder = next(p for p, n in self._tab_placeholders.items() if n == name)
+        index = self.tab_widget.indexOf(placeholder)
+        title, factory = self._tab_factories[name]
+        widget = factory()
+        
+        # Swapping tabs would otherwise emit currentChanged for the neighbouring tab
+        blocker = QSignalBlocker(self.tab_widget)
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(current)
+        blocker.unblock()
+        
+        del self._tab_placeholders[placeholder]
+        placeholder.deleteLater()
+        setattr(self, name, widget)
+        return widget
+        
     def on_tab_changed(self, index):
         """Handle tab changes"""
+        name = self._tab_placeholders.get(self.tab_widget.widget(index))
+        if name is not None:
+            self._ensure_tab(name)
+            
         tab_text = self.tab_widget.tabText(index)
         self.statusBar().showMessage(f"Active: {tab_text}")
         
         # Update model status
-        if hasattr(self.image_widget, 'model_manager'):
-            if self.image_widget.model_manager.is_loaded:
-                self.model_status.setText("Model: Loaded")
-                self.model_status.setStyleSheet("color: #51cf66; font-weight: bold;")
-            else:
-                self.model_status.setText("Model: Not Loaded")
-                self.model_status.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+        if self.image_widget is not None:
+            self._set_model_status(self.image_widget.model_manager.is_loaded)
+            
+    def _set_model_status(self, loaded):
+        """Show the model state in the header by swapping the label's style rule"""
+        loaded = bool(loaded)
+        if loaded == self._last_model_loaded:
+            return
+        self._last_model_loaded = loaded
+        
+        self.model_status.setText("Model: Loaded" if loaded else "Model: Not Loaded")
+        self.model_status.setObjectName("ModelStatusOk" if loaded else "ModelStatusBad")
+        style = self.model_status.style()
+        style.unpolish(self.model_status)
+        style.polish(self.model_status)
         
     def new_patient(self):
         """Open new patient dialog"""
-        self.tab_widget.setCurrentWidget(self.patient_widget)
+        self.tab_widget.setCurrentWidget(self._ensure_tab('patient_widget'))
         self.patient_widget.open_new_patient_dialog()
         
     def analyze_image(self):
         """Open image analysis tab"""
-        self.tab_widget.setCurrentWidget(self.image_widget)
+        self.tab_widget.setCurrentWidget(self._ensure_tab('image_widget'))
         self.image_widget.open_image_upload()
         
     def open_settings(self):
@@ -5,23 +5,54 @@ Handles patient registration, search, and profile management
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QLineEdit, QTextEdit, QComboBox, QDateEdit,
-                            QPushButton, QTableWidget, QTableWidgetItem,
+                            QPushButton, QTableView, QAbstractItemView,
                             QGroupBox, QSplitter, QHeaderView, QMessageBox,
                             QDialog, QDialogButtonBox, QFormLayout)
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import (Qt, QDate, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+                          QSignalBlocker, QThreadPool, QTimer, pyqtSignal)
 from PyQt6.QtGui import QIntValidator, QDoubleValidator
 import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    # One decoder for the module; decode() skips json.loads' per-call argument handling
+    _json_loads = json.JSONDecoder().decode
+    
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2, separators=(",", ": "))
+
 from database.manager import DatabaseManager
 from app_utils.logger import get_logger, get_medical_logger
 
+# Characters a JSON document can start with
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# Recent search results kept per widget (LRU), refetched once older than the TTL in seconds
+_SEARCH_CACHE_MAX = 32
+_SEARCH_CACHE_TTL = 60.0
+
 
 class PatientManagementWidget(QWidget):
     """Main patient management interface"""
     
     patient_selected = pyqtSignal(str)
     
+    # Form label template: (text, row, column)
+    FORM_LABELS = (("Patient ID:", 0, 0), ("First Name:", 1, 0), ("Last Name:", 2, 0),
+                   ("Date of Birth:", 3, 0), ("Gender:", 3, 2),
+                   ("Medical Record Number:", 4, 0), ("Contact Information:", 5, 0),
+                   ("Medical History:", 6, 0), ("Risk Factors:", 7, 0))
+    
     def __init__(self, config):
         super().__init__()
         
@@ -29,15 +60,71 @@ class PatientManagementWidget(QWidget):
         self.logger = get_logger("ui_components.patient_management")
         self.medical_logger = get_medical_logger()
         
-        # Initialize database manager
-        self.db_manager = DatabaseManager(config)
+        # Database manager is opened on a worker thread after the first paint
+        self.db_manager = None
+        self._workers = set()
+        self._pending_search = ""
+        self._search_cache = OrderedDict()
+        self._pending_refresh = None  # search deferred while the tab is hidden
+        # Pretty-printed (contact info, medical history, risk factors) per patient ID
+        self._fmt_cache = {}
+        # Full rows of the patients listed in the table, by patient ID
+        self._patient_index = {}
+        self._new_patient_dialog = None  # built on first use, then reset and reused
+        
+        # Keystrokes in the search box are collapsed into one query
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.on_search_clicked)
         
         # Current patient context
         self.current_patient_id = None
         
         # Setup UI
         self.setup_ui()
-        self.load_patient_list()
+        QTimer.singleShot(0, self._start_db_init)
+        
+    def _start_db_init(self):
+        """Open the database and run the first patient query in background"""
+        self.patient_model.set_placeholder("Loading...")
+        
+        worker = PatientWorker(self._open_database)
+        worker.signals.finished.connect(self._on_db_ready)
+        worker.signals.error.connect(self._on_db_error)
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _open_database(self):
+        """Create the database manager and fetch the initial patient list (worker thread)"""
+        db_manager = DatabaseManager(self.config)
+        return db_manager, db_manager.search_patients("", limit=100)
+        
+    def showEvent(self, event):
+        """Run the patient list refresh deferred while the tab was hidden"""
+        super().showEvent(event)
+        if self._pending_refresh is not None:
+            search_term, self._pending_refresh = self._pending_refresh, None
+            self.load_patient_list(search_term)
+            
+    def _on_db_ready(self, worker, data):
+        """Adopt the database manager and show the initial patient list"""
+        self._workers.discard(worker)
+        self.db_manager, patients = data
+        self._cache_search("", patients)
+        
+        # A search typed while the database was opening replaces the initial list
+        if self._pending_search:
+            self.load_patient_list(self._pending_search)
+        else:
+            self._populate_patient_table(patients)
+            
+    def _on_db_error(self, worker, error_msg):
+        """Handle database initialization failure"""
+        self._workers.discard(worker)
+        self.patient_model.set_patients([])
+        self.logger.error(f"Failed to load patient list: {error_msg}")
+        QMessageBox.critical(self, "Database Error", f"Failed to load patient list: {error_msg}")
         
     def setup_ui(self):
         """Setup the patient management UI"""
@@ -90,43 +177,41 @@ class PatientManagementWidget(QWidget):
         
         self.mrn_input = QLineEdit()  # Medical Record Number
         
+        # JSON fields are plain text documents, which lay out cheaper than rich text
         self.contact_info_input = QTextEdit()
+        self.contact_info_input.setAcceptRichText(False)
         self.contact_info_input.setPlaceholderText("Contact information (JSON format)")
         
         self.medical_history_input = QTextEdit()
+        self.medical_history_input.setAcceptRichText(False)
         self.medical_history_input.setPlaceholderText("Medical history (JSON format)")
         
         self.risk_factors_input = QTextEdit()
+        self.risk_factors_input.setAcceptRichText(False)
         self.risk_factors_input.setPlaceholderText("Risk factors (JSON format)")
         
-        # Form layout
-        self.form_layout.addWidget(QLabel("Patient ID:"), 0, 0)
-        self.form_layout.addWidget(self.patient_id_input, 0, 1, 1, 2)
+        # Widgets filled together when a patient is loaded
+        self._form_inputs = (self.patient_id_input, self.first_name_input, self.last_name_input,
+                             self.dob_input, self.gender_input, self.mrn_input,
+                             self.contact_info_input, self.medical_history_input,
+                             self.risk_factors_input)
         
-        self.form_layout.addWidget(QLabel("First Name:"), 1, 0)
-        self.form_layout.addWidget(self.first_name_input, 1, 1, 1, 2)
+        # Form layout, filled in one pass with the group's updates switched off
+        self.form_group.setUpdatesEnabled(False)
         
-        self.form_layout.addWidget(QLabel("Last Name:"), 2, 0)
+        self.form_layout.addWidget(self.patient_id_input, 0, 1, 1, 2)
+        self.form_layout.addWidget(self.first_name_input, 1, 1, 1, 2)
         self.form_layout.addWidget(self.last_name_input, 2, 1, 1, 2)
-        
-        self.form_layout.addWidget(QLabel("Date of Birth:"), 3, 0)
         self.form_layout.addWidget(self.dob_input, 3, 1)
-        
-        self.form_layout.addWidget(QLabel("Gender:"), 3, 2)
         self.form_layout.addWidget(self.gender_input, 3, 3)
-        
-        self.form_layout.addWidget(QLabel("Medical Record Number:"), 4, 0)
         self.form_layout.addWidget(self.mrn_input, 4, 1, 1, 2)
-        
-        self.form_layout.addWidget(QLabel("Contact Information:"), 5, 0)
         self.form_layout.addWidget(self.contact_info_input, 5, 1, 1, 3)
-        
-        self.form_layout.addWidget(QLabel("Medical History:"), 6, 0)
         self.form_layout.addWidget(self.medical_history_input, 6, 1, 1, 3)
-        
-        self.form_layout.addWidget(QLabel("Risk Factors:"), 7, 0)
         self.form_layout.addWidget(self.risk_factors_input, 7, 1, 1, 3)
         
+        for text, row, column in self.FORM_LABELS:
+            self.form_layout.addWidget(QLabel(text), row, column)
+        
         # Form buttons
         form_buttons_layout = QHBoxLayout()
         
@@ -138,7 +223,7 @@ class PatientManagementWidget(QWidget):
         
         self.delete_button = QPushButton("Delete Patient")
         self.delete_button.clicked.connect(self.delete_patient)
-        self.delete_button.setStyleSheet("background-color: #d9534f; color: white;")
+        self.delete_button.setObjectName("DangerButton")  # styled by the main window stylesheet
         
         form_buttons_layout.addStretch()
         form_buttons_layout.addWidget(self.save_button)
@@ -148,6 +233,7 @@ class PatientManagementWidget(QWidget):
         self.form_layout.addLayout(form_buttons_layout, 8, 0, 1, 4)
         
         self.form_group.setLayout(self.form_layout)
+        self.form_group.setUpdatesEnabled(True)
         
         top_layout.addWidget(search_group)
         top_layout.addWidget(self.form_group)
@@ -160,14 +246,19 @@ class PatientManagementWidget(QWidget):
         list_group = QGroupBox("Patient List")
         list_layout = QVBoxLayout()
         
-        self.patient_table = QTableWidget()
-        self.patient_table.setColumnCount(6)
-        self.patient_table.setHorizontalHeaderLabels([
-            "Patient ID", "Name", "DOB", "Gender", "MRN", "Last Updated"
-        ])
-        self.patient_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.patient_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.patient_table.cellClicked.connect(self.on_patient_selected)
+        self.patient_model = PatientTableModel(self)
+        self.patient_table = QTableView()
+        self.patient_table.setModel(self.patient_model)
+        
+        # Explicit initial column widths the user can drag, instead of stretching on every relayout
+        header = self.patient_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate(PatientTableModel.COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
+        
+        self.patient_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.patient_table.clicked.connect(self.on_patient_selected)
         
         list_layout.addWidget(self.patient_table)
         list_group.setLayout(list_layout)
@@ -186,114 +277,129 @@ class PatientManagementWidget(QWidget):
         
     def load_patient_list(self, search_term=""):
         """Load patient list from database"""
-        try:
-            patients = self.db_manager.search_patients(search_term, limit=100)
+        if self.db_manager is None:
+            # Still opening; the worker's result is shown (or this search rerun) when it lands
+            self._pending_search = search_term
+            return
             
-            self.patient_table.setRowCount(len(patients))
+        if not self.isVisible():
+            # Nobody sees the table; refresh it when the tab is shown again
+            self._pending_refresh = search_term
+            return
             
-            for row, patient in enumerate(patients):
-                # Patient ID
-                self.patient_table.setItem(row, 0, QTableWidgetItem(patient['patient_id']))
-                
-                # Full name
-                name = f"{patient['first_name']} {patient['last_name']}"
-                self.patient_table.setItem(row, 1, QTableWidgetItem(name))
-                
-                # Date of birth
-                dob = patient.get('date_of_birth', '')
-                self.patient_table.setItem(row, 2, QTableWidgetItem(dob))
-                
-                # Gender
-                gender = patient.get('gender', '')
-                self.patient_table.setItem(row, 3, QTableWidgetItem(gender))
-                
-                # Medical Record Number
-                mrn = patient.get('medical_record_number', '')
-                self.patient_table.setItem(row, 4, QTableWidgetItem(mrn))
-                
-                # Last updated
-                updated = patient.get('updated_at', '')
-                self.patient_table.setItem(row, 5, QTableWidgetItem(updated))
-                
-            self.logger.info(f"Loaded {len(patients)} patients")
+        try:
+            patients = self._cached_search(search_term)
+            if patients is None:
+                patients = self.db_manager.search_patients(search_term, limit=100)
+                self._cache_search(search_term, patients)
+            self._populate_patient_table(patients)
             
         except Exception as e:
             self.logger.error(f"Failed to load patient list: {e}")
             QMessageBox.critical(self, "Database Error", f"Failed to load patient list: {str(e)}")
             
+    def _cached_search(self, search_term):
+        """Cached results of a search, or None when missing or expired; a hit becomes most recent"""
+        entry = self._search_cache.get(search_term)
+        if entry is None:
+            return None
+            
+        fetched_at, patients = entry
+        if time.monotonic() - fetched_at > _SEARCH_CACHE_TTL:
+            del self._search_cache[search_term]
+            return None
+            
+        self._search_cache.move_to_end(search_term)
+        return patients
+        
+    def _cache_search(self, search_term, patients):
+        """Remember search results, evicting the least recently used beyond the cache size"""
+        self._search_cache[search_term] = (time.monotonic(), patients)
+        self._search_cache.move_to_end(search_term)
+        while len(self._search_cache) > _SEARCH_CACHE_MAX:
+            self._search_cache.popitem(last=False)
+            
+    def _populate_patient_table(self, patients):
+        """Show search results in the patient table"""
+        # Row clicks read the listed patient from here instead of querying it again
+        self._patient_index = {patient['patient_id']: patient for patient in patients}
+        
+        # One model reset, painted once; cells are formatted on demand by the model
+        self.patient_table.setUpdatesEnabled(False)
+        try:
+            self.patient_model.set_patients(patients)
+            self.logger.info(f"Loaded {len(patients)} patients")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to populate patient list: {e}")
+        finally:
+            self.patient_table.setUpdatesEnabled(True)
+            
     def on_search_changed(self, text):
         """Handle search input changes"""
-        self.load_patient_list(text)
+        self._search_timer.start()
         
     def on_search_clicked(self):
         """Handle search button click"""
+        self._search_timer.stop()
         search_term = self.search_input.text().strip()
         self.load_patient_list(search_term)
         
-    def on_patient_selected(self, row, column):
+    def on_patient_selected(self, index):
         """Handle patient selection from table"""
         try:
-            patient_id_item = self.patient_table.item(row, 0)
-            if patient_id_item:
-                patient_id = patient_id_item.text()
-                self.load_patient_data(patient_id)
+            patient = self.patient_model.patient(index.row())
+            if patient:
+                self.load_patient_data(patient['patient_id'])
                 
         except Exception as e:
             self.logger.error(f"Failed to select patient: {e}")
             
     def load_patient_data(self, patient_id):
         """Load patient data into form"""
+        if self.db_manager is None:
+            return
+            
         try:
-            patient = self.db_manager.get_patient(patient_id)
+            patient = self._patient_index.get(patient_id)
+            if patient is None:
+                patient = self.db_manager.get_patient(patient_id)
             if patient:
                 self.current_patient_id = patient_id
                 
-                # Fill form fields
-                self.patient_id_input.setText(patient['patient_id'])
-                self.first_name_input.setText(patient['first_name'])
-                self.last_name_input.setText(patient['last_name'])
-                
-                # Date of birth
-                if patient['date_of_birth']:
-                    dob = QDate.fromString(patient['date_of_birth'], "yyyy-MM-dd")
-                    self.dob_input.setDate(dob)
-                else:
-                    self.dob_input.setDate(QDate.currentDate())
-                
-                # Gender
-                gender = patient.get('gender', '')
-                index = self.gender_input.findText(gender)
-                self.gender_input.setCurrentIndex(index if index >= 0 else 0)
-                
-                # Medical Record Number
-                self.mrn_input.setText(patient.get('medical_record_number', ''))
-                
-                # Contact information
-                contact_info = patient.get('contact_info', '{}')
-                if isinstance(contact_info, str):
-                    try:
-                        contact_info = json.loads(contact_info)
-                    except:
-                        contact_info = {}
-                self.contact_info_input.setText(json.dumps(contact_info, indent=2))
-                
-                # Medical history
-                medical_history = patient.get('medical_history', '{}')
-                if isinstance(medical_history, str):
-                    try:
-                        medical_history = json.loads(medical_history)
-                    except:
-                        medical_history = {}
-                self.medical_history_input.setText(json.dumps(medical_history, indent=2))
-                
-                # Risk factors
-                risk_factors = patient.get('risk_factors', '{}')
-                if isinstance(risk_factors, str):
-                    try:
-                        risk_factors = json.loads(risk_factors)
-                    except:
-                        risk_factors = {}
-                self.risk_factors_input.setText(json.dumps(risk_factors, indent=2))
+                # Fill form fields as one update: no per-field signals or repaints
+                with self._form_update():
+                    self.patient_id_input.setText(patient['patient_id'])
+                    self.first_name_input.setText(patient['first_name'])
+                    self.last_name_input.setText(patient['last_name'])
+                    
+                    # Date of birth
+                    if patient['date_of_birth']:
+                        self.dob_input.setDate(self._parse_dob(patient['date_of_birth']))
+                    else:
+                        self.dob_input.setDate(QDate.currentDate())
+                    
+                    # Gender
+                    gender = patient.get('gender', '')
+                    index = self.gender_input.findText(gender)
+                    self.gender_input.setCurrentIndex(index if index >= 0 else 0)
+                    
+                    # Medical Record Number
+                    self.mrn_input.setText(patient.get('medical_record_number', ''))
+                    
+                    formatted = self._fmt_cache.get(patient_id)
+                    if formatted is None:
+                        # Contact information, medical history and risk factors
+                        formatted = (self._format_json_field(patient.get('contact_info')),
+                                     self._format_json_field(patient.get('medical_history')),
+                                     self._format_json_field(patient.get('risk_factors')))
+                        self._fmt_cache[patient_id] = formatted
+                    
+                    # Only documents whose text changes are re-laid out
+                    for text_input, text in zip((self.contact_info_input, self.medical_history_input,
+                                                 self.risk_factors_input), formatted):
+                        if text_input.toPlainText() != text:
+                            text_input.setPlainText(text)
                 
                 # Enable buttons
                 self.save_button.setEnabled(True)
@@ -308,6 +414,18 @@ class PatientManagementWidget(QWidget):
             self.logger.error(f"Failed to load patient data: {e}")
             QMessageBox.critical(self, "Database Error", f"Failed to load patient data: {str(e)}")
             
+    @contextmanager
+    def _form_update(self):
+        """Block the form widgets' signals and repaints while fields are set in bulk"""
+        blockers = [QSignalBlocker(widget) for widget in self._form_inputs]
+        self.form_group.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.form_group.setUpdatesEnabled(True)
+            for blocker in blockers:
+                blocker.unblock()
+                
     def save_patient(self):
         """Save patient data"""
         try:
@@ -346,6 +464,9 @@ class PatientManagementWidget(QWidget):
                     action = "created"
             
             if success:
+                self._search_cache.clear()
+                self._fmt_cache.pop(self.current_patient_id, None)
+                self._patient_index.clear()
                 QMessageBox.information(self, "Success", f"Patient {action} successfully.")
                 self.load_patient_list()
                 self.clear_form()
@@ -369,6 +490,9 @@ class PatientManagementWidget(QWidget):
             try:
                 success = self.db_manager.delete_patient(self.current_patient_id)
                 if success:
+                    self._search_cache.clear()
+                    self._fmt_cache.pop(self.current_patient_id, None)
+                    self._patient_index.clear()
                     QMessageBox.information(self, "Success", "Patient deleted successfully.")
                     self.load_patient_list()
                     self.clear_form()
@@ -382,42 +506,179 @@ class PatientManagementWidget(QWidget):
     def clear_form(self):
         """Clear form fields"""
         self.current_patient_id = None
-        self.patient_id_input.clear()
-        self.first_name_input.clear()
-        self.last_name_input.clear()
-        self.dob_input.setDate(QDate.currentDate())
-        self.gender_input.setCurrentIndex(0)
-        self.mrn_input.clear()
-        self.contact_info_input.clear()
-        self.medical_history_input.clear()
-        self.risk_factors_input.clear()
+        
+        # Reset every field with their change signals blocked
+        with self._form_update():
+            self.patient_id_input.clear()
+            self.first_name_input.clear()
+            self.last_name_input.clear()
+            self.dob_input.setDate(QDate.currentDate())
+            self.gender_input.setCurrentIndex(0)
+            self.mrn_input.clear()
+            self.contact_info_input.clear()
+            self.medical_history_input.clear()
+            self.risk_factors_input.clear()
         
         self.save_button.setEnabled(False)
         self.delete_button.setEnabled(False)
         
+    @staticmethod
+    def _parse_dob(dob_str):
+        """Build a QDate from a stored yyyy-MM-dd string without Qt's format parser"""
+        try:
+            year, month, day = dob_str.split('-')
+            return QDate(int(year), int(month), int(day))
+        except (AttributeError, ValueError):
+            # Anything not in the stored format goes through Qt's parser as before
+            return QDate.fromString(str(dob_str), "yyyy-MM-dd")
+            
+    @staticmethod
+    def _format_json_field(raw):
+        """Pretty-print a stored JSON field; text that is not valid JSON is shown as-is"""
+        if raw in (None, '', '{}', {}):
+            return '{}'
+            
+        if isinstance(raw, str):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            try:
+                raw = _json_loads(raw)
+            except json.JSONDecodeError:
+                return raw
+                
+        return _json_dumps(raw)
+        
     def _parse_json_field(self, text):
         """Parse JSON field with fallback to string"""
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             return {}
             
+        # Text that cannot start a JSON value skips the parser and its exception path
+        if stripped[0] not in _JSON_START_CHARS:
+            return {"text": text}
+            
         try:
-            return json.loads(text)
+            return _json_loads(stripped)
         except json.JSONDecodeError:
             # If not valid JSON, return as string in a dict
             return {"text": text}
             
     def open_new_patient_dialog(self):
         """Open dialog for creating a new patient"""
-        dialog = NewPatientDialog(self)
+        if self.db_manager is None:
+            QMessageBox.information(self, "Please Wait", "The patient database is still loading.")
+            return
+            
+        dialog = self._new_patient_dialog
+        if dialog is None:
+            dialog = self._new_patient_dialog = NewPatientDialog(self)
+        else:
+            dialog.reset()
+            
         if dialog.exec():
             patient_data = dialog.get_patient_data()
             if patient_data:
                 patient_id = self.db_manager.add_patient(patient_data)
                 if patient_id:
+                    self._search_cache.clear()
                     self.load_patient_list()
                     self.logger.info(f"New patient created: {patient_data['patient_id']}")
 
 
+class PatientTableModel(QAbstractTableModel):
+    """Table model exposing patient search results as list rows"""
+    
+    HEADERS = ["Patient ID", "Name", "DOB", "Gender", "MRN", "Last Updated"]
+    COLUMN_WIDTHS = [120, 200, 110, 80, 140, 160]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._patients = []
+        self._placeholder = None  # text of a single inert row shown instead of patients
+        
+    def set_patients(self, patients):
+        """Replace the rows in one model reset"""
+        self.beginResetModel()
+        self._patients = list(patients)
+        self._placeholder = None
+        self.endResetModel()
+        
+    def set_placeholder(self, text):
+        """Show a single inert row (e.g. while loading) in place of the patients"""
+        self.beginResetModel()
+        self._patients = []
+        self._placeholder = text
+        self.endResetModel()
+        
+    def patient(self, row):
+        """Patient shown on a row, or None when out of range"""
+        if 0 <= row < len(self._patients):
+            return self._patients[row]
+        return None
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._placeholder is not None else len(self._patients)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def flags(self, index):
+        if self._placeholder is not None:
+            return Qt.ItemFlag.NoItemFlags
+        return super().flags(index)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+            
+        if self._placeholder is not None:
+            return self._placeholder if index.column() == 0 else None
+            
+        patient = self._patients[index.row()]
+        column = index.column()
+        if column == 0:
+            return patient['patient_id']
+        if column == 1:
+            return f"{patient['first_name']} {patient['last_name']}"
+        if column == 2:
+            return patient.get('date_of_birth', '')
+        if column == 3:
+            return patient.get('gender', '')
+        if column == 4:
+            return patient.get('medical_record_number', '')
+        return patient.get('updated_at', '')
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class PatientWorkerSignals(QObject):
+    """Signals emitted by PatientWorker (QRunnable cannot define signals itself)"""
+    finished = pyqtSignal(object, object)
+    error = pyqtSignal(object, str)
+
+
+class PatientWorker(QRunnable):
+    """Thread pool task running one database call off the GUI thread"""
+    
+    def __init__(self, fetch):
+        super().__init__()
+        self.fetch = fetch
+        self.signals = PatientWorkerSignals()
+        
+    def run(self):
+        """Run the call in background"""
+        try:
+            data = self.fetch()
+            self.signals.finished.emit(self, data)
+        except Exception as e:
+            self.signals.error.emit(self, str(e))
+
+
 class NewPatientDialog(QDialog):
     """Dialog for creating new patients"""
     
@@ -463,6 +724,15 @@ class NewPatientDialog(QDialog):
         
         layout.addWidget(buttons)
         
+    def reset(self):
+        """Clear the fields so the dialog can be shown again"""
+        self.first_name_input.clear()
+        self.last_name_input.clear()
+        self.dob_input.setDate(QDate.currentDate())
+        self.gender_input.setCurrentIndex(0)
+        self.mrn_input.clear()
+        self.first_name_input.setFocus()
+        
     def get_patient_data(self):
         """Get patient data from form"""
         if not self.first_name_input.text().strip() or not self.last_name_input.text().strip():